@@ -1,30 +1,166 @@
 """Flask API server for Smart Heating."""
+from collections.abc import Callable
+from datetime import datetime
+from functools import lru_cache
+import hashlib
 import logging
+import mimetypes
+import os
+import re
 from typing import Any
+import uuid
 
 from aiohttp import web
-import aiohttp_cors
 import aiofiles
+import orjson
 
 from homeassistant.components.http import HomeAssistantView
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er, area_registry as ar, device_registry as dr
 
-from .const import DOMAIN
-from .area_manager import AreaManager, Area
+from .const import DOMAIN, HISTORY_RECORD_INTERVAL_SECONDS
+from .area_manager import AreaManager, Area, Schedule, validate_schedule_time
 
 _LOGGER = logging.getLogger(__name__)
 
+API_BASE_URL = "/api/smart_heating"
 
-class SmartHeatingAPIView(HomeAssistantView):
-    """API view for Smart Heating."""
+# API routes as (method, path below API_BASE_URL, handler name, needs body).
+# aiohttp's router matches them; path parameters are passed to the handler
+# as keyword arguments and parsed JSON bodies as the "data" argument.
+_API_ROUTES = (
+    ("get", "/areas", "get_areas", False),
+    ("get", "/areas/{area_id}", "get_area", False),
+    ("get", "/areas/{area_id}/history", "get_history", False),
+    ("get", "/areas/{area_id}/learning", "get_learning_stats", False),
+    ("get", "/areas/{area_id}/logs", "get_area_logs", False),
+    ("post", "/areas/{area_id}/enable", "enable_area", False),
+    ("post", "/areas/{area_id}/disable", "disable_area", False),
+    ("post", "/areas/{area_id}/hide", "hide_area", False),
+    ("post", "/areas/{area_id}/unhide", "unhide_area", False),
+    ("post", "/areas/{area_id}/cancel_boost", "cancel_boost", False),
+    ("post", "/areas/{area_id}/devices", "add_device", True),
+    ("delete", "/areas/{area_id}/devices/{device_id}", "remove_device", False),
+    ("post", "/areas/{area_id}/schedules", "add_schedule", True),
+    ("delete", "/areas/{area_id}/schedules/{schedule_id}", "remove_schedule", False),
+    ("post", "/areas/{area_id}/temperature", "set_temperature", True),
+    ("post", "/areas/{area_id}/preset_mode", "set_preset_mode", True),
+    ("post", "/areas/{area_id}/boost", "set_boost_mode", True),
+    ("post", "/areas/{area_id}/window_sensors", "add_window_sensor", True),
+    ("delete", "/areas/{area_id}/window_sensors/{entity_id:.+}", "remove_window_sensor", False),
+    ("post", "/areas/{area_id}/presence_sensors", "add_presence_sensor", True),
+    ("delete", "/areas/{area_id}/presence_sensors/{entity_id:.+}", "remove_presence_sensor", False),
+    ("post", "/areas/{area_id}/hvac_mode", "set_hvac_mode", True),
+    ("post", "/areas/{area_id}/switch_shutdown", "set_switch_shutdown", True),
+    ("post", "/areas/{area_id}/preset_config", "set_area_preset_config", True),
+    ("post", "/areas/{area_id}/manual_override", "set_manual_override", True),
+    ("get", "/devices", "get_devices", False),
+    ("get", "/devices/refresh", "refresh_devices", False),
+    ("get", "/status", "get_status", False),
+    ("get", "/config", "get_config", False),
+    ("get", "/history/config", "get_history_config", False),
+    ("post", "/history/config", "set_history_config", True),
+    ("get", "/entities/binary_sensor", "get_binary_sensor_entities", False),
+    ("get", "/entity_state/{entity_id:.+}", "get_entity_state", False),
+    ("get", "/global_presets", "get_global_presets", False),
+    ("post", "/global_presets", "set_global_presets", True),
+    ("get", "/global_presence", "get_global_presence", False),
+    ("post", "/global_presence", "set_global_presence", True),
+    ("post", "/frost_protection", "set_frost_protection", True),
+    ("post", "/call_service", "call_service", True),
+)
+
+# Frontend build directories whose file names carry a content hash
+_HASHED_ASSET_DIRS = ("assets/", "chunks/")
+
+# Device classification hints
+_TEMP_UNITS = ("°C", "°F")
+_SWITCH_KEYWORDS_RE = re.compile("thermostat|heater|radiator|heating|pump|floor|relay")
+# Entity domains that can be heating devices
+_HEATING_DOMAINS = frozenset(("climate", "switch", "number", "sensor"))
+
+# Pre-serialized bodies for fixed error responses
+_ERR_DEVICE_REQUIRED = orjson.dumps({"error": "device_id and device_type are required"})
+_ERR_TEMPERATURE_OR_PRESET_REQUIRED = orjson.dumps({"error": "Either temperature or preset_mode is required"})
+_ERR_ENABLED_REQUIRED = orjson.dumps({"error": "enabled field is required"})
+_ERR_ENTITY_ID_REQUIRED = orjson.dumps({"error": "entity_id required"})
+_ERR_HISTORY_NOT_AVAILABLE = orjson.dumps({"error": "History not available"})
+_ERR_HVAC_MODE_REQUIRED = orjson.dumps({"error": "hvac_mode required"})
+_ERR_LEARNING_ENGINE_NOT_AVAILABLE = orjson.dumps({"error": "Learning engine not available"})
+_ERR_TIME_REQUIRED = orjson.dumps({"error": "Missing required field: time or start_time"})
+_ERR_PRESET_MODE_REQUIRED = orjson.dumps({"error": "preset_mode required"})
+_ERR_RETENTION_DAYS_REQUIRED = orjson.dumps({"error": "retention_days required"})
+_ERR_SERVICE_NAME_REQUIRED = orjson.dumps({"error": "Service name required"})
+_ERR_TEMPERATURE_REQUIRED = orjson.dumps({"error": "temperature is required"})
+_ERR_UNKNOWN_ENDPOINT = orjson.dumps({"error": "Unknown endpoint"})
+
+
+def _json_response(data: Any, status: int = 200) -> web.Response:
+    """Build a JSON response serialized with orjson.
+    
+    Args:
+        data: JSON-serializable payload
+        status: HTTP status code
+        
+    Returns:
+        JSON response
+    """
+    return web.Response(
+        body=orjson.dumps(data), status=status, content_type="application/json"
+    )
+
+
+def _error_response(body: bytes, status: int) -> web.Response:
+    """Build an error response from a pre-serialized JSON body.
+    
+    Args:
+        body: Serialized error payload
+        status: HTTP status code
+        
+    Returns:
+        JSON response
+    """
+    return web.Response(body=body, status=status, content_type="application/json")
+
+
+@lru_cache(maxsize=64)
+def _guess_content_type(suffix: str) -> str:
+    """Guess a static file's content type from its suffix.
+    
+    Args:
+        suffix: File extension including the dot
+        
+    Returns:
+        MIME type, or application/octet-stream if unknown
+    """
+    return mimetypes.guess_type("file" + suffix)[0] or "application/octet-stream"
+
+
+class SmartHeatingRouteView(HomeAssistantView):
+    """View serving a single Smart Heating API route."""
 
-    url = "/api/smart_heating/{endpoint:.*}"
-    name = "api:smart_heating"
     requires_auth = False
 
+    def __init__(self, url: str, name: str, handlers: dict[str, Callable]) -> None:
+        """Initialize the route view.
+        
+        Args:
+            url: Route URL, possibly with path parameters
+            name: Unique route name
+            handlers: Request handlers keyed by HTTP method (get, post, delete)
+        """
+        self.url = url
+        self.name = name
+        for method, handler in handlers.items():
+            setattr(self, method, handler)
+
+
+class SmartHeatingAPIView:
+    """Request handlers for the Smart Heating API."""
+
     def __init__(self, hass: HomeAssistant, area_manager: AreaManager) -> None:
-        """Initialize the API view.
+        """Initialize the API handlers.
         
         Args:
             hass: Home Assistant instance
@@ -32,191 +168,128 @@ class SmartHeatingAPIView(HomeAssistantView):
         """
         self.hass = hass
         self.area_manager = area_manager
+        
+        # Registries are long-lived singletons, look them up once
+        self._area_registry = ar.async_get(hass)
+        self._device_registry = dr.async_get(hass)
+        self._entity_registry = er.async_get(hass)
+        
+        # Serialized get_areas response, valid while the coordinator still
+        # holds the data snapshot it was built from
+        self._areas_cache: bytes | None = None
+        self._areas_cache_data: dict | None = None
+        # Serialized per-area fragments of that response with the inputs they
+        # were built from, so unchanged areas are not serialized again
+        self._area_fragments: dict[str, tuple[tuple, bytes]] = {}
+        # Serialized get_status response, valid for the same coordinator snapshot
+        self._status_cache: bytes | None = None
+        self._status_cache_data: dict | None = None
+        # Device discovery results, additionally keyed on the number of states
+        # so entities that come up after the scan are picked up
+        self._devices_cache: list[tuple] | None = None
+        self._devices_cache_data: dict | None = None
+        self._devices_cache_states = 0
+        # Registry entries in heating domains, rebuilt on entity registry changes
+        self._heating_entities: list[er.RegistryEntry] | None = None
+        # Released by async_unload when the config entry is unloaded
+        self._unsub_listeners = [
+            hass.bus.async_listen(event_type, self._async_invalidate_caches)
+            for event_type in (
+                ar.EVENT_AREA_REGISTRY_UPDATED,
+                dr.EVENT_DEVICE_REGISTRY_UPDATED,
+                er.EVENT_ENTITY_REGISTRY_UPDATED,
+            )
+        ]
+
+    @callback
+    def async_unload(self) -> None:
+        """Stop listening for registry updates."""
+        for unsub in self._unsub_listeners:
+            unsub()
+        self._unsub_listeners = []
 
-    async def get(self, request: web.Request, endpoint: str) -> web.Response:
-        """Handle GET requests.
+    def build_views(self) -> list[SmartHeatingRouteView]:
+        """Build one view per API route.
         
-        Args:
-            request: Request object
-            endpoint: API endpoint
-            
         Returns:
-            JSON response
+            Route views, ending with a catch-all for unknown endpoints
         """
-        try:
-            if endpoint == "areas":
-                return await self.get_areas(request)
-            elif endpoint == "devices":
-                return await self.get_devices(request)
-            elif endpoint == "devices/refresh":
-                return await self.refresh_devices(request)
-            elif endpoint == "status":
-                return await self.get_status(request)
-            elif endpoint == "config":
-                return await self.get_config(request)
-            elif endpoint == "history/config":
-                return await self.get_history_config(request)
-            elif endpoint == "entities/binary_sensor":
-                return await self.get_binary_sensor_entities(request)
-            elif endpoint.startswith("entity_state/"):
-                entity_id = endpoint.replace("entity_state/", "")
-                return await self.get_entity_state(request, entity_id)
-            elif endpoint.startswith("areas/") and "/history" in endpoint:
-                area_id = endpoint.split("/")[1]
-                return await self.get_history(request, area_id)
-            elif endpoint.startswith("areas/") and "/learning" in endpoint:
-                area_id = endpoint.split("/")[1]
-                return await self.get_learning_stats(request, area_id)
-            elif endpoint.startswith("areas/") and "/logs" in endpoint:
-                area_id = endpoint.split("/")[1]
-                return await self.get_area_logs(request, area_id)
-            elif endpoint == "global_presets":
-                return await self.get_global_presets(request)
-            elif endpoint == "global_presence":
-                return await self.get_global_presence(request)
-            elif endpoint.startswith("areas/"):
-                area_id = endpoint.split("/")[1]
-                return await self.get_area(request, area_id)
-            else:
-                return web.json_response(
-                    {"error": "Unknown endpoint"}, status=404
-                )
-        except Exception as err:
-            _LOGGER.error("Error handling GET %s: %s", endpoint, err)
-            return web.json_response(
-                {"error": str(err)}, status=500
+        handlers: dict[str, dict[str, Callable]] = {}
+        for method, path, handler_name, needs_body in _API_ROUTES:
+            handlers.setdefault(path, {})[method] = self._route_handler(
+                method, getattr(self, handler_name), needs_body
+            )
+        
+        views = [
+            SmartHeatingRouteView(
+                API_BASE_URL + path,
+                # Route names may only contain identifiers separated by colons
+                "api:smart_heating:" + re.sub(r"\W+", ":", path).strip(":"),
+                methods,
+            )
+            for path, methods in handlers.items()
+        ]
+        views.append(
+            SmartHeatingRouteView(
+                API_BASE_URL + "/{endpoint:.*}",
+                "api:smart_heating",
+                dict.fromkeys(("get", "post", "delete"), self.unknown_endpoint),
             )
+        )
+        return views
 
-    async def post(self, request: web.Request, endpoint: str) -> web.Response:
-        """Handle POST requests.
+    def _route_handler(
+        self, method: str, handler: Callable, needs_body: bool
+    ) -> Callable:
+        """Wrap an API handler with body parsing and error handling.
         
         Args:
-            request: Request object
-            endpoint: API endpoint
+            method: HTTP method the handler serves
+            handler: API handler
+            needs_body: Whether the handler takes the parsed JSON body
             
         Returns:
-            JSON response
+            Request handler for a route view
         """
-        try:
-            _LOGGER.debug("POST request to endpoint: %s", endpoint)
-            
-            # Handle endpoints that don't require a body first
-            if endpoint.startswith("areas/") and endpoint.endswith("/enable"):
-                area_id = endpoint.split("/")[1]
-                return await self.enable_area(request, area_id)
-            elif endpoint.startswith("areas/") and endpoint.endswith("/disable"):
-                area_id = endpoint.split("/")[1]
-                return await self.disable_area(request, area_id)
-            elif endpoint.startswith("areas/") and endpoint.endswith("/hide"):
-                area_id = endpoint.split("/")[1]
-                return await self.hide_area(request, area_id)
-            elif endpoint.startswith("areas/") and endpoint.endswith("/unhide"):
-                area_id = endpoint.split("/")[1]
-                return await self.unhide_area(request, area_id)
-            elif endpoint.startswith("areas/") and endpoint.endswith("/cancel_boost"):
-                area_id = endpoint.split("/")[1]
-                return await self.cancel_boost(request, area_id)
-            
-            # Parse JSON for endpoints that need it
-            data = await request.json()
-            _LOGGER.debug("POST data: %s", data)
-            
-            if endpoint.startswith("areas/") and endpoint.endswith("/devices"):
-                area_id = endpoint.split("/")[1]
-                return await self.add_device(request, area_id, data)
-            elif endpoint.startswith("areas/") and endpoint.endswith("/schedules"):
-                area_id = endpoint.split("/")[1]
-                return await self.add_schedule(request, area_id, data)
-            elif endpoint.startswith("areas/") and endpoint.endswith("/temperature"):
-                area_id = endpoint.split("/")[1]
-                return await self.set_temperature(request, area_id, data)
-            elif endpoint.startswith("areas/") and endpoint.endswith("/preset_mode"):
-                area_id = endpoint.split("/")[1]
-                return await self.set_preset_mode(request, area_id, data)
-            elif endpoint.startswith("areas/") and endpoint.endswith("/boost"):
-                area_id = endpoint.split("/")[1]
-                return await self.set_boost_mode(request, area_id, data)
-            elif endpoint.startswith("areas/") and endpoint.endswith("/boost"):
-                area_id = endpoint.split("/")[1]
-                return await self.set_boost_mode(request, area_id, data)
-            elif endpoint.startswith("areas/") and endpoint.endswith("/window_sensors"):
-                area_id = endpoint.split("/")[1]
-                return await self.add_window_sensor(request, area_id, data)
-            elif endpoint.startswith("areas/") and endpoint.endswith("/presence_sensors"):
-                area_id = endpoint.split("/")[1]
-                return await self.add_presence_sensor(request, area_id, data)
-            elif endpoint.startswith("areas/") and endpoint.endswith("/hvac_mode"):
-                area_id = endpoint.split("/")[1]
-                return await self.set_hvac_mode(request, area_id, data)
-            elif endpoint.startswith("areas/") and endpoint.endswith("/switch_shutdown"):
-                area_id = endpoint.split("/")[1]
-                return await self.set_switch_shutdown(request, area_id, data)
-            elif endpoint == "frost_protection":
-                return await self.set_frost_protection(request, data)
-            elif endpoint == "history/config":
-                return await self.set_history_config(request, data)
-            elif endpoint == "global_presets":
-                return await self.set_global_presets(request, data)
-            elif endpoint == "global_presence":
-                return await self.set_global_presence(request, data)
-            elif endpoint.startswith("areas/") and endpoint.endswith("/preset_config"):
-                area_id = endpoint.split("/")[1]
-                return await self.set_area_preset_config(request, area_id, data)
-            elif endpoint.startswith("areas/") and endpoint.endswith("/manual_override"):
-                area_id = endpoint.split("/")[1]
-                return await self.set_manual_override(request, area_id, data)
-            elif endpoint == "call_service":
-                return await self.call_service(request, data)
-            else:
-                return web.json_response(
-                    {"error": "Unknown endpoint"}, status=404
+        async def handle(request: web.Request, **params: str) -> web.Response:
+            try:
+                if needs_body:
+                    # Parse JSON for endpoints that need it
+                    body = await request.read()
+                    data = orjson.loads(body) if body else {}
+                    _LOGGER.debug("%s data: %s", method.upper(), data)
+                    response = await handler(request, data=data, **params)
+                else:
+                    response = await handler(request, **params)
+                
+                if method != "get":
+                    self._async_invalidate_caches()
+                return response
+            except ValueError as err:
+                # Client errors (bad values, malformed JSON) are expected,
+                # answer them without logging
+                return _json_response({"error": str(err)}, status=400)
+            except KeyError as err:
+                return _json_response({"error": f"Missing field: {err}"}, status=400)
+            except Exception as err:
+                _LOGGER.exception("Error handling %s %s", method.upper(), request.path)
+                return _json_response(
+                    {"error": str(err)}, status=500
                 )
-        except Exception as err:
-            _LOGGER.error("Error handling POST %s: %s", endpoint, err)
-            return web.json_response(
-                {"error": str(err)}, status=500
-            )
+        
+        return handle
 
-    async def delete(self, request: web.Request, endpoint: str) -> web.Response:
-        """Handle DELETE requests.
+    async def unknown_endpoint(self, request: web.Request, endpoint: str) -> web.Response:
+        """Answer requests for endpoints that do not exist.
         
         Args:
             request: Request object
             endpoint: API endpoint
             
         Returns:
-            JSON response
+            JSON 404 response
         """
-        try:
-            if endpoint.startswith("areas/") and "/devices/" in endpoint:
-                parts = endpoint.split("/")
-                area_id = parts[1]
-                device_id = parts[3]
-                return await self.remove_device(request, area_id, device_id)
-            elif endpoint.startswith("areas/") and "/schedules/" in endpoint:
-                parts = endpoint.split("/")
-                area_id = parts[1]
-                schedule_id = parts[3]
-                return await self.remove_schedule(request, area_id, schedule_id)
-            elif endpoint.startswith("areas/") and "/window_sensors/" in endpoint:
-                parts = endpoint.split("/")
-                area_id = parts[1]
-                entity_id = "/".join(parts[3:])  # Reconstruct entity_id
-                return await self.remove_window_sensor(request, area_id, entity_id)
-            elif endpoint.startswith("areas/") and "/presence_sensors/" in endpoint:
-                parts = endpoint.split("/")
-                area_id = parts[1]
-                entity_id = "/".join(parts[3:])  # Reconstruct entity_id
-                return await self.remove_presence_sensor(request, area_id, entity_id)
-            else:
-                return web.json_response(
-                    {"error": "Unknown endpoint"}, status=404
-                )
-        except Exception as err:
-            _LOGGER.error("Error handling DELETE %s: %s", endpoint, err)
-            return web.json_response(
-                {"error": str(err)}, status=500
-            )
+        return _error_response(_ERR_UNKNOWN_ENDPOINT, status=404)
 
     async def get_areas(self, request: web.Request) -> web.Response:
         """Get all Home Assistant areas.
@@ -227,10 +300,17 @@ class SmartHeatingAPIView(HomeAssistantView):
         Returns:
             JSON response with HA areas
         """
+        coordinator_data = self._get_coordinator_data()
+        if self._areas_cache is not None and self._areas_cache_data is coordinator_data:
+            return web.Response(body=self._areas_cache, content_type="application/json")
+        
         # Get Home Assistant's area registry
-        area_registry = ar.async_get(self.hass)
+        area_registry = self._area_registry
+        now = datetime.now()
+        coordinator_areas = (coordinator_data or {}).get("areas", {})
         
-        areas_data = []
+        old_fragments = self._area_fragments
+        fragments = {}
         for area in area_registry.areas.values():
             area_id = area.id
             area_name = area.name
@@ -239,97 +319,35 @@ class SmartHeatingAPIView(HomeAssistantView):
             stored_area = self.area_manager.get_area(area_id)
             
             if stored_area:
-                # Use stored data
-                devices_list = []
-                
-                # Get coordinator data for device states
-                # The coordinator is stored under the entry_id, find it
-                coordinator = None
-                for key, value in self.hass.data[DOMAIN].items():
-                    if hasattr(value, 'data') and hasattr(value, 'async_request_refresh'):
-                        coordinator = value
-                        break
-                
-                coordinator_devices = {}
-                if coordinator and coordinator.data and "areas" in coordinator.data:
-                    area_data = coordinator.data["areas"].get(area_id, {})
-                    for device in area_data.get("devices", []):
-                        coordinator_devices[device["id"]] = device
-                
-                for dev_id, dev_data in stored_area.devices.items():
-                    device_info = {
-                        "id": dev_id,
-                        "type": dev_data["type"],
-                        "mqtt_topic": dev_data.get("mqtt_topic"),
-                    }
-                    # Get friendly name from entity state
-                    state = self.hass.states.get(dev_id)
-                    if state:
-                        device_info["name"] = state.attributes.get("friendly_name", dev_id)
-                    
-                    # Add coordinator data if available
-                    if dev_id in coordinator_devices:
-                        coord_device = coordinator_devices[dev_id]
-                        device_info["state"] = coord_device.get("state")
-                        device_info["current_temperature"] = coord_device.get("current_temperature")
-                        device_info["target_temperature"] = coord_device.get("target_temperature")
-                        device_info["hvac_action"] = coord_device.get("hvac_action")
-                        device_info["temperature"] = coord_device.get("temperature")
-                        device_info["position"] = coord_device.get("position")
-                    
-                    devices_list.append(device_info)
-                
-                areas_data.append({
-                    "id": area_id,
-                    "name": area_name,
-                    "enabled": stored_area.enabled,
-                    "hidden": stored_area.hidden,
-                    "state": stored_area.state,
-                    "target_temperature": stored_area.target_temperature,
-                    "effective_target_temperature": stored_area.get_effective_target_temperature(),
-                    "current_temperature": stored_area.current_temperature,
-                    "devices": devices_list,
-                    "schedules": [s.to_dict() for s in stored_area.schedules.values()],
-                    # Night boost
-                    "night_boost_enabled": stored_area.night_boost_enabled,
-                    "night_boost_offset": stored_area.night_boost_offset,
-                    "night_boost_start_time": stored_area.night_boost_start_time,
-                    "night_boost_end_time": stored_area.night_boost_end_time,
-                    # Smart night boost
-                    "smart_night_boost_enabled": stored_area.smart_night_boost_enabled,
-                    "smart_night_boost_target_time": stored_area.smart_night_boost_target_time,
-                    "weather_entity_id": stored_area.weather_entity_id,
-                    # Preset modes
-                    "preset_mode": stored_area.preset_mode,
-                    "away_temp": stored_area.away_temp,
-                    "eco_temp": stored_area.eco_temp,
-                    "comfort_temp": stored_area.comfort_temp,
-                    "home_temp": stored_area.home_temp,
-                    "sleep_temp": stored_area.sleep_temp,
-                    "activity_temp": stored_area.activity_temp,
-                    # Global preset flags
-                    "use_global_away": stored_area.use_global_away,
-                    "use_global_eco": stored_area.use_global_eco,
-                    "use_global_comfort": stored_area.use_global_comfort,
-                    "use_global_home": stored_area.use_global_home,
-                    "use_global_sleep": stored_area.use_global_sleep,
-                    "use_global_activity": stored_area.use_global_activity,
-                    # Boost mode
-                    "boost_mode_active": stored_area.boost_mode_active,
-                    "boost_temp": stored_area.boost_temp,
-                    "boost_duration": stored_area.boost_duration,
-                    # HVAC mode
-                    "hvac_mode": stored_area.hvac_mode,
-                    # Manual override
-                    "manual_override": getattr(stored_area, 'manual_override', False),
-                    # Sensors
-                    "window_sensors": stored_area.window_sensors,
-                    "presence_sensors": stored_area.presence_sensors,
-                    "use_global_presence": stored_area.use_global_presence,
-                })
+                # Stored settings, devices and schedules are cached dicts that
+                # are replaced on change, and the coordinator reuses unchanged
+                # area entries, so this key mostly compares by identity
+                coordinator_area = coordinator_areas.get(area_id)
+                effective_target = stored_area.get_effective_target_temperature(now)
+                key = (
+                    area_name,
+                    stored_area.to_dict(),
+                    stored_area.to_api_dict(),
+                    coordinator_area,
+                    stored_area.state,
+                    stored_area.current_temperature,
+                    effective_target,
+                )
             else:
-                # Default data for HA area without stored settings
-                areas_data.append({
+                coordinator_area = None
+                effective_target = None
+                key = (area_name,)
+            
+            cached = old_fragments.get(area_id)
+            if cached is not None and cached[0] == key:
+                fragments[area_id] = cached
+                continue
+            
+            area_data = (
+                self._build_area_data(stored_area, area_name, coordinator_area, effective_target)
+                if stored_area
+                else {
+                    # Default data for HA area without stored settings
                     "id": area_id,
                     "name": area_name,
                     "enabled": True,
@@ -340,9 +358,115 @@ class SmartHeatingAPIView(HomeAssistantView):
                     "devices": [],
                     "schedules": [],
                     "manual_override": False,
-                })
+                }
+            )
+            fragments[area_id] = (key, orjson.dumps(area_data))
         
-        return web.json_response({"areas": areas_data})
+        self._area_fragments = fragments
+        self._areas_cache = (
+            b'{"areas":[' + b",".join(fragment for _, fragment in fragments.values()) + b"]}"
+        )
+        self._areas_cache_data = coordinator_data
+        return web.Response(body=self._areas_cache, content_type="application/json")
+
+    def _build_area_data(
+        self,
+        stored_area: Area,
+        area_name: str,
+        coordinator_area: dict | None,
+        effective_target: float | None,
+    ) -> dict[str, Any]:
+        """Build the get_areas entry of an area with stored settings.
+        
+        Args:
+            stored_area: Area instance
+            area_name: Name of the Home Assistant area
+            coordinator_area: The area's coordinator data, if available
+            effective_target: Effective target temperature of the area
+            
+        Returns:
+            Area data with device details
+        """
+        coordinator_devices = {}
+        if coordinator_area:
+            for device in coordinator_area.get("devices", []):
+                coordinator_devices[device["id"]] = device
+        
+        devices_list = []
+        for dev_id, dev_data in stored_area.devices.items():
+            device_info = {
+                "id": dev_id,
+                "type": dev_data["type"],
+                "mqtt_topic": dev_data.get("mqtt_topic"),
+            }
+            # Get friendly name from entity state
+            state = self.hass.states.get(dev_id)
+            if state:
+                device_info["name"] = state.attributes.get("friendly_name", dev_id)
+            
+            # Add coordinator data if available
+            if dev_id in coordinator_devices:
+                coord_device = coordinator_devices[dev_id]
+                device_info["state"] = coord_device.get("state")
+                device_info["current_temperature"] = coord_device.get("current_temperature")
+                device_info["target_temperature"] = coord_device.get("target_temperature")
+                device_info["hvac_action"] = coord_device.get("hvac_action")
+                device_info["temperature"] = coord_device.get("temperature")
+                device_info["position"] = coord_device.get("position")
+            
+            devices_list.append(device_info)
+        
+        return {
+            **stored_area.to_api_dict(),
+            "name": area_name,
+            "state": stored_area.state,
+            "effective_target_temperature": effective_target,
+            "current_temperature": stored_area.current_temperature,
+            "devices": devices_list,
+            "schedules": [s.to_dict() for s in stored_area.schedules.values()],
+        }
+
+    def _get_coordinator_data(self) -> dict | None:
+        """Get the coordinator's current data snapshot.
+        
+        Returns:
+            Coordinator data, or None if no coordinator is set up
+        """
+        # The coordinator is stored under the entry_id, find it
+        for value in self.hass.data[DOMAIN].values():
+            if hasattr(value, 'data') and hasattr(value, 'async_request_refresh'):
+                return value.data
+        return None
+
+    @callback
+    def _async_invalidate_caches(self, event: Event | None = None) -> None:
+        """Drop the cached get_areas response and device discovery.
+        
+        Args:
+            event: Registry update event, if triggered by one
+        """
+        self._areas_cache = None
+        self._areas_cache_data = None
+        self._status_cache = None
+        self._devices_cache = None
+        if event is not None and event.event_type == er.EVENT_ENTITY_REGISTRY_UPDATED:
+            self._heating_entities = None
+
+    def _get_heating_entities(self) -> list[er.RegistryEntry]:
+        """Get the registry entries that can be heating devices.
+        
+        Filtering the full entity registry by domain is done once and reused
+        until the registry changes.
+        
+        Returns:
+            Entity registry entries in heating domains
+        """
+        if self._heating_entities is None:
+            self._heating_entities = [
+                entity for entity in self._entity_registry.entities.values()
+                if entity.domain in _HEATING_DOMAINS
+            ]
+        return self._heating_entities
 
     async def get_area(self, request: web.Request, area_id: str) -> web.Response:
         """Get a specific area.
@@ -357,7 +481,7 @@ class SmartHeatingAPIView(HomeAssistantView):
         area = self.area_manager.get_area(area_id)
         
         if area is None:
-            return web.json_response(
+            return _json_response(
                 {"error": f"Zone {area_id} not found"}, status=404
             )
         
@@ -375,54 +499,15 @@ class SmartHeatingAPIView(HomeAssistantView):
             devices_list.append(device_info)
         
         area_data = {
-            "id": area.area_id,
-            "name": area.name,
-            "enabled": area.enabled,
+            **area.to_api_dict(),
             "state": area.state,
-            "target_temperature": area.target_temperature,
             "effective_target_temperature": area.get_effective_target_temperature(),
             "current_temperature": area.current_temperature,
             "devices": devices_list,
             "schedules": [s.to_dict() for s in area.schedules.values()],
-            # Night boost
-            "night_boost_enabled": area.night_boost_enabled,
-            "night_boost_offset": area.night_boost_offset,
-            "night_boost_start_time": area.night_boost_start_time,
-            "night_boost_end_time": area.night_boost_end_time,
-            # Smart night boost
-            "smart_night_boost_enabled": area.smart_night_boost_enabled,
-            "smart_night_boost_target_time": area.smart_night_boost_target_time,
-            "weather_entity_id": area.weather_entity_id,
-            # Preset modes
-            "preset_mode": area.preset_mode,
-            "away_temp": area.away_temp,
-            "eco_temp": area.eco_temp,
-            "comfort_temp": area.comfort_temp,
-            "home_temp": area.home_temp,
-            "sleep_temp": area.sleep_temp,
-            "activity_temp": area.activity_temp,
-            # Global preset flags
-            "use_global_away": area.use_global_away,
-            "use_global_eco": area.use_global_eco,
-            "use_global_comfort": area.use_global_comfort,
-            "use_global_home": area.use_global_home,
-            "use_global_sleep": area.use_global_sleep,
-            "use_global_activity": area.use_global_activity,
-            # Boost mode
-            "boost_mode_active": area.boost_mode_active,
-            "boost_temp": area.boost_temp,
-            "boost_duration": area.boost_duration,
-            # HVAC mode
-            "hvac_mode": area.hvac_mode,
-            # Manual override
-            "manual_override": getattr(area, 'manual_override', False),
-            # Sensors
-            "window_sensors": area.window_sensors,
-            "presence_sensors": area.presence_sensors,
-            "use_global_presence": area.use_global_presence,
         }
         
-        return web.json_response(area_data)
+        return _json_response(area_data)
 
     async def get_devices(self, request: web.Request) -> web.Response:
         """Get available devices from Home Assistant.
@@ -433,16 +518,69 @@ class SmartHeatingAPIView(HomeAssistantView):
         Returns:
             JSON response with available devices
         """
+        coordinator_data = self._get_coordinator_data()
+        state_count = self.hass.states.async_entity_ids_count()
+        if (
+            self._devices_cache is None
+            or self._devices_cache_data is not coordinator_data
+            or self._devices_cache_states != state_count
+        ):
+            self._devices_cache = self._discover_devices()
+            self._devices_cache_data = coordinator_data
+            self._devices_cache_states = state_count
+        
+        devices = []
+        for (entity_id, domain, device_type, subtype,
+             assigned_areas, ha_area_id, ha_area_name) in self._devices_cache:
+            state = self.hass.states.get(entity_id)
+            if not state:
+                continue
+            
+            devices.append({
+                "id": entity_id,
+                "name": state.attributes.get("friendly_name", entity_id),
+                "type": device_type,
+                "subtype": subtype,
+                "entity_id": entity_id,
+                "domain": domain,
+                "assigned_areas": assigned_areas,
+                "ha_area_id": ha_area_id,
+                "ha_area_name": ha_area_name,
+                "state": state.state,
+                "attributes": {
+                    "temperature": state.attributes.get("temperature"),
+                    "current_temperature": state.attributes.get("current_temperature"),
+                    "unit_of_measurement": state.attributes.get("unit_of_measurement"),
+                }
+            })
+        
+        return _json_response({"devices": devices})
+
+    def _discover_devices(self) -> list[tuple]:
+        """Scan the entity registry for devices usable by Smart Heating.
+        
+        Classification only depends on the registries, area assignments and
+        mostly static state attributes, so the result is cached by get_devices
+        while live state is read per request.
+        
+        Returns:
+            List of (entity_id, domain, device_type, subtype, assigned_areas,
+            ha_area_id, ha_area_name) tuples
+        """
         devices = []
         
-        # Get all entities from Home Assistant
-        entity_registry = er.async_get(self.hass)
-        device_registry = dr.async_get(self.hass)
-        area_registry = ar.async_get(self.hass)
+        device_registry = self._device_registry
+        area_registry = self._area_registry
         
         _LOGGER.warning("=== SMART HEATING: Starting device discovery ===")
         
-        for entity in entity_registry.entities.values():
+        areas = self.area_manager.get_all_areas()
+        hidden_areas = [
+            (area.name, area.name.lower()) for area in areas.values() if area.hidden
+        ]
+        hidden_area_names = {name_lower for _, name_lower in hidden_areas}
+        
+        for entity in self._get_heating_entities():
             # Skip Smart Heating's own climate entities (zone thermostats)
             if entity.entity_id.startswith("climate.zone_"):
                 continue
@@ -470,7 +608,7 @@ class SmartHeatingAPIView(HomeAssistantView):
             elif entity.domain == "sensor":
                 # Only include temperature sensors
                 unit = state.attributes.get("unit_of_measurement", "")
-                if device_class == "temperature" or unit in ["°C", "°F"]:
+                if device_class == "temperature" or unit in _TEMP_UNITS:
                     device_type = "sensor"
                     subtype = "temperature"
                 else:
@@ -481,27 +619,24 @@ class SmartHeatingAPIView(HomeAssistantView):
                 continue
             
             # Check if device is already assigned to a area
-            assigned_areas = []
-            assigned_to_hidden_area = False
-            for area_id, area in self.area_manager.get_all_areas().items():
-                if entity.entity_id in area.devices:
-                    assigned_areas.append(area_id)
-                    # Check if any assigned area is hidden
-                    if area.hidden:
-                        assigned_to_hidden_area = True
-                
-                # Also check if device name/entity_id contains a hidden area name
-                if area.hidden and not assigned_to_hidden_area:
-                    area_name_lower = area.name.lower()
-                    entity_id_lower = entity.entity_id.lower()
-                    friendly_name_lower = state.attributes.get("friendly_name", "").lower()
-                    
+            assigned_areas = self.area_manager.get_device_areas(entity.entity_id)
+            # Check if any assigned area is hidden
+            assigned_to_hidden_area = any(
+                areas[area_id].hidden for area_id in assigned_areas
+            )
+            
+            # Also check if device name/entity_id contains a hidden area name
+            if not assigned_to_hidden_area and hidden_areas:
+                entity_id_lower = entity.entity_id  # entity IDs are always lowercase
+                friendly_name_lower = state.attributes.get("friendly_name", "").lower()
+                for area_name, area_name_lower in hidden_areas:
                     if area_name_lower in entity_id_lower or area_name_lower in friendly_name_lower:
                         _LOGGER.debug(
                             "Filtering device %s - contains hidden area name '%s'",
-                            entity.entity_id, area.name
+                            entity.entity_id, area_name
                         )
                         assigned_to_hidden_area = True
+                        break
             
             # Skip devices assigned to hidden areas
             if assigned_to_hidden_area:
@@ -519,15 +654,12 @@ class SmartHeatingAPIView(HomeAssistantView):
                         ha_area_name = area_entry.name
                         
                         # Also skip if HA area matches a hidden Smart Heating area
-                        if not assigned_to_hidden_area:
-                            for area_id, area in self.area_manager.get_all_areas().items():
-                                if area.hidden and area.name.lower() == ha_area_name.lower():
-                                    _LOGGER.debug(
-                                        "Filtering device %s - HA area %s matches hidden Smart Heating area",
-                                        entity.entity_id, ha_area_name
-                                    )
-                                    assigned_to_hidden_area = True
-                                    break
+                        if ha_area_name.lower() in hidden_area_names:
+                            _LOGGER.debug(
+                                "Filtering device %s - HA area %s matches hidden Smart Heating area",
+                                entity.entity_id, ha_area_name
+                            )
+                            assigned_to_hidden_area = True
             
             # Skip devices assigned to hidden areas (any method)
             if assigned_to_hidden_area:
@@ -540,26 +672,13 @@ class SmartHeatingAPIView(HomeAssistantView):
                 entity.entity_id, device_type, ha_area_name or "none"
             )
             
-            devices.append({
-                "id": entity.entity_id,
-                "name": state.attributes.get("friendly_name", entity.entity_id),
-                "type": device_type,
-                "subtype": subtype,
-                "entity_id": entity.entity_id,
-                "domain": entity.domain,
-                "assigned_areas": assigned_areas,
-                "ha_area_id": ha_area_id,
-                "ha_area_name": ha_area_name,
-                "state": state.state,
-                "attributes": {
-                    "temperature": state.attributes.get("temperature"),
-                    "current_temperature": state.attributes.get("current_temperature"),
-                    "unit_of_measurement": state.attributes.get("unit_of_measurement"),
-                }
-            })
+            devices.append(
+                (entity.entity_id, entity.domain, device_type, subtype,
+                 assigned_areas, ha_area_id, ha_area_name)
+            )
         
         _LOGGER.warning("=== SMART HEATING: Discovery complete - found %d devices ===", len(devices))
-        return web.json_response({"devices": devices})
+        return devices
 
     async def refresh_devices(self, request: web.Request) -> web.Response:
         """Refresh all devices from Home Assistant and update area assignments.
@@ -577,15 +696,14 @@ class SmartHeatingAPIView(HomeAssistantView):
         
         try:
             # Get all MQTT entities from Home Assistant
-            entity_registry = er.async_get(self.hass)
-            device_registry = dr.async_get(self.hass)
-            area_registry = ar.async_get(self.hass)
+            device_registry = self._device_registry
+            area_registry = self._area_registry
             
             updated_count = 0
             added_count = 0
             
             # Find entities that are from MQTT and could be heating-related
-            for entity in entity_registry.entities.values():
+            for entity in self._get_heating_entities():
                 # Check if entity is from MQTT integration
                 if entity.platform == "mqtt":
                     # Get entity state for additional info
@@ -596,6 +714,7 @@ class SmartHeatingAPIView(HomeAssistantView):
                     # Determine device type based on entity domain
                     device_type = None
                     device_class = state.attributes.get("device_class")
+                    entity_id_lower = entity.entity_id  # entity IDs are always lowercase
                     
                     if entity.domain == "climate":
                         device_type = "thermostat"
@@ -604,18 +723,17 @@ class SmartHeatingAPIView(HomeAssistantView):
                             device_type = "temperature_sensor"
                         else:
                             unit = state.attributes.get("unit_of_measurement", "")
-                            if "°C" in unit or "°F" in unit or "temperature" in entity.entity_id.lower():
+                            if any(u in unit for u in _TEMP_UNITS) or "temperature" in entity_id_lower:
                                 device_type = "temperature_sensor"
                             else:
                                 continue
                     elif entity.domain == "switch":
-                        if any(keyword in entity.entity_id.lower() 
-                               for keyword in ["thermostat", "heater", "radiator", "heating", "pump", "floor", "relay"]):
+                        if _SWITCH_KEYWORDS_RE.search(entity_id_lower):
                             device_type = "switch"
                         else:
                             continue
                     elif entity.domain == "number":
-                        if "valve" in entity.entity_id.lower() or device_class == "valve":
+                        if "valve" in entity_id_lower or device_class == "valve":
                             device_type = "valve"
                         else:
                             continue
@@ -638,13 +756,12 @@ class SmartHeatingAPIView(HomeAssistantView):
                     
                     # Update device in all areas that have it assigned
                     device_updated = False
-                    for area_id, area in self.area_manager.get_all_areas().items():
-                        if entity.entity_id in area.devices:
-                            # Update the device configuration
-                            area.devices[entity.entity_id] = {
-                                "type": device_type,
-                                "mqtt_topic": None  # Will be populated by climate_controller if needed
-                            }
+                    for area_id in self.area_manager.get_device_areas(entity.entity_id):
+                        area = self.area_manager.get_area(area_id)
+                        if area:
+                            # Update the device configuration (mqtt_topic will be
+                            # populated by climate_controller if needed)
+                            area.add_device(entity.entity_id, device_type)
                             device_updated = True
                             updated_count += 1
                             _LOGGER.info(
@@ -657,14 +774,14 @@ class SmartHeatingAPIView(HomeAssistantView):
                         added_count += 1
             
             # Save updated configuration
-            await self.area_manager.async_save()
+            self.area_manager.async_schedule_save()
             
             _LOGGER.info(
                 "Device refresh complete: %d updated, %d available for assignment",
                 updated_count, added_count
             )
             
-            return web.json_response({
+            return _json_response({
                 "success": True,
                 "updated": updated_count,
                 "available": added_count,
@@ -673,7 +790,7 @@ class SmartHeatingAPIView(HomeAssistantView):
             
         except Exception as err:
             _LOGGER.error("Error refreshing devices: %s", err)
-            return web.json_response(
+            return _json_response(
                 {"error": str(err)}, status=500
             )
 
@@ -686,6 +803,14 @@ class SmartHeatingAPIView(HomeAssistantView):
         Returns:
             JSON response with status
         """
+        coordinator_data = self._get_coordinator_data()
+        if (
+            self._status_cache is not None
+            and coordinator_data is not None
+            and self._status_cache_data is coordinator_data
+        ):
+            return web.Response(body=self._status_cache, content_type="application/json")
+        
         areas = self.area_manager.get_all_areas()
         
         status = {
@@ -694,7 +819,9 @@ class SmartHeatingAPIView(HomeAssistantView):
             "total_devices": sum(len(z.devices) for z in areas.values()),
         }
         
-        return web.json_response(status)
+        self._status_cache = orjson.dumps(status)
+        self._status_cache_data = coordinator_data
+        return web.Response(body=self._status_cache, content_type="application/json")
 
     async def get_config(self, request: web.Request) -> web.Response:
         """Get system configuration.
@@ -713,7 +840,7 @@ class SmartHeatingAPIView(HomeAssistantView):
             "trv_temp_offset": self.area_manager.trv_temp_offset,
         }
         
-        return web.json_response(config)
+        return _json_response(config)
 
     async def get_entity_state(self, request: web.Request, entity_id: str) -> web.Response:
         """Get entity state from Home Assistant.
@@ -728,11 +855,11 @@ class SmartHeatingAPIView(HomeAssistantView):
         state = self.hass.states.get(entity_id)
         
         if not state:
-            return web.json_response(
+            return _json_response(
                 {"error": f"Entity {entity_id} not found"}, status=404
             )
         
-        return web.json_response({
+        return _json_response({
             "state": state.state,
             "attributes": dict(state.attributes),
             "last_changed": state.last_changed.isoformat(),
@@ -791,7 +918,7 @@ class SmartHeatingAPIView(HomeAssistantView):
                     }
                 })
         
-        return web.json_response({"entities": entities})
+        return _json_response({"entities": entities})
 
     async def add_device(
         self, request: web.Request, area_id: str, data: dict
@@ -811,15 +938,13 @@ class SmartHeatingAPIView(HomeAssistantView):
         mqtt_topic = data.get("mqtt_topic")
         
         if not device_id or not device_type:
-            return web.json_response(
-                {"error": "device_id and device_type are required"}, status=400
-            )
+            return _error_response(_ERR_DEVICE_REQUIRED, status=400)
         
         try:
             # Ensure area exists in storage
             if self.area_manager.get_area(area_id) is None:
                 # Auto-create area entry for this HA area if not exists
-                area_registry = ar.async_get(self.hass)
+                area_registry = self._area_registry
                 ha_area = area_registry.async_get_area(area_id)
                 if ha_area:
                     # Create internal storage for this HA area
@@ -827,18 +952,18 @@ class SmartHeatingAPIView(HomeAssistantView):
                     area.area_manager = self.area_manager
                     self.area_manager.areas[area_id] = area
                 else:
-                    return web.json_response(
+                    return _json_response(
                         {"error": f"Area {area_id} not found"}, status=404
                     )
             
             self.area_manager.add_device_to_area(
                 area_id, device_id, device_type, mqtt_topic
             )
-            await self.area_manager.async_save()
+            self.area_manager.async_schedule_save()
             
-            return web.json_response({"success": True})
+            return _json_response({"success": True})
         except ValueError as err:
-            return web.json_response(
+            return _json_response(
                 {"error": str(err)}, status=400
             )
 
@@ -857,11 +982,11 @@ class SmartHeatingAPIView(HomeAssistantView):
         """
         try:
             self.area_manager.remove_device_from_area(area_id, device_id)
-            await self.area_manager.async_save()
+            self.area_manager.async_schedule_save()
             
-            return web.json_response({"success": True})
+            return _json_response({"success": True})
         except ValueError as err:
-            return web.json_response(
+            return _json_response(
                 {"error": str(err)}, status=404
             )
 
@@ -881,14 +1006,12 @@ class SmartHeatingAPIView(HomeAssistantView):
         temperature = data.get("temperature")
         
         if temperature is None:
-            return web.json_response(
-                {"error": "temperature is required"}, status=400
-            )
+            return _error_response(_ERR_TEMPERATURE_REQUIRED, status=400)
         
         try:
             area = self.area_manager.get_area(area_id)
             if not area:
-                return web.json_response(
+                return _json_response(
                     {"error": f"Area {area_id} not found"}, status=404
                 )
             
@@ -907,6 +1030,7 @@ class SmartHeatingAPIView(HomeAssistantView):
             if area and hasattr(area, 'manual_override') and area.manual_override:
                 _LOGGER.warning("🔓 Clearing manual override for %s - app now in control", area.name)
                 area.manual_override = False
+                area.mark_changed()
             
             new_effective = area.get_effective_target_temperature()
             _LOGGER.warning(
@@ -914,7 +1038,7 @@ class SmartHeatingAPIView(HomeAssistantView):
                 area.name, temperature, new_effective
             )
             
-            await self.area_manager.async_save()
+            self.area_manager.async_schedule_save()
             
             # Trigger immediate climate control to update devices
             climate_controller = self.hass.data.get(DOMAIN, {}).get("climate_controller")
@@ -925,17 +1049,17 @@ class SmartHeatingAPIView(HomeAssistantView):
             # Refresh coordinator to notify websocket listeners
             entry_ids = [
                 key for key in self.hass.data[DOMAIN].keys()
-                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger"]
+                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger", "flush"]
             ]
             if entry_ids:
                 coordinator = self.hass.data[DOMAIN][entry_ids[0]]
                 await coordinator.async_request_refresh()
                 _LOGGER.debug("Coordinator refreshed to update frontend")
             
-            return web.json_response({"success": True})
+            return _json_response({"success": True})
         except ValueError as err:
             _LOGGER.error("ValueError setting temperature for area %s: %s", area_id, err)
-            return web.json_response(
+            return _json_response(
                 {"error": str(err)}, status=404
             )
 
@@ -951,7 +1075,7 @@ class SmartHeatingAPIView(HomeAssistantView):
         """
         try:
             self.area_manager.enable_area(area_id)
-            await self.area_manager.async_save()
+            self.area_manager.async_schedule_save()
             
             # Trigger immediate climate control
             climate_controller = self.hass.data.get(DOMAIN, {}).get("climate_controller")
@@ -961,15 +1085,15 @@ class SmartHeatingAPIView(HomeAssistantView):
             # Refresh coordinator
             entry_ids = [
                 key for key in self.hass.data[DOMAIN].keys()
-                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger"]
+                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger", "flush"]
             ]
             if entry_ids:
                 coordinator = self.hass.data[DOMAIN][entry_ids[0]]
                 await coordinator.async_request_refresh()
             
-            return web.json_response({"success": True})
+            return _json_response({"success": True})
         except ValueError as err:
-            return web.json_response(
+            return _json_response(
                 {"error": str(err)}, status=404
             )
 
@@ -985,7 +1109,7 @@ class SmartHeatingAPIView(HomeAssistantView):
         """
         try:
             self.area_manager.disable_area(area_id)
-            await self.area_manager.async_save()
+            self.area_manager.async_schedule_save()
             
             # Trigger immediate climate control to turn off devices
             climate_controller = self.hass.data.get(DOMAIN, {}).get("climate_controller")
@@ -995,15 +1119,15 @@ class SmartHeatingAPIView(HomeAssistantView):
             # Refresh coordinator
             entry_ids = [
                 key for key in self.hass.data[DOMAIN].keys()
-                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger"]
+                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger", "flush"]
             ]
             if entry_ids:
                 coordinator = self.hass.data[DOMAIN][entry_ids[0]]
                 await coordinator.async_request_refresh()
             
-            return web.json_response({"success": True})
+            return _json_response({"success": True})
         except ValueError as err:
-            return web.json_response(
+            return _json_response(
                 {"error": str(err)}, status=404
             )
     
@@ -1022,16 +1146,13 @@ class SmartHeatingAPIView(HomeAssistantView):
             if not area:
                 # Area doesn't exist in storage yet - create it
                 # Get area name from HA registry
-                area_registry = ar.async_get(self.hass)
+                area_registry = self._area_registry
                 ha_area = area_registry.async_get_area(area_id)
                 if not ha_area:
-                    return web.json_response(
+                    return _json_response(
                         {"error": f"Area {area_id} not found in Home Assistant"}, status=404
                     )
                 
-                # Import Area class
-                from .area_manager import Area
-                
                 # Create area with default settings
                 area = Area(
                     area_id=area_id,
@@ -1043,20 +1164,21 @@ class SmartHeatingAPIView(HomeAssistantView):
                 self.area_manager.areas[area_id] = area
             
             area.hidden = True
-            await self.area_manager.async_save()
+            area.mark_changed()
+            self.area_manager.async_schedule_save()
             
             # Refresh coordinator
             entry_ids = [
                 key for key in self.hass.data[DOMAIN].keys()
-                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger"]
+                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger", "flush"]
             ]
             if entry_ids:
                 coordinator = self.hass.data[DOMAIN][entry_ids[0]]
                 await coordinator.async_request_refresh()
             
-            return web.json_response({"success": True})
+            return _json_response({"success": True})
         except Exception as err:
-            return web.json_response(
+            return _json_response(
                 {"error": str(err)}, status=500
             )
     
@@ -1075,16 +1197,13 @@ class SmartHeatingAPIView(HomeAssistantView):
             if not area:
                 # Area doesn't exist in storage yet - create it
                 # Get area name from HA registry
-                area_registry = ar.async_get(self.hass)
+                area_registry = self._area_registry
                 ha_area = area_registry.async_get_area(area_id)
                 if not ha_area:
-                    return web.json_response(
+                    return _json_response(
                         {"error": f"Area {area_id} not found in Home Assistant"}, status=404
                     )
                 
-                # Import Area class
-                from .area_manager import Area
-                
                 # Create area with default settings
                 area = Area(
                     area_id=area_id,
@@ -1096,20 +1215,21 @@ class SmartHeatingAPIView(HomeAssistantView):
                 self.area_manager.areas[area_id] = area
             
             area.hidden = False
-            await self.area_manager.async_save()
+            area.mark_changed()
+            self.area_manager.async_schedule_save()
             
             # Refresh coordinator
             entry_ids = [
                 key for key in self.hass.data[DOMAIN].keys()
-                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger"]
+                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger", "flush"]
             ]
             if entry_ids:
                 coordinator = self.hass.data[DOMAIN][entry_ids[0]]
                 await coordinator.async_request_refresh()
             
-            return web.json_response({"success": True})
+            return _json_response({"success": True})
         except Exception as err:
-            return web.json_response(
+            return _json_response(
                 {"error": str(err)}, status=500
             )
     
@@ -1127,13 +1247,14 @@ class SmartHeatingAPIView(HomeAssistantView):
         try:
             area = self.area_manager.get_area(area_id)
             if not area:
-                return web.json_response(
+                return _json_response(
                     {"error": f"Area {area_id} not found"}, status=404
                 )
             
             shutdown = data.get("shutdown", True)
             area.shutdown_switches_when_idle = shutdown
-            await self.area_manager.async_save()
+            area.mark_changed()
+            self.area_manager.async_schedule_save()
             
             _LOGGER.info(
                 "Area %s: shutdown_switches_when_idle set to %s",
@@ -1143,16 +1264,16 @@ class SmartHeatingAPIView(HomeAssistantView):
             # Refresh coordinator
             entry_ids = [
                 key for key in self.hass.data[DOMAIN].keys()
-                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger"]
+                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger", "flush"]
             ]
             if entry_ids:
                 coordinator = self.hass.data[DOMAIN][entry_ids[0]]
                 await coordinator.async_request_refresh()
             
-            return web.json_response({"success": True})
+            return _json_response({"success": True})
         except Exception as err:
             _LOGGER.error("Error setting switch shutdown for area %s: %s", area_id, err)
-            return web.json_response(
+            return _json_response(
                 {"error": str(err)}, status=500
             )
     
@@ -1166,29 +1287,26 @@ class SmartHeatingAPIView(HomeAssistantView):
         Returns:
             JSON response
         """
-        service_name = data.get("service")
+        # data is freshly parsed per request, so it can be reused as service data
+        service_name = data.pop("service", None)
         if not service_name:
-            return web.json_response(
-                {"error": "Service name required"}, status=400
-            )
+            return _error_response(_ERR_SERVICE_NAME_REQUIRED, status=400)
         
         try:
-            service_data = {k: v for k, v in data.items() if k != "service"}
-            
             await self.hass.services.async_call(
                 "smart_heating",
                 service_name,
-                service_data,
+                data,
                 blocking=True,
             )
             
-            return web.json_response({
+            return _json_response({
                 "success": True,
                 "message": f"Service {service_name} called successfully"
             })
         except Exception as err:
             _LOGGER.error("Error calling service %s: %s", service_name, err)
-            return web.json_response(
+            return _json_response(
                 {"error": str(err)}, status=500
             )
     
@@ -1202,9 +1320,6 @@ class SmartHeatingAPIView(HomeAssistantView):
         Returns:
             JSON response with history
         """
-        from .const import DOMAIN
-        from datetime import datetime
-        
         # Get query parameters
         hours = request.query.get("hours")
         start_time = request.query.get("start_time")
@@ -1212,9 +1327,7 @@ class SmartHeatingAPIView(HomeAssistantView):
         
         history_tracker = self.hass.data.get(DOMAIN, {}).get("history")
         if not history_tracker:
-            return web.json_response(
-                {"error": "History not available"}, status=503
-            )
+            return _error_response(_ERR_HISTORY_NOT_AVAILABLE, status=503)
         
         try:
             # Parse time parameters
@@ -1236,7 +1349,7 @@ class SmartHeatingAPIView(HomeAssistantView):
                 hours_int = 24
                 history = history_tracker.get_history(area_id, hours=hours_int)
             
-            return web.json_response({
+            return _json_response({
                 "area_id": area_id,
                 "hours": hours_int,
                 "start_time": start_time,
@@ -1245,7 +1358,7 @@ class SmartHeatingAPIView(HomeAssistantView):
                 "count": len(history)
             })
         except ValueError as err:
-            return web.json_response(
+            return _json_response(
                 {"error": f"Invalid time parameter: {err}"}, status=400
             )
 
@@ -1259,17 +1372,13 @@ class SmartHeatingAPIView(HomeAssistantView):
         Returns:
             JSON response with learning stats
         """
-        from .const import DOMAIN
-        
         learning_engine = self.hass.data.get(DOMAIN, {}).get("learning_engine")
         if not learning_engine:
-            return web.json_response(
-                {"error": "Learning engine not available"}, status=503
-            )
+            return _error_response(_ERR_LEARNING_ENGINE_NOT_AVAILABLE, status=503)
         
         stats = await learning_engine.async_get_learning_stats(area_id)
         
-        return web.json_response({
+        return _json_response({
             "area_id": area_id,
             "stats": stats
         })
@@ -1283,7 +1392,7 @@ class SmartHeatingAPIView(HomeAssistantView):
         Returns:
             JSON response with global preset temperatures
         """
-        return web.json_response({
+        return _json_response({
             "away_temp": self.area_manager.global_away_temp,
             "eco_temp": self.area_manager.global_eco_temp,
             "comfort_temp": self.area_manager.global_comfort_temp,
@@ -1333,11 +1442,11 @@ class SmartHeatingAPIView(HomeAssistantView):
             _LOGGER.warning("  Global Activity: %.1f°C → %.1f°C", old, self.area_manager.global_activity_temp)
         
         # Save to storage
-        await self.area_manager.async_save()
+        self.area_manager.async_schedule_save()
         
         _LOGGER.warning("✓ Global presets saved")
         
-        return web.json_response({"success": True})
+        return _json_response({"success": True})
 
     async def get_global_presence(self, request: web.Request) -> web.Response:
         """Get global presence sensors.
@@ -1348,7 +1457,7 @@ class SmartHeatingAPIView(HomeAssistantView):
         Returns:
             JSON response with global presence sensors
         """
-        return web.json_response({
+        return _json_response({
             "sensors": self.area_manager.global_presence_sensors
         })
 
@@ -1369,11 +1478,11 @@ class SmartHeatingAPIView(HomeAssistantView):
             _LOGGER.warning("  Global presence sensors updated: %d sensors", len(self.area_manager.global_presence_sensors))
         
         # Save to storage
-        await self.area_manager.async_save()
+        self.area_manager.async_schedule_save()
         
         _LOGGER.warning("✓ Global presence saved")
         
-        return web.json_response({"success": True})
+        return _json_response({"success": True})
 
     async def set_area_preset_config(
         self, request: web.Request, area_id: str, data: dict
@@ -1390,7 +1499,7 @@ class SmartHeatingAPIView(HomeAssistantView):
         """
         area = self.area_manager.get_area(area_id)
         if not area:
-            return web.json_response(
+            return _json_response(
                 {"error": f"Area {area_id} not found"}, status=404
             )
         
@@ -1412,22 +1521,23 @@ class SmartHeatingAPIView(HomeAssistantView):
             area.use_global_activity = bool(data["use_global_activity"])
         if "use_global_presence" in data:
             area.use_global_presence = bool(data["use_global_presence"])
+        area.mark_changed()
         
         # Save to storage
-        await self.area_manager.async_save()
+        self.area_manager.async_schedule_save()
         
         _LOGGER.warning("✓ Preset config saved for %s", area.name)
         
         # Refresh coordinator to update frontend
         entry_ids = [
             key for key in self.hass.data[DOMAIN].keys()
-            if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger"]
+            if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger", "flush"]
         ]
         if entry_ids:
             coordinator = self.hass.data[DOMAIN][entry_ids[0]]
             await coordinator.async_request_refresh()
         
-        return web.json_response({"success": True})
+        return _json_response({"success": True})
 
     async def set_manual_override(
         self, request: web.Request, area_id: str, data: dict
@@ -1444,18 +1554,17 @@ class SmartHeatingAPIView(HomeAssistantView):
         """
         area = self.area_manager.get_area(area_id)
         if not area:
-            return web.json_response(
+            return _json_response(
                 {"error": f"Area {area_id} not found"}, status=404
             )
         
         enabled = data.get("enabled")
         if enabled is None:
-            return web.json_response(
-                {"error": "enabled field is required"}, status=400
-            )
+            return _error_response(_ERR_ENABLED_REQUIRED, status=400)
         
         old_state = area.manual_override
         area.manual_override = bool(enabled)
+        area.mark_changed()
         
         _LOGGER.warning(
             "🎛️ API: MANUAL OVERRIDE for %s: %s → %s",
@@ -1471,13 +1580,14 @@ class SmartHeatingAPIView(HomeAssistantView):
             # Update the base target temperature to match the preset temperature
             # This ensures the UI shows the correct temperature
             area.target_temperature = effective_temp
+            area.mark_changed()
             _LOGGER.warning(
                 "✓ %s now using preset mode '%s': %.1f°C → %.1f°C",
                 area.name, area.preset_mode, old_target, effective_temp
             )
         
         # Save to storage
-        await self.area_manager.async_save()
+        self.area_manager.async_schedule_save()
         
         # Trigger climate control to apply changes
         climate_controller = self.hass.data.get(DOMAIN, {}).get("climate_controller")
@@ -1487,13 +1597,13 @@ class SmartHeatingAPIView(HomeAssistantView):
         # Refresh coordinator
         entry_ids = [
             key for key in self.hass.data[DOMAIN].keys()
-            if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger"]
+            if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger", "flush"]
         ]
         if entry_ids:
             coordinator = self.hass.data[DOMAIN][entry_ids[0]]
             await coordinator.async_request_refresh()
         
-        return web.json_response({"success": True})
+        return _json_response({"success": True})
 
     async def add_schedule(
         self, request: web.Request, area_id: str, data: dict
@@ -1508,23 +1618,19 @@ class SmartHeatingAPIView(HomeAssistantView):
         Returns:
             JSON response
         """
-        import uuid
-        
         schedule_id = data.get("id") or str(uuid.uuid4())
         temperature = data.get("temperature")
         preset_mode = data.get("preset_mode")
         
         # Require either temperature or preset_mode
         if temperature is None and preset_mode is None:
-            return web.json_response(
-                {"error": "Either temperature or preset_mode is required"}, status=400
-            )
+            return _error_response(_ERR_TEMPERATURE_OR_PRESET_REQUIRED, status=400)
         
         try:
             # Ensure area exists in storage
             if self.area_manager.get_area(area_id) is None:
                 # Auto-create area entry for this HA area if not exists
-                area_registry = ar.async_get(self.hass)
+                area_registry = self._area_registry
                 ha_area = area_registry.async_get_area(area_id)
                 if ha_area:
                     # Create internal storage for this HA area
@@ -1532,19 +1638,18 @@ class SmartHeatingAPIView(HomeAssistantView):
                     area.area_manager = self.area_manager
                     self.area_manager.areas[area_id] = area
                 else:
-                    return web.json_response(
+                    return _json_response(
                         {"error": f"Area {area_id} not found"}, status=404
                     )
             
             # Create schedule from frontend data
-            from .area_manager import Schedule
-            
             # Validate required fields - accept either 'time' (legacy) or 'start_time' (new)
             time_str = data.get("time") or data.get("start_time")
             if not time_str:
-                return web.json_response(
-                    {"error": "Missing required field: time or start_time"}, status=400
-                )
+                return _error_response(_ERR_TIME_REQUIRED, status=400)
+            validate_schedule_time(time_str)
+            if data.get("end_time"):
+                validate_schedule_time(data["end_time"])
             
             schedule = Schedule(
                 schedule_id=schedule_id,
@@ -1560,19 +1665,19 @@ class SmartHeatingAPIView(HomeAssistantView):
             
             area = self.area_manager.get_area(area_id)
             if not area:
-                return web.json_response(
+                return _json_response(
                     {"error": f"Area {area_id} not found"}, status=404
                 )
             
             area.add_schedule(schedule)
-            await self.area_manager.async_save()
+            self.area_manager.async_schedule_save()
             
-            return web.json_response({
+            return _json_response({
                 "success": True,
                 "schedule": schedule.to_dict()
             })
         except ValueError as err:
-            return web.json_response(
+            return _json_response(
                 {"error": str(err)}, status=400
             )
 
@@ -1591,11 +1696,11 @@ class SmartHeatingAPIView(HomeAssistantView):
         """
         try:
             self.area_manager.remove_schedule_from_area(area_id, schedule_id)
-            await self.area_manager.async_save()
+            self.area_manager.async_schedule_save()
             
-            return web.json_response({"success": True})
+            return _json_response({"success": True})
         except ValueError as err:
-            return web.json_response(
+            return _json_response(
                 {"error": str(err)}, status=404
             )
 
@@ -1614,9 +1719,7 @@ class SmartHeatingAPIView(HomeAssistantView):
         """
         preset_mode = data.get("preset_mode")
         if not preset_mode:
-            return web.json_response(
-                {"error": "preset_mode required"}, status=400
-            )
+            return _error_response(_ERR_PRESET_MODE_REQUIRED, status=400)
         
         try:
             area = self.area_manager.get_area(area_id)
@@ -1638,8 +1741,9 @@ class SmartHeatingAPIView(HomeAssistantView):
             if hasattr(area, 'manual_override') and area.manual_override:
                 _LOGGER.warning("🔓 Clearing manual override for %s - preset mode now in control", area.name)
                 area.manual_override = False
+                area.mark_changed()
             
-            await self.area_manager.async_save()
+            self.area_manager.async_schedule_save()
             
             # Get new effective temperature
             new_effective = area.get_effective_target_temperature()
@@ -1658,15 +1762,15 @@ class SmartHeatingAPIView(HomeAssistantView):
             # Refresh coordinator
             entry_ids = [
                 key for key in self.hass.data[DOMAIN].keys()
-                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger"]
+                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger", "flush"]
             ]
             if entry_ids:
                 coordinator = self.hass.data[DOMAIN][entry_ids[0]]
                 await coordinator.async_request_refresh()
             
-            return web.json_response({"success": True, "preset_mode": preset_mode})
+            return _json_response({"success": True, "preset_mode": preset_mode})
         except ValueError as err:
-            return web.json_response(
+            return _json_response(
                 {"error": str(err)}, status=400
             )
 
@@ -1692,25 +1796,25 @@ class SmartHeatingAPIView(HomeAssistantView):
                 raise ValueError(f"Area {area_id} not found")
             
             area.set_boost_mode(duration, temp)
-            await self.area_manager.async_save()
+            self.area_manager.async_schedule_save()
             
             # Refresh coordinator
             entry_ids = [
                 key for key in self.hass.data[DOMAIN].keys()
-                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger"]
+                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger", "flush"]
             ]
             if entry_ids:
                 coordinator = self.hass.data[DOMAIN][entry_ids[0]]
                 await coordinator.async_request_refresh()
             
-            return web.json_response({
+            return _json_response({
                 "success": True,
                 "boost_active": True,
                 "duration": duration,
                 "temperature": area.boost_temp
             })
         except ValueError as err:
-            return web.json_response(
+            return _json_response(
                 {"error": str(err)}, status=400
             )
 
@@ -1732,20 +1836,20 @@ class SmartHeatingAPIView(HomeAssistantView):
                 raise ValueError(f"Area {area_id} not found")
             
             area.cancel_boost_mode()
-            await self.area_manager.async_save()
+            self.area_manager.async_schedule_save()
             
             # Refresh coordinator
             entry_ids = [
                 key for key in self.hass.data[DOMAIN].keys()
-                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger"]
+                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger", "flush"]
             ]
             if entry_ids:
                 coordinator = self.hass.data[DOMAIN][entry_ids[0]]
                 await coordinator.async_request_refresh()
             
-            return web.json_response({"success": True, "boost_active": False})
+            return _json_response({"success": True, "boost_active": False})
         except ValueError as err:
-            return web.json_response(
+            return _json_response(
                 {"error": str(err)}, status=400
             )
 
@@ -1770,15 +1874,15 @@ class SmartHeatingAPIView(HomeAssistantView):
             if temp is not None:
                 self.area_manager.frost_protection_temp = temp
             
-            await self.area_manager.async_save()
+            self.area_manager.async_schedule_save()
             
-            return web.json_response({
+            return _json_response({
                 "success": True,
                 "enabled": self.area_manager.frost_protection_enabled,
                 "temperature": self.area_manager.frost_protection_temp
             })
         except ValueError as err:
-            return web.json_response(
+            return _json_response(
                 {"error": str(err)}, status=400
             )
 
@@ -1797,9 +1901,7 @@ class SmartHeatingAPIView(HomeAssistantView):
         """
         entity_id = data.get("entity_id")
         if not entity_id:
-            return web.json_response(
-                {"error": "entity_id required"}, status=400
-            )
+            return _error_response(_ERR_ENTITY_ID_REQUIRED, status=400)
         
         try:
             area = self.area_manager.get_area(area_id)
@@ -1811,20 +1913,20 @@ class SmartHeatingAPIView(HomeAssistantView):
             temp_drop = data.get("temp_drop")
             
             area.add_window_sensor(entity_id, action_when_open, temp_drop)
-            await self.area_manager.async_save()
+            self.area_manager.async_schedule_save()
             
             # Refresh coordinator
             entry_ids = [
                 key for key in self.hass.data[DOMAIN].keys()
-                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger"]
+                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger", "flush"]
             ]
             if entry_ids:
                 coordinator = self.hass.data[DOMAIN][entry_ids[0]]
                 await coordinator.async_request_refresh()
             
-            return web.json_response({"success": True, "entity_id": entity_id})
+            return _json_response({"success": True, "entity_id": entity_id})
         except ValueError as err:
-            return web.json_response(
+            return _json_response(
                 {"error": str(err)}, status=400
             )
 
@@ -1847,20 +1949,20 @@ class SmartHeatingAPIView(HomeAssistantView):
                 raise ValueError(f"Area {area_id} not found")
             
             area.remove_window_sensor(entity_id)
-            await self.area_manager.async_save()
+            self.area_manager.async_schedule_save()
             
             # Refresh coordinator
             entry_ids = [
                 key for key in self.hass.data[DOMAIN].keys()
-                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger"]
+                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger", "flush"]
             ]
             if entry_ids:
                 coordinator = self.hass.data[DOMAIN][entry_ids[0]]
                 await coordinator.async_request_refresh()
             
-            return web.json_response({"success": True})
+            return _json_response({"success": True})
         except ValueError as err:
-            return web.json_response(
+            return _json_response(
                 {"error": str(err)}, status=404
             )
 
@@ -1883,9 +1985,7 @@ class SmartHeatingAPIView(HomeAssistantView):
         """
         entity_id = data.get("entity_id")
         if not entity_id:
-            return web.json_response(
-                {"error": "entity_id required"}, status=400
-            )
+            return _error_response(_ERR_ENTITY_ID_REQUIRED, status=400)
         
         try:
             area = self.area_manager.get_area(area_id)
@@ -1893,20 +1993,20 @@ class SmartHeatingAPIView(HomeAssistantView):
                 raise ValueError(f"Area {area_id} not found")
             
             area.add_presence_sensor(entity_id)
-            await self.area_manager.async_save()
+            self.area_manager.async_schedule_save()
             
             # Refresh coordinator
             entry_ids = [
                 key for key in self.hass.data[DOMAIN].keys()
-                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger"]
+                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger", "flush"]
             ]
             if entry_ids:
                 coordinator = self.hass.data[DOMAIN][entry_ids[0]]
                 await coordinator.async_request_refresh()
             
-            return web.json_response({"success": True, "entity_id": entity_id})
+            return _json_response({"success": True, "entity_id": entity_id})
         except ValueError as err:
-            return web.json_response(
+            return _json_response(
                 {"error": str(err)}, status=400
             )
 
@@ -1929,20 +2029,20 @@ class SmartHeatingAPIView(HomeAssistantView):
                 raise ValueError(f"Area {area_id} not found")
             
             area.remove_presence_sensor(entity_id)
-            await self.area_manager.async_save()
+            self.area_manager.async_schedule_save()
             
             # Refresh coordinator
             entry_ids = [
                 key for key in self.hass.data[DOMAIN].keys()
-                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger"]
+                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger", "flush"]
             ]
             if entry_ids:
                 coordinator = self.hass.data[DOMAIN][entry_ids[0]]
                 await coordinator.async_request_refresh()
             
-            return web.json_response({"success": True})
+            return _json_response({"success": True})
         except ValueError as err:
-            return web.json_response(
+            return _json_response(
                 {"error": str(err)}, status=404
             )
 
@@ -1955,15 +2055,11 @@ class SmartHeatingAPIView(HomeAssistantView):
         Returns:
             JSON response with history settings
         """
-        from .const import DOMAIN, HISTORY_RECORD_INTERVAL_SECONDS
-        
         history_tracker = self.hass.data.get(DOMAIN, {}).get("history")
         if not history_tracker:
-            return web.json_response(
-                {"error": "History not available"}, status=503
-            )
+            return _error_response(_ERR_HISTORY_NOT_AVAILABLE, status=503)
         
-        return web.json_response({
+        return _json_response({
             "retention_days": history_tracker.get_retention_days(),
             "record_interval_seconds": HISTORY_RECORD_INTERVAL_SECONDS,
             "record_interval_minutes": HISTORY_RECORD_INTERVAL_SECONDS / 60
@@ -1979,20 +2075,14 @@ class SmartHeatingAPIView(HomeAssistantView):
         Returns:
             JSON response
         """
-        from .const import DOMAIN
-        
         retention_days = data.get("retention_days")
         if not retention_days:
-            return web.json_response(
-                {"error": "retention_days required"}, status=400
-            )
+            return _error_response(_ERR_RETENTION_DAYS_REQUIRED, status=400)
         
         try:
             history_tracker = self.hass.data.get(DOMAIN, {}).get("history")
             if not history_tracker:
-                return web.json_response(
-                    {"error": "History not available"}, status=503
-                )
+                return _error_response(_ERR_HISTORY_NOT_AVAILABLE, status=503)
             
             history_tracker.set_retention_days(int(retention_days))
             await history_tracker.async_save()
@@ -2000,12 +2090,12 @@ class SmartHeatingAPIView(HomeAssistantView):
             # Trigger cleanup if retention was reduced
             await history_tracker._async_cleanup_old_entries()
             
-            return web.json_response({
+            return _json_response({
                 "success": True,
                 "retention_days": history_tracker.get_retention_days()
             })
         except ValueError as err:
-            return web.json_response(
+            return _json_response(
                 {"error": str(err)}, status=400
             )
 
@@ -2024,9 +2114,7 @@ class SmartHeatingAPIView(HomeAssistantView):
         """
         hvac_mode = data.get("hvac_mode")
         if not hvac_mode:
-            return web.json_response(
-                {"error": "hvac_mode required"}, status=400
-            )
+            return _error_response(_ERR_HVAC_MODE_REQUIRED, status=400)
         
         try:
             area = self.area_manager.get_area(area_id)
@@ -2034,20 +2122,21 @@ class SmartHeatingAPIView(HomeAssistantView):
                 raise ValueError(f"Area {area_id} not found")
             
             area.hvac_mode = hvac_mode
-            await self.area_manager.async_save()
+            area.mark_changed()
+            self.area_manager.async_schedule_save()
             
             # Refresh coordinator
             entry_ids = [
                 key for key in self.hass.data[DOMAIN].keys()
-                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger"]
+                if key not in ["history", "climate_controller", "schedule_executor", "climate_unsub", "learning_engine", "area_logger", "flush"]
             ]
             if entry_ids:
                 coordinator = self.hass.data[DOMAIN][entry_ids[0]]
                 await coordinator.async_request_refresh()
             
-            return web.json_response({"success": True, "hvac_mode": hvac_mode})
+            return _json_response({"success": True, "hvac_mode": hvac_mode})
         except ValueError as err:
-            return web.json_response(
+            return _json_response(
                 {"error": str(err)}, status=400
             )
 
@@ -2069,7 +2158,7 @@ class SmartHeatingAPIView(HomeAssistantView):
             # Get area logger from hass data
             area_logger = self.hass.data[DOMAIN].get("area_logger")
             if not area_logger:
-                return web.json_response({"logs": []})
+                return _json_response({"logs": []})
             
             # Get logs
             logs = area_logger.get_logs(
@@ -2078,11 +2167,11 @@ class SmartHeatingAPIView(HomeAssistantView):
                 event_type=event_type
             )
             
-            return web.json_response({"logs": logs})
+            return _json_response({"logs": logs})
             
         except Exception as err:
             _LOGGER.error("Error getting logs for area %s: %s", area_id, err)
-            return web.json_response(
+            return _json_response(
                 {"error": str(err)}, status=500
             )
 
@@ -2101,6 +2190,8 @@ class SmartHeatingUIView(HomeAssistantView):
             hass: Home Assistant instance
         """
         self.hass = hass
+        self._html_bytes: bytes | None = None
+        self._html_etag: str | None = None
 
     async def get(self, request: web.Request) -> web.Response:
         """Serve the UI.
@@ -2111,24 +2202,31 @@ class SmartHeatingUIView(HomeAssistantView):
         Returns:
             HTML response with React app
         """
-        import os
-        
         # Path to the built frontend
         frontend_path = self.hass.config.path("custom_components/smart_heating/frontend/dist")
         index_path = os.path.join(frontend_path, "index.html")
         
         try:
-            async with aiofiles.open(index_path, "r", encoding="utf-8") as f:
-                html_content = await f.read()
+            if self._html_bytes is None:
+                # The build only changes on redeploy, so read and rewrite once
+                async with aiofiles.open(index_path, "r", encoding="utf-8") as f:
+                    html_content = await f.read()
+                
+                # Fix asset paths to be relative to our endpoint
+                html_content = html_content.replace('src="/', 'src="/smart_heating_static/')
+                html_content = html_content.replace('href="/', 'href="/smart_heating_static/')
+                
+                self._html_bytes = html_content.encode("utf-8")
+                self._html_etag = f'"{hashlib.sha1(self._html_bytes).hexdigest()}"'
             
-            # Fix asset paths to be relative to our endpoint
-            html_content = html_content.replace('src="/', 'src="/smart_heating_static/')
-            html_content = html_content.replace('href="/', 'href="/smart_heating_static/')
+            if request.headers.get("If-None-Match") == self._html_etag:
+                return web.Response(status=304, headers={"ETag": self._html_etag})
             
             return web.Response(
-                text=html_content,
+                body=self._html_bytes,
                 content_type="text/html",
-                charset="utf-8"
+                charset="utf-8",
+                headers={"ETag": self._html_etag},
             )
         except FileNotFoundError:
             _LOGGER.error("Frontend build not found at %s", frontend_path)
@@ -2153,6 +2251,12 @@ class SmartHeatingStaticView(HomeAssistantView):
             hass: Home Assistant instance
         """
         self.hass = hass
+        # Path to the built frontend, normalized once so the per-request
+        # containment check is a pure string comparison
+        self._frontend_path = os.path.abspath(
+            hass.config.path("custom_components/smart_heating/frontend/dist")
+        )
+        self._frontend_prefix = self._frontend_path + os.sep
 
     async def get(self, request: web.Request, filename: str) -> web.Response:
         """Serve static files.
@@ -2164,44 +2268,37 @@ class SmartHeatingStaticView(HomeAssistantView):
         Returns:
             File response
         """
-        import os
-        import mimetypes
-        
-        # Path to the built frontend
-        frontend_path = self.hass.config.path("custom_components/smart_heating/frontend/dist")
-        file_path = os.path.join(frontend_path, filename)
+        file_path = os.path.normpath(os.path.join(self._frontend_path, filename))
         
         # Security check - ensure file is within frontend directory
-        if not os.path.abspath(file_path).startswith(os.path.abspath(frontend_path)):
+        if not file_path.startswith(self._frontend_prefix):
             return web.Response(text="Forbidden", status=403)
         
-        try:
-            # Determine content type
-            content_type, _ = mimetypes.guess_type(filename)
-            if content_type is None:
-                content_type = "application/octet-stream"
-            
-            async with aiofiles.open(file_path, "rb") as f:
-                content = await f.read()
-            
-            return web.Response(
-                body=content,
-                content_type=content_type
-            )
-        except FileNotFoundError:
-            return web.Response(text="Not Found", status=404)
+        headers = {"Content-Type": _guess_content_type(os.path.splitext(filename)[1])}
+        if filename.startswith(_HASHED_ASSET_DIRS):
+            # Vite content-hashes these file names, so they never change
+            headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        
+        # Let aiohttp stream the file (sendfile where available) instead of
+        # buffering it in memory; it answers 404 itself if the file is missing
+        return web.FileResponse(file_path, headers=headers)
 
 
-async def setup_api(hass: HomeAssistant, area_manager: AreaManager) -> None:
+async def setup_api(
+    hass: HomeAssistant, entry: ConfigEntry, area_manager: AreaManager
+) -> None:
     """Set up the API.
     
     Args:
         hass: Home Assistant instance
+        entry: Config entry whose unload releases the API's listeners
         area_manager: Zone manager instance
     """
-    # Register API view
-    api_view = SmartHeatingAPIView(hass, area_manager)
-    hass.http.register_view(api_view)
+    # Register one view per API route so aiohttp's router does the matching
+    api = SmartHeatingAPIView(hass, area_manager)
+    entry.async_on_unload(api.async_unload)
+    for view in api.build_views():
+        hass.http.register_view(view)
     
     # Register UI view (no auth required for serving HTML)
     ui_view = SmartHeatingUIView(hass)
@@ -1,12 +1,13 @@
 """Area-specific logging for Smart Heating development."""
 import logging
-import json
 from datetime import datetime
 from typing import Any
 from pathlib import Path
 import asyncio
 from functools import partial
 
+import orjson
+
 from homeassistant.core import HomeAssistant
 
 _LOGGER = logging.getLogger(__name__)
@@ -101,8 +102,8 @@ class AreaLogger:
         
         def _write():
             try:
-                with open(log_file, 'a', encoding='utf-8') as f:
-                    f.write(json.dumps(entry) + '\n')
+                with open(log_file, 'ab') as f:
+                    f.write(orjson.dumps(entry) + b'\n')
             except Exception as err:
                 _LOGGER.error("Failed to write log for area %s: %s", area_id, err)
         
@@ -193,11 +194,11 @@ class AreaLogger:
         """
         logs = []
         try:
-            with open(log_file, 'r', encoding='utf-8') as f:
+            with open(log_file, 'rb') as f:
                 for line in f:
                     try:
-                        logs.append(json.loads(line.strip()))
-                    except json.JSONDecodeError:
+                        logs.append(orjson.loads(line))
+                    except orjson.JSONDecodeError:
                         continue
         except Exception as err:
             _LOGGER.error("Failed to read log file %s: %s", log_file, err)
@@ -1,9 +1,11 @@
 """Zone Manager for Smart Heating integration."""
 import logging
-from typing import Any
+import sys
+from types import MappingProxyType
+from typing import Any, Mapping
 from datetime import datetime, time, timedelta
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
 
 from .const import (
@@ -64,10 +66,78 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Delay (in seconds) used to coalesce bursts of saves into one storage write
+SAVE_DELAY = 1.0
+
+# Day names indexed by datetime.weekday()
+_DAY_NAMES = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+_ALL_DAYS_SET = frozenset(_DAY_NAMES)
+
+# Conversion between full day names (new format) and abbreviations (legacy)
+_DAY_ABBREVIATIONS = {
+    "Monday": "mon", "Tuesday": "tue", "Wednesday": "wed",
+    "Thursday": "thu", "Friday": "fri", "Saturday": "sat", "Sunday": "sun"
+}
+_DAY_FULL_NAMES = {v: k for k, v in _DAY_ABBREVIATIONS.items()}
+
+# Placeholder start time of schedules whose stored time cannot be parsed
+_MIDNIGHT = time(0, 0)
+
+
+def _parse_time(value: str | None) -> time | None:
+    """Parse a stored schedule time leniently.
+    
+    Accepts ISO times (07:00, 07:00:00) as well as an unpadded hour (7:00).
+    
+    Args:
+        value: Time string
+        
+    Returns:
+        Parsed time, or None if value is not a valid time
+    """
+    try:
+        return time.fromisoformat(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.strptime(value, "%H:%M").time()
+    except (TypeError, ValueError):
+        return None
+
+
+def validate_schedule_time(value: str) -> None:
+    """Validate a schedule time given by the user.
+    
+    Args:
+        value: Time string
+        
+    Raises:
+        ValueError: If value is not a time in HH:MM format
+    """
+    try:
+        datetime.strptime(value, "%H:%M")
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid time {value!r}, expected HH:MM") from None
+
 
 class Schedule:
     """Representation of a temperature schedule."""
 
+    __slots__ = (
+        "schedule_id",
+        "time",
+        "start_time",
+        "end_time",
+        "temperature",
+        "preset_mode",
+        "day",
+        "days",
+        "enabled",
+        "_time_obj",
+        "_days_set",
+        "_dict_cache",
+    )
+
     def __init__(
         self,
         schedule_id: str,
@@ -102,24 +172,42 @@ class Schedule:
         self.preset_mode = preset_mode
         
         # Convert between day formats
-        day_map = {
-            "Monday": "mon", "Tuesday": "tue", "Wednesday": "wed",
-            "Thursday": "thu", "Friday": "fri", "Saturday": "sat", "Sunday": "sun"
-        }
-        reverse_day_map = {v: k for k, v in day_map.items()}
-        
         if day:
             self.day = day
-            self.days = [day_map.get(day, "mon")]
+            self.days = (_DAY_ABBREVIATIONS.get(day, "mon"),)
         elif days:
-            self.days = days
+            # Interned names, sharing the canonical tuple for "every day"
+            self.days = tuple(sys.intern(d) for d in days)
+            if self.days == _DAY_NAMES:
+                self.days = _DAY_NAMES
             # Use first day for display
-            self.day = reverse_day_map.get(days[0], "Monday") if days else "Monday"
+            self.day = _DAY_FULL_NAMES.get(days[0], "Monday") if days else "Monday"
         else:
-            self.days = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+            self.days = _DAY_NAMES
             self.day = "Monday"
         
         self.enabled = enabled
+        
+        # Parsed forms used by is_active, computed once instead of per check;
+        # stored data may predate input validation, so a bad time disables the
+        # schedule instead of failing the whole load
+        self._time_obj = _parse_time(self.time)
+        if self._time_obj is None:
+            _LOGGER.warning(
+                "Schedule %s has invalid time %r, disabling it", schedule_id, self.time
+            )
+            self._time_obj = _MIDNIGHT
+            self.enabled = False
+        self._days_set = _ALL_DAYS_SET if self.days is _DAY_NAMES else frozenset(self.days)
+        self._dict_cache: dict[str, Any] | None = None
+
+    def mark_changed(self) -> None:
+        """Invalidate the cached storage dict.
+        
+        Call this after changing an attribute in place (e.g. enabled), together
+        with Area.mark_schedules_changed.
+        """
+        self._dict_cache = None
 
     def is_active(self, current_time: datetime) -> bool:
         """Check if schedule is active at given time.
@@ -134,20 +222,20 @@ class Schedule:
             return False
         
         # Check day of week
-        day_names = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
-        current_day = day_names[current_time.weekday()]
-        if current_day not in self.days:
+        if _DAY_NAMES[current_time.weekday()] not in self._days_set:
             return False
         
-        # Check time (within 30 minutes)
-        schedule_time = datetime.strptime(self.time, "%H:%M").time()
-        current_time_only = current_time.time()
-        
         # Simple time comparison - schedule is active from its time until next schedule
-        return current_time_only >= schedule_time
+        return current_time.time() >= self._time_obj
     
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary."""
+        """Convert to dictionary.
+        
+        The returned dict is cached until the schedule changes and must not
+        be modified by callers.
+        """
+        if self._dict_cache is not None:
+            return self._dict_cache
         result = {
             "id": self.schedule_id,
             "day": self.day,
@@ -159,8 +247,60 @@ class Schedule:
             result["temperature"] = self.temperature
         if self.preset_mode is not None:
             result["preset_mode"] = self.preset_mode
+        self._dict_cache = result
         return result
     
+    @classmethod
+    def _fast_init(
+        cls,
+        schedule_id: str,
+        day: str,
+        start_time: str,
+        end_time: str | None,
+        temperature: float | None,
+        enabled: bool,
+        preset_mode: str | None,
+    ) -> "Schedule":
+        """Create a schedule from stored new-format fields.
+        
+        Skips the legacy format conversion in __init__ and sets the
+        attributes directly, for bulk loading from storage.
+        
+        Args:
+            schedule_id: Unique identifier
+            day: Day name (Monday, Tuesday, etc.)
+            start_time: Start time in HH:MM format
+            end_time: End time in HH:MM format
+            temperature: Target temperature
+            enabled: Whether schedule is active
+            preset_mode: Preset mode name
+            
+        Returns:
+            Schedule instance
+        """
+        time_obj = _parse_time(start_time)
+        if time_obj is None:
+            # Let __init__ report and disable it
+            return cls(
+                schedule_id, start_time, temperature, enabled=enabled, day=day,
+                start_time=start_time, end_time=end_time, preset_mode=preset_mode,
+            )
+        days = (_DAY_ABBREVIATIONS.get(day, "mon"),)
+        schedule = cls.__new__(cls)
+        schedule.schedule_id = schedule_id
+        schedule.time = start_time
+        schedule.start_time = start_time
+        schedule.end_time = end_time or "23:59"
+        schedule.temperature = temperature
+        schedule.preset_mode = preset_mode
+        schedule.day = day
+        schedule.days = days
+        schedule.enabled = enabled
+        schedule._time_obj = time_obj
+        schedule._days_set = frozenset(days)
+        schedule._dict_cache = None
+        return schedule
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Schedule":
         """Create from dictionary."""
@@ -180,6 +320,62 @@ class Schedule:
 class Area:
     """Representation of a heating area."""
 
+    __slots__ = (
+        "_api_cache",
+        "_dict_cache",
+        "area_id",
+        "name",
+        "target_temperature",
+        "enabled",
+        "devices",
+        "_devices_by_type",
+        "_devices_version",
+        "schedules",
+        "_schedules_by_time",
+        "_schedules_version",
+        "_eff_cache",
+        "_schedule_lut",
+        "_schedule_lut_key",
+        "_night_boost_mask",
+        "_night_boost_mask_key",
+        "_current_temperature",
+        "_state",
+        "hidden",
+        "area_manager",
+        "night_boost_enabled",
+        "night_boost_offset",
+        "night_boost_start_time",
+        "night_boost_end_time",
+        "smart_night_boost_enabled",
+        "smart_night_boost_target_time",
+        "weather_entity_id",
+        "preset_mode",
+        "away_temp",
+        "eco_temp",
+        "comfort_temp",
+        "home_temp",
+        "sleep_temp",
+        "activity_temp",
+        "use_global_away",
+        "use_global_eco",
+        "use_global_comfort",
+        "use_global_home",
+        "use_global_sleep",
+        "use_global_activity",
+        "boost_mode_active",
+        "boost_duration",
+        "boost_temp",
+        "boost_end_time",
+        "hvac_mode",
+        "window_sensors",
+        "window_is_open",
+        "presence_sensors",
+        "presence_detected",
+        "use_global_presence",
+        "manual_override",
+        "shutdown_switches_when_idle",
+    )
+
     def __init__(
         self,
         area_id: str,
@@ -195,13 +391,34 @@ class Area:
             target_temperature: Target temperature for the area
             enabled: Whether the area is enabled
         """
+        self._api_cache: dict[str, Any] | None = None
+        self._dict_cache: dict[str, Any] | None = None
         self.area_id = area_id
         self.name = name
         self.target_temperature = target_temperature
         self.enabled = enabled
         self.devices: dict[str, dict[str, Any]] = {}
+        # Device IDs grouped by device type, kept in sync with self.devices
+        self._devices_by_type: dict[str, list[str]] = {}
+        # Bumped whenever the device index changes
+        self._devices_version = 0
         self.schedules: dict[str, Schedule] = {}
+        # Schedules ordered latest start time first, for active-schedule lookup
+        self._schedules_by_time: list[Schedule] = []
+        # Bumped whenever schedules change, invalidating the effective temp memo
+        self._schedules_version = 0
+        # (key, result) of the last get_effective_target_temperature computation
+        self._eff_cache: tuple | None = None
+        # Minute-of-day -> active schedule temperature for one weekday, and
+        # the (schedules version, weekday) it was built for
+        self._schedule_lut: list[float | None] = []
+        self._schedule_lut_key: tuple[int, int] | None = None
+        # Minute-of-day bitmask of the night boost period and the
+        # (start, end) times it was built from
+        self._night_boost_mask = 0
+        self._night_boost_mask_key: tuple[str, str] | None = None
         self._current_temperature: float | None = None
+        self._state: str | None = None  # Set by the climate controller
         self.hidden: bool = False  # Whether area is hidden from main view
         self.area_manager: "AreaManager | None" = None  # Reference to parent AreaManager
         
@@ -257,6 +474,16 @@ class Area:
         # Switch/pump control setting
         self.shutdown_switches_when_idle: bool = True  # Turn off switches/pumps when area not heating
 
+    def mark_changed(self) -> None:
+        """Invalidate the cached API and storage dicts.
+        
+        Call this after assigning a setting attribute directly (e.g.
+        target_temperature or hvac_mode). Runtime values such as state and
+        current_temperature are not cached and don't need it.
+        """
+        self._api_cache = None
+        self._dict_cache = None
+
     def add_device(self, device_id: str, device_type: str, mqtt_topic: str | None = None) -> None:
         """Add a device to the area.
         
@@ -265,11 +492,18 @@ class Area:
             device_type: Type of device (thermostat, temperature_sensor, etc.)
             mqtt_topic: MQTT topic for the device (optional)
         """
+        existing = self.devices.get(device_id)
+        if existing is None or existing["type"] != device_type:
+            if existing is not None:
+                self._devices_by_type[existing["type"]].remove(device_id)
+            self._devices_by_type.setdefault(device_type, []).append(device_id)
+            self._devices_version += 1
         self.devices[device_id] = {
             "type": device_type,
             "mqtt_topic": mqtt_topic,
             "entity_id": None,
         }
+        self._dict_cache = None
         _LOGGER.debug("Added device %s (type: %s) to area %s", device_id, device_type, self.area_id)
 
     def remove_device(self, device_id: str) -> None:
@@ -279,20 +513,44 @@ class Area:
             device_id: Unique identifier for the device
         """
         if device_id in self.devices:
-            del self.devices[device_id]
+            device = self.devices.pop(device_id)
+            self._devices_by_type[device["type"]].remove(device_id)
+            self._devices_version += 1
+            self._dict_cache = None
             _LOGGER.debug("Removed device %s from area %s", device_id, self.area_id)
 
+    def _index_devices(self) -> None:
+        """Rebuild the device type index after self.devices was replaced."""
+        self._devices_by_type = {}
+        for device_id, device in self.devices.items():
+            self._devices_by_type.setdefault(device["type"], []).append(device_id)
+        self._devices_version += 1
+
+    @property
+    def devices_version(self) -> int:
+        """Get a counter that changes whenever devices are added or removed.
+        
+        Returns:
+            Device index version
+        """
+        return self._devices_version
+
+    @property
+    def schedules_version(self) -> int:
+        """Get a counter that changes whenever the schedules change.
+        
+        Returns:
+            Schedule version
+        """
+        return self._schedules_version
+
     def get_temperature_sensors(self) -> list[str]:
         """Get all temperature sensor device IDs in the area.
         
         Returns:
             List of temperature sensor device IDs
         """
-        return [
-            device_id
-            for device_id, device in self.devices.items()
-            if device["type"] == DEVICE_TYPE_TEMPERATURE_SENSOR
-        ]
+        return list(self._devices_by_type.get(DEVICE_TYPE_TEMPERATURE_SENSOR, ()))
 
     def get_thermostats(self) -> list[str]:
         """Get all thermostat device IDs in the area.
@@ -300,11 +558,7 @@ class Area:
         Returns:
             List of thermostat device IDs
         """
-        return [
-            device_id
-            for device_id, device in self.devices.items()
-            if device["type"] == DEVICE_TYPE_THERMOSTAT
-        ]
+        return list(self._devices_by_type.get(DEVICE_TYPE_THERMOSTAT, ()))
 
     def get_opentherm_gateways(self) -> list[str]:
         """Get all OpenTherm gateway device IDs in the area.
@@ -312,11 +566,7 @@ class Area:
         Returns:
             List of OpenTherm gateway device IDs
         """
-        return [
-            device_id
-            for device_id, device in self.devices.items()
-            if device["type"] == DEVICE_TYPE_OPENTHERM_GATEWAY
-        ]
+        return list(self._devices_by_type.get(DEVICE_TYPE_OPENTHERM_GATEWAY, ()))
 
     def get_switches(self) -> list[str]:
         """Get all switch device IDs in the area (pumps, relays, etc.).
@@ -324,11 +574,7 @@ class Area:
         Returns:
             List of switch device IDs
         """
-        return [
-            device_id
-            for device_id, device in self.devices.items()
-            if device["type"] == DEVICE_TYPE_SWITCH
-        ]
+        return list(self._devices_by_type.get(DEVICE_TYPE_SWITCH, ()))
 
     def get_valves(self) -> list[str]:
         """Get all valve device IDs in the area (TRVs, motorized valves).
@@ -336,11 +582,7 @@ class Area:
         Returns:
             List of valve device IDs
         """
-        return [
-            device_id
-            for device_id, device in self.devices.items()
-            if device["type"] == DEVICE_TYPE_VALVE
-        ]
+        return list(self._devices_by_type.get(DEVICE_TYPE_VALVE, ()))
 
     def add_window_sensor(
         self, 
@@ -369,6 +611,7 @@ class Area:
             sensor_config["temp_drop"] = temp_drop if temp_drop is not None else DEFAULT_WINDOW_OPEN_TEMP_DROP
             
         self.window_sensors.append(sensor_config)
+        self.mark_changed()
         _LOGGER.debug("Added window sensor %s to area %s with action %s", entity_id, self.area_id, action_when_open)
 
     def remove_window_sensor(self, entity_id: str) -> None:
@@ -378,6 +621,7 @@ class Area:
             entity_id: Entity ID of the window/door sensor
         """
         self.window_sensors = [s for s in self.window_sensors if s.get("entity_id") != entity_id]
+        self.mark_changed()
         _LOGGER.debug("Removed window sensor %s from area %s", entity_id, self.area_id)
 
     def add_presence_sensor(
@@ -404,6 +648,7 @@ class Area:
         }
             
         self.presence_sensors.append(sensor_config)
+        self.mark_changed()
         _LOGGER.debug("Added presence sensor %s to area %s (controls preset mode)", entity_id, self.area_id)
 
     def remove_presence_sensor(self, entity_id: str) -> None:
@@ -413,6 +658,7 @@ class Area:
             entity_id: Entity ID of the presence sensor
         """
         self.presence_sensors = [s for s in self.presence_sensors if s.get("entity_id") != entity_id]
+        self.mark_changed()
         _LOGGER.debug("Removed presence sensor %s from area %s", entity_id, self.area_id)
 
     def get_preset_temperature(self) -> float:
@@ -467,6 +713,7 @@ class Area:
         old_mode = self.preset_mode
         old_effective = self.get_effective_target_temperature()
         self.preset_mode = preset_mode
+        self.mark_changed()
         new_effective = self.get_effective_target_temperature()
         
         _LOGGER.warning(
@@ -487,6 +734,7 @@ class Area:
             self.boost_temp = temp
         self.boost_end_time = datetime.now() + timedelta(minutes=duration)
         self.preset_mode = PRESET_BOOST
+        self.mark_changed()
         _LOGGER.info("Activated boost mode for area %s: %d minutes at %.1f°C", 
                      self.area_id, duration, self.boost_temp)
 
@@ -496,6 +744,7 @@ class Area:
             self.boost_mode_active = False
             self.boost_end_time = None
             self.preset_mode = PRESET_NONE
+            self.mark_changed()
             _LOGGER.info("Cancelled boost mode for area %s", self.area_id)
 
     def check_boost_expiry(self) -> bool:
@@ -517,6 +766,7 @@ class Area:
             schedule: Schedule instance
         """
         self.schedules[schedule.schedule_id] = schedule
+        self._sort_schedules()
         _LOGGER.debug("Added schedule %s to area %s", schedule.schedule_id, self.area_id)
 
     def remove_schedule(self, schedule_id: str) -> None:
@@ -527,8 +777,28 @@ class Area:
         """
         if schedule_id in self.schedules:
             del self.schedules[schedule_id]
+            self._sort_schedules()
             _LOGGER.debug("Removed schedule %s from area %s", schedule_id, self.area_id)
 
+    def _sort_schedules(self) -> None:
+        """Rebuild the schedule list ordered by start time, latest first.
+        
+        The sort is stable, so schedules with the same start time stay in
+        insertion order and the first-inserted one wins in lookups.
+        """
+        self._schedules_by_time = sorted(
+            self.schedules.values(), key=lambda s: s._time_obj, reverse=True
+        )
+        self.mark_schedules_changed()
+
+    def mark_schedules_changed(self) -> None:
+        """Invalidate results derived from the schedules.
+        
+        Call this after mutating a schedule in place (e.g. toggling enabled).
+        """
+        self._schedules_version += 1
+        self._dict_cache = None
+
     def get_active_schedule_temperature(self, current_time: datetime | None = None) -> float | None:
         """Get the temperature from the currently active schedule.
         
@@ -541,18 +811,99 @@ class Area:
         if current_time is None:
             current_time = datetime.now()
         
-        # Find all active schedules and get the latest one
-        active_schedules = [
-            s for s in self.schedules.values()
-            if s.is_active(current_time)
-        ]
+        key = (self._schedules_version, current_time.weekday())
+        if key != self._schedule_lut_key:
+            self._schedule_lut = self._build_schedule_lut(key[1])
+            self._schedule_lut_key = key
+        return self._schedule_lut[current_time.hour * 60 + current_time.minute]
+
+    def _build_schedule_lut(self, weekday: int) -> list[float | None]:
+        """Build the minute-of-day lookup table of active schedule temperatures.
+        
+        Schedule start times have minute resolution, so the active schedule
+        can only change on a minute boundary.
+        
+        Args:
+            weekday: Day of week (0 = Monday)
+            
+        Returns:
+            List of 1440 temperatures (None where no schedule is active)
+        """
+        day_name = _DAY_NAMES[weekday]
+        lut: list[float | None] = [None] * 1440
+        # Schedules are ordered latest first; each one is active from its
+        # start until the start of the next later schedule of the day. Of
+        # several with the same start, only the first fills the range (start
+        # is then no longer below end), so insertion order decides ties
+        end = 1440
+        for schedule in self._schedules_by_time:
+            if not schedule.enabled or day_name not in schedule._days_set:
+                continue
+            start = schedule._time_obj.hour * 60 + schedule._time_obj.minute
+            if start < end:
+                lut[start:end] = [schedule.temperature] * (end - start)
+                end = start
+        return lut
+
+    def get_minutes_to_next_transition(self, current_time: datetime) -> int:
+        """Get the minutes until the next schedule or night boost boundary.
+        
+        Without a state change, the effective target can only change at one
+        of these boundaries or at midnight.
         
-        if not active_schedules:
-            return None
+        Args:
+            current_time: Current time
+            
+        Returns:
+            Minutes from the start of the current minute to the next boundary
+        """
+        minute = current_time.hour * 60 + current_time.minute
+        day_name = _DAY_NAMES[current_time.weekday()]
+        times = []
+        for schedule in self._schedules_by_time:
+            if schedule.enabled and day_name in schedule._days_set:
+                times.append(schedule.start_time)
+                times.append(schedule.end_time)
+        if self.night_boost_enabled:
+            times.append(self.night_boost_start_time)
+            times.append(self.night_boost_end_time)
+        
+        nearest = 1440
+        for value in times:
+            parsed = _parse_time(value)
+            if parsed is None:
+                continue
+            boundary = parsed.hour * 60 + parsed.minute
+            if minute < boundary < nearest:
+                nearest = boundary
+        return nearest - minute
+
+    def _get_night_boost_mask(self) -> int:
+        """Get the night boost period as a minute-of-day bitmask.
         
-        # Sort by time and get the latest
-        active_schedules.sort(key=lambda s: s.time, reverse=True)
-        return active_schedules[0].temperature
+        Bit N is set when minute N of the day (hour * 60 + minute) falls in
+        the period. The mask is rebuilt only when the start or end time changes.
+        
+        Returns:
+            Bitmask covering the 1440 minutes of a day
+        """
+        key = (self.night_boost_start_time, self.night_boost_end_time)
+        if key != self._night_boost_mask_key:
+            start_hour, start_min = map(int, key[0].split(':'))
+            end_hour, end_min = map(int, key[1].split(':'))
+            start_minutes = start_hour * 60 + start_min
+            end_minutes = end_hour * 60 + end_min
+            
+            if start_minutes <= end_minutes:
+                # Normal period (e.g., 08:00-18:00)
+                mask = (1 << end_minutes) - (1 << start_minutes)
+            else:
+                # Period crosses midnight (e.g., 22:00-06:00)
+                mask = ((1 << 1440) - (1 << start_minutes)) | ((1 << end_minutes) - 1)
+            
+            self._night_boost_mask = mask
+            self._night_boost_mask_key = key
+        return self._night_boost_mask
 
     def get_effective_target_temperature(self, current_time: datetime | None = None) -> float:
         """Get the effective target temperature considering all factors.
@@ -595,8 +946,28 @@ class Area:
                 # "none" action means no temperature change
         
         # Priority 3: Preset mode temperature
+        preset_target = None
         if self.preset_mode != PRESET_NONE and self.preset_mode != PRESET_BOOST:
-            target = self.get_preset_temperature()
+            preset_target = self.get_preset_temperature()
+        
+        # Schedule lookup and night boost only change per minute, so reuse the
+        # last result while none of their inputs have changed
+        cache_key = (
+            # Minute number since 0001-01-01, cheaper than a truncated datetime
+            current_time.toordinal() * 1440 + current_time.hour * 60 + current_time.minute,
+            self.target_temperature,
+            preset_target,
+            self._schedules_version,
+            self.night_boost_enabled,
+            self.night_boost_offset,
+            self.night_boost_start_time,
+            self.night_boost_end_time,
+        )
+        if self._eff_cache is not None and self._eff_cache[0] == cache_key:
+            return self._eff_cache[1]
+        
+        if preset_target is not None:
+            target = preset_target
             source = f"preset:{self.preset_mode}"
         else:
             # Priority 4: Schedule temperature (if available)
@@ -609,32 +980,22 @@ class Area:
                 source = "schedule"
         
         # Log what we're starting with for debugging
-        _LOGGER.debug(
-            "Effective temp calculation for %s: source=%s, target=%.1f°C",
-            self.area_id, source, target
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Effective temp calculation for %s: source=%s, target=%.1f°C",
+                self.area_id, source, target
+            )
         
         # Priority 6: Apply night boost if enabled (additive)
         if self.night_boost_enabled:
-            # Parse start and end times
-            start_hour, start_min = map(int, self.night_boost_start_time.split(':'))
-            end_hour, end_min = map(int, self.night_boost_end_time.split(':'))
             current_hour = current_time.hour
             current_min = current_time.minute
             
-            # Check if current time is within night boost period
-            # Handle period that crosses midnight
-            start_minutes = start_hour * 60 + start_min
-            end_minutes = end_hour * 60 + end_min
-            current_minutes = current_hour * 60 + current_min
-            
-            is_active = False
-            if start_minutes <= end_minutes:
-                # Normal period (e.g., 08:00-18:00)
-                is_active = start_minutes <= current_minutes < end_minutes
-            else:
-                # Period crosses midnight (e.g., 22:00-06:00)
-                is_active = current_minutes >= start_minutes or current_minutes < end_minutes
+            # Check if current time is within night boost period; the mask
+            # already accounts for periods that cross midnight
+            is_active = bool(
+                (self._get_night_boost_mask() >> (current_hour * 60 + current_min)) & 1
+            )
             
             # Important: Only apply night boost if we're NOT in a schedule period
             # This allows schedules (like "sleep" preset from 22:00-06:30) to take precedence
@@ -642,12 +1003,13 @@ class Area:
             in_schedule = self.get_active_schedule_temperature(current_time) is not None
             
             # Debug logging for troubleshooting
-            _LOGGER.debug(
-                "Night boost check for %s at %02d:%02d: period=%s-%s, is_active=%s, in_schedule=%s",
-                self.area_id, current_hour, current_min,
-                self.night_boost_start_time, self.night_boost_end_time,
-                is_active, in_schedule
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Night boost check for %s at %02d:%02d: period=%s-%s, is_active=%s, in_schedule=%s",
+                    self.area_id, current_hour, current_min,
+                    self.night_boost_start_time, self.night_boost_end_time,
+                    is_active, in_schedule
+                )
             
             if is_active and not in_schedule:
                 old_target = target
@@ -677,6 +1039,7 @@ class Area:
         # Note: Presence sensor actions are now handled by switching preset modes
         # (see climate_controller.py) rather than adjusting temperature directly
         
+        self._eff_cache = (cache_key, target)
         return target
 
     @property
@@ -709,14 +1072,15 @@ class Area:
         
         # Check if any thermostat is actively heating
         # This will be updated by the climate controller
-        if hasattr(self, '_state'):
-            return self._state
+        state = self._state
+        if state is not None:
+            return state
         
         # Fallback to temperature-based state
-        if self._current_temperature is not None and self.target_temperature is not None:
-            if self._current_temperature < self.target_temperature - 0.5:
-                return STATE_HEATING
-        
+        current = self._current_temperature
+        target = self.target_temperature
+        if current is not None and target is not None and current < target - 0.5:
+            return STATE_HEATING
         return STATE_IDLE
     
     @state.setter
@@ -728,9 +1092,78 @@ class Area:
         """
         self._state = value
 
+    def to_api_dict(self) -> dict[str, Any]:
+        """Get the area settings as served by the API.
+        
+        The dictionary is cached until a setting changes. Runtime values
+        (state, temperatures), devices and schedules are not included; callers
+        add them per request and must not mutate the returned dictionary.
+        
+        Returns:
+            Dictionary of area settings
+        """
+        if self._api_cache is None:
+            self._api_cache = {
+                "id": self.area_id,
+                "name": self.name,
+                "enabled": self.enabled,
+                "hidden": self.hidden,
+                "target_temperature": self.target_temperature,
+                # Night boost
+                "night_boost_enabled": self.night_boost_enabled,
+                "night_boost_offset": self.night_boost_offset,
+                "night_boost_start_time": self.night_boost_start_time,
+                "night_boost_end_time": self.night_boost_end_time,
+                # Smart night boost
+                "smart_night_boost_enabled": self.smart_night_boost_enabled,
+                "smart_night_boost_target_time": self.smart_night_boost_target_time,
+                "weather_entity_id": self.weather_entity_id,
+                # Preset modes
+                "preset_mode": self.preset_mode,
+                "away_temp": self.away_temp,
+                "eco_temp": self.eco_temp,
+                "comfort_temp": self.comfort_temp,
+                "home_temp": self.home_temp,
+                "sleep_temp": self.sleep_temp,
+                "activity_temp": self.activity_temp,
+                # Global preset flags
+                "use_global_away": self.use_global_away,
+                "use_global_eco": self.use_global_eco,
+                "use_global_comfort": self.use_global_comfort,
+                "use_global_home": self.use_global_home,
+                "use_global_sleep": self.use_global_sleep,
+                "use_global_activity": self.use_global_activity,
+                # Boost mode
+                "boost_mode_active": self.boost_mode_active,
+                "boost_temp": self.boost_temp,
+                "boost_duration": self.boost_duration,
+                # HVAC mode
+                "hvac_mode": self.hvac_mode,
+                # Manual override
+                "manual_override": self.manual_override,
+                # Sensors
+                "window_sensors": self.window_sensors,
+                "presence_sensors": self.presence_sensors,
+                "use_global_presence": self.use_global_presence,
+            }
+        return self._api_cache
+
     def to_dict(self) -> dict[str, Any]:
         """Convert area to dictionary for storage.
         
+        The result is cached until a persisted attribute, device or schedule
+        changes, so repeated saves only rebuild areas that were modified.
+        
+        Returns:
+            Dictionary representation of the area
+        """
+        if self._dict_cache is None:
+            self._dict_cache = self._build_dict()
+        return self._dict_cache
+
+    def _build_dict(self) -> dict[str, Any]:
+        """Build the storage dictionary for the area.
+        
         Returns:
             Dictionary representation of the area
         """
@@ -797,6 +1230,7 @@ class Area:
             enabled=data.get(ATTR_ENABLED, True),
         )
         area.devices = data.get(ATTR_DEVICES, {})
+        area._index_devices()
         area.hidden = data.get("hidden", False)
         area.manual_override = data.get("manual_override", False)
         area.shutdown_switches_when_idle = data.get("shutdown_switches_when_idle", True)
@@ -876,10 +1310,26 @@ class Area:
         # Global presence flag (default to False for backward compatibility)
         area.use_global_presence = data.get("use_global_presence", False)
         
-        # Load schedules
+        # Load schedules, taking the fast path for the current storage format
+        schedules = area.schedules
+        fast_init = Schedule._fast_init
         for schedule_data in data.get("schedules", []):
-            schedule = Schedule.from_dict(schedule_data)
-            area.schedules[schedule.schedule_id] = schedule
+            day = schedule_data.get("day")
+            start_time = schedule_data.get("start_time")
+            if day and start_time:
+                schedule = fast_init(
+                    schedule_data["id"],
+                    day,
+                    start_time,
+                    schedule_data.get("end_time"),
+                    schedule_data.get("temperature"),
+                    schedule_data.get("enabled", True),
+                    schedule_data.get("preset_mode"),
+                )
+            else:
+                schedule = Schedule.from_dict(schedule_data)
+            schedules[schedule.schedule_id] = schedule
+        area._sort_schedules()
         
         return area
 
@@ -895,8 +1345,17 @@ class AreaManager:
         """
         self.hass = hass
         self.areas: dict[str, Area] = {}
+        # Read-only live view of self.areas handed out by get_all_areas
+        self._areas_view = MappingProxyType(self.areas)
         self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
         
+        # Inverted index: device_id -> ids of the areas it is assigned to
+        self._device_areas: dict[str, list[str]] = {}
+        
+        # Snapshot of the last written payload, used to skip no-op saves
+        self._saved_area_dicts: list[dict[str, Any]] | None = None
+        self._saved_globals: dict[str, Any] | None = None
+        
         # Global OpenTherm gateway configuration
         self.opentherm_gateway_id: str | None = None
         self.opentherm_enabled: bool = False
@@ -959,14 +1418,75 @@ class AreaManager:
                     area = Area.from_dict(area_data)
                     area.area_manager = self  # Store reference to area_manager
                     self.areas[area.area_id] = area
+                    for device_id in area.devices:
+                        self._device_areas.setdefault(device_id, []).append(area.area_id)
                 _LOGGER.info("Loaded %d areas from storage", len(self.areas))
         else:
             _LOGGER.debug("No areas found in storage")
 
     async def async_save(self) -> None:
-        """Save areas to storage."""
+        """Save areas to storage, skipping the write if nothing changed."""
+        data = self._data_to_save()
+        if self._is_saved(data):
+            _LOGGER.debug("Areas and global config unchanged, skipping save")
+            return
         _LOGGER.debug("Saving areas to storage")
-        data = {
+        await self._store.async_save(data)
+        self._mark_saved(data)
+        _LOGGER.info("Saved %d areas and global config to storage", len(self.areas))
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule a delayed save, coalescing repeated calls into one write.
+        
+        The pending write is flushed by Home Assistant on shutdown and
+        superseded by any direct async_save call.
+        """
+        # Not marked as saved: the Store writes in the background and a failed
+        # write must not make later async_save calls skip the same data
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _is_saved(self, data: dict[str, Any]) -> bool:
+        """Check whether data matches the last written payload.
+        
+        Area dicts are cached until the area changes, so an unchanged area
+        yields the very same dict object and identity is enough.
+        
+        Args:
+            data: Payload built by _data_to_save
+            
+        Returns:
+            True if writing data would not change the stored state
+        """
+        saved_areas = self._saved_area_dicts
+        areas = data["areas"]
+        if saved_areas is None or len(saved_areas) != len(areas):
+            return False
+        if any(a is not b for a, b in zip(areas, saved_areas)):
+            return False
+        return all(
+            self._saved_globals.get(key) == value
+            for key, value in data.items()
+            if key != "areas"
+        )
+
+    def _mark_saved(self, data: dict[str, Any]) -> None:
+        """Remember data as the last written payload.
+        
+        Args:
+            data: Payload built by _data_to_save
+        """
+        self._saved_area_dicts = data["areas"]
+        self._saved_globals = {key: value for key, value in data.items() if key != "areas"}
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Build the data to persist.
+        
+        Returns:
+            Serializable global configuration and areas
+        """
+        return {
             "opentherm_gateway_id": self.opentherm_gateway_id,
             "opentherm_enabled": self.opentherm_enabled,
             "trv_heating_temp": self.trv_heating_temp,
@@ -984,8 +1504,6 @@ class AreaManager:
             "global_presence_sensors": self.global_presence_sensors,
             "areas": [area.to_dict() for area in self.areas.values()]
         }
-        await self._store.async_save(data)
-        _LOGGER.info("Saved %d areas and global config to storage", len(self.areas))
 
     def get_area(self, area_id: str) -> Area | None:
         """Get a area by ID.
@@ -998,13 +1516,24 @@ class AreaManager:
         """
         return self.areas.get(area_id)
 
-    def get_all_areas(self) -> dict[str, Area]:
+    def get_all_areas(self) -> Mapping[str, Area]:
         """Get all areas.
         
         Returns:
-            Dictionary of all areas
+            Read-only view of all areas (reflects later changes)
         """
-        return self.areas
+        return self._areas_view
+
+    def get_device_areas(self, device_id: str) -> list[str]:
+        """Get the areas a device is assigned to.
+        
+        Args:
+            device_id: Device identifier
+            
+        Returns:
+            List of area identifiers (empty if the device is unassigned)
+        """
+        return list(self._device_areas.get(device_id, ()))
 
     def add_device_to_area(
         self,
@@ -1012,7 +1541,7 @@ class AreaManager:
         device_id: str,
         device_type: str,
         mqtt_topic: str | None = None,
-    ) -> None:
+    ) -> bool:
         """Add a device to a area.
         
         Args:
@@ -1021,30 +1550,54 @@ class AreaManager:
             device_type: Type of device
             mqtt_topic: MQTT topic for the device
             
+        Returns:
+            True if the area changed, False if the device was already assigned
+            
         Raises:
             ValueError: If area does not exist
         """
-        area = self.get_area(area_id)
-        if area is None:
-            raise ValueError(f"Area {area_id} does not exist")
+        try:
+            area = self.areas[area_id]
+        except KeyError:
+            raise ValueError(f"Area {area_id} does not exist") from None
+        
+        existing = area.devices.get(device_id)
+        if existing and existing["type"] == device_type and existing["mqtt_topic"] == mqtt_topic:
+            return False
         
+        if existing is None:
+            self._device_areas.setdefault(device_id, []).append(area_id)
         area.add_device(device_id, device_type, mqtt_topic)
+        return True
 
-    def remove_device_from_area(self, area_id: str, device_id: str) -> None:
+    def remove_device_from_area(self, area_id: str, device_id: str) -> bool:
         """Remove a device from a area.
         
         Args:
             area_id: Zone identifier
             device_id: Device identifier
             
+        Returns:
+            True if the device was removed, False if it was not assigned
+            
         Raises:
             ValueError: If area does not exist
         """
-        area = self.get_area(area_id)
-        if area is None:
-            raise ValueError(f"Area {area_id} does not exist")
+        try:
+            area = self.areas[area_id]
+        except KeyError:
+            raise ValueError(f"Area {area_id} does not exist") from None
+        
+        if device_id not in area.devices:
+            return False
         
         area.remove_device(device_id)
+        device_areas = self._device_areas.get(device_id)
+        if device_areas and area_id in device_areas:
+            device_areas.remove(area_id)
+            if not device_areas:
+                del self._device_areas[device_id]
+        return True
 
     def update_area_temperature(self, area_id: str, temperature: float) -> None:
         """Update the current temperature of a area.
@@ -1056,65 +1609,93 @@ class AreaManager:
         Raises:
             ValueError: If area does not exist
         """
-        area = self.get_area(area_id)
-        if area is None:
-            raise ValueError(f"Area {area_id} does not exist")
+        try:
+            area = self.areas[area_id]
+        except KeyError:
+            raise ValueError(f"Area {area_id} does not exist") from None
         
         area.current_temperature = temperature
         _LOGGER.debug("Updated area %s temperature to %.1f°C", area_id, temperature)
 
-    def set_area_target_temperature(self, area_id: str, temperature: float) -> None:
+    def set_area_target_temperature(self, area_id: str, temperature: float) -> bool:
         """Set the target temperature of a area.
         
         Args:
             area_id: Zone identifier
             temperature: Target temperature
             
+        Returns:
+            True if the target temperature changed
+            
         Raises:
             ValueError: If area does not exist
         """
-        area = self.get_area(area_id)
-        if area is None:
-            raise ValueError(f"Area {area_id} does not exist")
+        try:
+            area = self.areas[area_id]
+        except KeyError:
+            raise ValueError(f"Area {area_id} does not exist") from None
         
         old_temp = area.target_temperature
+        if old_temp == temperature:
+            return False
+        
         area.target_temperature = temperature
+        area.mark_changed()
         _LOGGER.warning(
             "TARGET TEMP CHANGE for %s: %.1f°C → %.1f°C (preset: %s)",
             area_id, old_temp, temperature, area.preset_mode
         )
+        return True
 
-    def enable_area(self, area_id: str) -> None:
+    def enable_area(self, area_id: str) -> bool:
         """Enable a area.
         
         Args:
             area_id: Zone identifier
             
+        Returns:
+            True if the area was not already enabled
+            
         Raises:
             ValueError: If area does not exist
         """
-        area = self.get_area(area_id)
-        if area is None:
-            raise ValueError(f"Area {area_id} does not exist")
+        try:
+            area = self.areas[area_id]
+        except KeyError:
+            raise ValueError(f"Area {area_id} does not exist") from None
+        
+        if area.enabled:
+            return False
         
         area.enabled = True
+        area.mark_changed()
         _LOGGER.info("Enabled area %s", area_id)
+        return True
 
-    def disable_area(self, area_id: str) -> None:
+    def disable_area(self, area_id: str) -> bool:
         """Disable a area.
         
         Args:
             area_id: Zone identifier
             
+        Returns:
+            True if the area was not already disabled
+            
         Raises:
             ValueError: If area does not exist
         """
-        area = self.get_area(area_id)
-        if area is None:
-            raise ValueError(f"Area {area_id} does not exist")
+        try:
+            area = self.areas[area_id]
+        except KeyError:
+            raise ValueError(f"Area {area_id} does not exist") from None
+        
+        if not area.enabled:
+            return False
         
         area.enabled = False
+        area.mark_changed()
         _LOGGER.info("Disabled area %s", area_id)
+        return True
 
     def add_schedule_to_area(
         self, 
@@ -1137,33 +1718,43 @@ class AreaManager:
             Created schedule
             
         Raises:
-            ValueError: If area does not exist
+            ValueError: If area does not exist or time is invalid
         """
-        area = self.get_area(area_id)
-        if area is None:
-            raise ValueError(f"Area {area_id} does not exist")
+        try:
+            area = self.areas[area_id]
+        except KeyError:
+            raise ValueError(f"Area {area_id} does not exist") from None
         
+        validate_schedule_time(time)
         schedule = Schedule(schedule_id, time, temperature, days)
         area.add_schedule(schedule)
         _LOGGER.info("Added schedule %s to area %s", schedule_id, area_id)
         return schedule
 
-    def remove_schedule_from_area(self, area_id: str, schedule_id: str) -> None:
+    def remove_schedule_from_area(self, area_id: str, schedule_id: str) -> bool:
         """Remove a schedule from an area.
         
         Args:
             area_id: Area identifier
             schedule_id: Schedule identifier
             
+        Returns:
+            True if the schedule was removed, False if it did not exist
+            
         Raises:
             ValueError: If area does not exist
         """
-        area = self.get_area(area_id)
-        if area is None:
-            raise ValueError(f"Area {area_id} does not exist")
+        try:
+            area = self.areas[area_id]
+        except KeyError:
+            raise ValueError(f"Area {area_id} does not exist") from None
+        
+        if schedule_id not in area.schedules:
+            return False
         
         area.remove_schedule(schedule_id)
         _LOGGER.info("Removed schedule %s from area %s", schedule_id, area_id)
+        return True
 
     def set_opentherm_gateway(self, gateway_id: str | None, enabled: bool = True) -> None:
         """Set the global OpenTherm gateway.
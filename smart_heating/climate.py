@@ -135,8 +135,8 @@ class AreaClimate(CoordinatorEntity, ClimateEntity):
             self._area.area_id, temperature
         )
         
-        # Save to storage
-        await self.coordinator.area_manager.async_save()
+        # Save to storage (delayed, so bursts of changes share one write)
+        self.coordinator.area_manager.async_schedule_save()
         
         # Request coordinator refresh
         await self.coordinator.async_request_refresh()
@@ -154,8 +154,8 @@ class AreaClimate(CoordinatorEntity, ClimateEntity):
         elif hvac_mode == HVACMode.OFF:
             self.coordinator.area_manager.disable_area(self._area.area_id)
         
-        # Save to storage
-        await self.coordinator.area_manager.async_save()
+        # Save to storage (delayed, so bursts of changes share one write)
+        self.coordinator.area_manager.async_schedule_save()
         
         # Request coordinator refresh
         await self.coordinator.async_request_refresh()
@@ -1,33 +1,86 @@
 """Climate controller for Smart Heating."""
+import asyncio
 import logging
+import math
+import time
 from datetime import datetime
 from typing import Any
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.const import (
     ATTR_TEMPERATURE,
     SERVICE_TURN_OFF,
     SERVICE_TURN_ON,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
 )
 from homeassistant.components.climate.const import (
     DOMAIN as CLIMATE_DOMAIN,
     SERVICE_SET_TEMPERATURE,
 )
+from homeassistant.helpers.event import async_track_state_change_event
 
 from .area_manager import AreaManager, Area
 from .const import (
+    CLIMATE_UPDATE_INTERVAL,
+    DEVICE_COMMAND_REFRESH_SECONDS,
     DEVICE_TYPE_THERMOSTAT,
     DEVICE_TYPE_TEMPERATURE_SENSOR,
     DEVICE_TYPE_SWITCH,
     DEVICE_TYPE_VALVE,
+    DOMAIN,
+    OPENTHERM_MAX_SETPOINT,
+    OPENTHERM_SETPOINT_OVERHEAD,
+    STEADY_STATE_MAX_CYCLES,
+    STEADY_STATE_MAX_DRIFT,
+    ValveControl,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Fahrenheit unit spellings and the precomputed °F -> °C scale factor
+_FAHRENHEIT_UNITS = frozenset(("°F", "F"))
+_F_TO_C = 5 / 9
+
+# States that carry no usable reading
+_INVALID_STATES = frozenset((STATE_UNKNOWN, STATE_UNAVAILABLE))
+
+# Length of one periodic control tick
+_TICK_SECONDS = CLIMATE_UPDATE_INTERVAL.total_seconds()
+
 
 class ClimateController:
     """Control heating based on area settings and schedules."""
 
+    __slots__ = (
+        "hass",
+        "area_manager",
+        "learning_engine",
+        "area_logger",
+        "_hysteresis",
+        "_record_counter",
+        "_device_capabilities",
+        "_area_heating_events",
+        "_last_set_temperatures",
+        "_last_commands",
+        "_call_data",
+        "_temperature_sources",
+        "_temperature_sources_key",
+        "_sensor_areas",
+        "_thermostat_areas",
+        "_sensor_temps",
+        "_thermostat_temps",
+        "_dirty_temperature_areas",
+        "_unsub_temperature_listener",
+        "_control_lock",
+        "_control_requests",
+        "_control_completed",
+        "_last_control_inputs",
+        "_last_temps",
+        "_steady_level",
+        "_steady_skips",
+    )
+
     def __init__(self, hass: HomeAssistant, area_manager: AreaManager, learning_engine=None) -> None:
         """Initialize the climate controller.
         
@@ -39,11 +92,157 @@ class ClimateController:
         self.hass = hass
         self.area_manager = area_manager
         self.learning_engine = learning_engine
+        self.area_logger = None  # Set by the integration after creation
         self._hysteresis = 0.5  # Temperature hysteresis in °C
         self._record_counter = 0  # Counter for history recording
         self._device_capabilities = {}  # Cache for device capabilities
         self._area_heating_events = {}  # Track active heating events per area
         self._last_set_temperatures = {}  # Cache last set temperature per thermostat to avoid unnecessary API calls
+        self._last_commands = {}  # entity_id -> (command, monotonic time sent) for switches, valves and the gateway
+        self._call_data = {}  # (domain, service, *entity_ids) -> reusable service data dict
+        self._temperature_sources = []  # Flat per-area sensor lists, see _get_temperature_sources
+        self._temperature_sources_key = None  # (area_id, area, devices_version) the list was built from
+        self._sensor_areas = {}  # Temperature sensor ID -> IDs of the areas using it
+        self._thermostat_areas = {}  # Thermostat ID -> IDs of the areas using it
+        self._sensor_temps = {}  # Latest valid reading (°C) per temperature sensor
+        self._thermostat_temps = {}  # Latest valid current_temperature (°C) per thermostat
+        self._dirty_temperature_areas = set()  # Areas whose sources changed since the last update
+        self._unsub_temperature_listener = None
+        self._control_lock = asyncio.Lock()  # Serializes control cycles
+        self._control_requests = 0  # Number of control cycles requested so far
+        self._control_completed = 0  # Requests covered by the last finished cycle
+        self._last_control_inputs = None  # Inputs of the last full control cycle
+        self._last_temps = {}  # area_id -> (temperature, monotonic time) for drift tracking
+        self._steady_level = 1  # Periodic cycles run every Nth tick while steady
+        self._steady_skips = 0  # Periodic ticks left to skip
+
+    def set_hysteresis(self, hysteresis: float) -> None:
+        """Set the global temperature hysteresis.
+        
+        Args:
+            hysteresis: Hysteresis in °C
+        """
+        self._hysteresis = hysteresis
+
+    async def _async_call_if_changed(
+        self,
+        entity_ids: str | list[str],
+        domain: str,
+        service: str,
+        data: dict[str, Any] | None = None,
+        wait: bool = False,
+    ) -> list[str]:
+        """Call a device service unless the same command was sent recently.
+        
+        Repeating an identical command every control cycle only adds radio
+        traffic, so it is skipped per entity until DEVICE_COMMAND_REFRESH_SECONDS
+        have passed, after which it is resent in case the device drifted. All
+        entities that are due share a single service call.
+        
+        Args:
+            entity_ids: Target entity ID or IDs
+            domain: Service domain
+            service: Service name
+            data: Additional service data
+            wait: Await a blocking call so errors raised by the device reach the
+                caller (needed for fallbacks); otherwise it is fired and
+                forgotten, see _fire_service_call
+            
+        Returns:
+            Entity IDs the service was called for (empty if all were skipped)
+        """
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        data = data or {}
+        command = (domain, service, tuple(sorted(data.items())))
+        now = time.monotonic()
+        last_commands = self._last_commands
+        due = []
+        for entity_id in entity_ids:
+            last = last_commands.get(entity_id)
+            if last is None or last[0] != command or now - last[1] >= DEVICE_COMMAND_REFRESH_SECONDS:
+                due.append(entity_id)
+        if not due:
+            return due
+        
+        call_data = self._get_call_data(domain, service, due)
+        call_data.update(data)
+        if wait:
+            # Commands are only recorded once the call succeeded
+            await self.hass.services.async_call(domain, service, call_data, blocking=True)
+        for entity_id in due:
+            last_commands[entity_id] = (command, now)
+        if not wait:
+            # Fired after recording, so a failure can still clear the cache
+            self._fire_service_call(domain, service, call_data, due)
+        return due
+
+    @callback
+    def _fire_service_call(
+        self, domain: str, service: str, call_data: dict[str, Any], entity_ids: list[str]
+    ) -> None:
+        """Schedule a non-blocking device service call without awaiting it.
+        
+        With blocking=False async_call never suspends, so the eagerly started
+        task normally finishes before this returns and the control cycle
+        doesn't yield to the event loop for every device write.
+        
+        Args:
+            domain: Service domain
+            service: Service name
+            call_data: Service data including entity_id
+            entity_ids: Target entity IDs (for error handling)
+        """
+        self.hass.async_create_task(
+            self._async_service_call(domain, service, call_data, entity_ids),
+            name=f"smart_heating_{domain}.{service}",
+            eager_start=True,
+        )
+
+    async def _async_service_call(
+        self, domain: str, service: str, call_data: dict[str, Any], entity_ids: list[str]
+    ) -> None:
+        """Call a device service, logging errors instead of raising them.
+        
+        On failure the cached commands for the entities are dropped and the
+        unchanged-inputs short-circuit is reset, so the next control cycle
+        runs in full and sends them again.
+        """
+        try:
+            await self.hass.services.async_call(domain, service, call_data, blocking=False)
+        except Exception as err:
+            for entity_id in entity_ids:
+                self._last_commands.pop(entity_id, None)
+                self._last_set_temperatures.pop(entity_id, None)
+            self._last_control_inputs = None
+            _LOGGER.error(
+                "Failed to call %s.%s for %s: %s",
+                domain, service, entity_ids, err
+            )
+
+    def _get_call_data(self, domain: str, service: str, entity_ids: list[str]) -> dict[str, Any]:
+        """Get the reusable service data dict for a group of entities.
+        
+        The dict is built once per (domain, service, entities) and callers only
+        update its value fields, so the control cycle doesn't allocate a new
+        payload for every call. Home Assistant validates service data into a
+        new dict before async_call returns, so updating it afterwards is safe.
+        
+        Args:
+            domain: Service domain
+            service: Service name
+            entity_ids: Target entity IDs
+            
+        Returns:
+            Service data dict with entity_id already set
+        """
+        key = (domain, service, *entity_ids)
+        try:
+            return self._call_data[key]
+        except KeyError:
+            call_data = {"entity_id": entity_ids[0] if len(entity_ids) == 1 else list(entity_ids)}
+            self._call_data[key] = call_data
+            return call_data
 
     def _get_valve_capability(self, entity_id: str) -> dict[str, Any]:
         """Get valve control capabilities from HA entity.
@@ -67,7 +266,8 @@ class ClimateController:
                 'supports_temperature': bool,
                 'position_min': float (if applicable),
                 'position_max': float (if applicable),
-                'entity_domain': str
+                'entity_domain': str,
+                'control': ValveControl
             }
         """
         # Check cache first
@@ -79,7 +279,8 @@ class ClimateController:
             'supports_temperature': False,
             'position_min': 0,
             'position_max': 100,
-            'entity_domain': entity_id.split('.')[0] if '.' in entity_id else 'unknown'
+            'entity_domain': entity_id.split('.')[0] if '.' in entity_id else 'unknown',
+            'control': ValveControl.UNSUPPORTED,
         }
         
         state = self.hass.states.get(entity_id)
@@ -115,71 +316,185 @@ class ClimateController:
                 capabilities['supports_temperature'] = True
                 _LOGGER.debug("Valve %s supports temperature control", entity_id)
         
+        # Resolve the control method once so the control loop dispatches on it
+        if capabilities['supports_position']:
+            capabilities['control'] = (
+                ValveControl.NUMBER_POSITION if domain == 'number' else ValveControl.CLIMATE_POSITION
+            )
+        elif capabilities['supports_temperature']:
+            capabilities['control'] = ValveControl.TEMPERATURE
+        
         # Cache the result
         self._device_capabilities[entity_id] = capabilities
         return capabilities
 
+    def _get_temperature_sources(self) -> list[tuple[str, Area, tuple[str, ...], tuple[str, ...]]]:
+        """Get the temperature sources of every area.
+        
+        The flat list is rebuilt only when areas or their devices change.
+        
+        Returns:
+            (area_id, area, temperature sensor IDs, thermostat IDs) per area
+            that has at least one temperature source
+        """
+        areas = self.area_manager.get_all_areas()
+        key = tuple((area_id, area, area.devices_version) for area_id, area in areas.items())
+        if key != self._temperature_sources_key:
+            sources = []
+            for area_id, area in areas.items():
+                temp_sensors = tuple(area.get_temperature_sensors())
+                # Also include thermostats as temperature sources
+                thermostats = tuple(area.get_thermostats())
+                if temp_sensors or thermostats:
+                    sources.append((area_id, area, temp_sensors, thermostats))
+            self._temperature_sources = sources
+            self._temperature_sources_key = key
+            self._track_temperature_sources(sources)
+        return self._temperature_sources
+
+    @callback
+    def _track_temperature_sources(
+        self, sources: list[tuple[str, Area, tuple[str, ...], tuple[str, ...]]]
+    ) -> None:
+        """Subscribe to state changes of all temperature sources.
+        
+        Readings are seeded from the state machine once and afterwards only
+        updated from state change events, so control cycles don't poll every
+        sensor.
+        
+        Args:
+            sources: Temperature sources as returned by _get_temperature_sources
+        """
+        if self._unsub_temperature_listener:
+            self._unsub_temperature_listener()
+            self._unsub_temperature_listener = None
+        
+        sensor_areas: dict[str, list[str]] = {}
+        thermostat_areas: dict[str, list[str]] = {}
+        for area_id, _area, temp_sensors, thermostats in sources:
+            for sensor_id in temp_sensors:
+                sensor_areas.setdefault(sensor_id, []).append(area_id)
+            for thermostat_id in thermostats:
+                thermostat_areas.setdefault(thermostat_id, []).append(area_id)
+        self._sensor_areas = sensor_areas
+        self._thermostat_areas = thermostat_areas
+        
+        get_state = self.hass.states.get
+        self._sensor_temps = {}
+        self._thermostat_temps = {}
+        for sensor_id in sensor_areas:
+            self._store_sensor_temperature(sensor_id, get_state(sensor_id))
+        for thermostat_id in thermostat_areas:
+            self._store_thermostat_temperature(thermostat_id, get_state(thermostat_id))
+        self._dirty_temperature_areas = {area_id for area_id, *_ in sources}
+        
+        entity_ids = [*sensor_areas, *(t for t in thermostat_areas if t not in sensor_areas)]
+        if entity_ids:
+            self._unsub_temperature_listener = async_track_state_change_event(
+                self.hass, entity_ids, self._handle_temperature_event
+            )
+
+    @callback
+    def _handle_temperature_event(self, event: Event) -> None:
+        """Store the new reading of a temperature source.
+        
+        Args:
+            event: State change event
+        """
+        entity_id = event.data["entity_id"]
+        new_state = event.data.get("new_state")
+        if (area_ids := self._sensor_areas.get(entity_id)) is not None:
+            self._store_sensor_temperature(entity_id, new_state)
+            self._dirty_temperature_areas.update(area_ids)
+        if (area_ids := self._thermostat_areas.get(entity_id)) is not None:
+            self._store_thermostat_temperature(entity_id, new_state)
+            self._dirty_temperature_areas.update(area_ids)
+
+    def _store_sensor_temperature(self, sensor_id: str, state) -> None:
+        """Parse a temperature sensor state into the reading cache.
+        
+        Args:
+            sensor_id: Temperature sensor entity ID
+            state: Current state, or None if the entity doesn't exist
+        """
+        self._sensor_temps.pop(sensor_id, None)
+        if not state or state.state in _INVALID_STATES:
+            return
+        try:
+            temp_value = float(state.state)
+        except (ValueError, TypeError):
+            _LOGGER.warning(
+                "Invalid temperature from %s: %s", 
+                sensor_id, state.state
+            )
+            return
+        
+        # Check if temperature is in Fahrenheit and convert to Celsius
+        unit = state.attributes.get("unit_of_measurement", "°C")
+        if unit in _FAHRENHEIT_UNITS:
+            temp_value = (temp_value - 32) * _F_TO_C
+            _LOGGER.debug(
+                "Converted temperature from %s: %s°F -> %.1f°C",
+                sensor_id, state.state, temp_value
+            )
+        self._sensor_temps[sensor_id] = temp_value
+
+    def _store_thermostat_temperature(self, thermostat_id: str, state) -> None:
+        """Parse a thermostat's current_temperature into the reading cache.
+        
+        Args:
+            thermostat_id: Thermostat entity ID
+            state: Current state, or None if the entity doesn't exist
+        """
+        self._thermostat_temps.pop(thermostat_id, None)
+        if not state or state.state in _INVALID_STATES:
+            return
+        current_temp = state.attributes.get("current_temperature")
+        if current_temp is None:
+            return
+        try:
+            temp_value = float(current_temp)
+        except (ValueError, TypeError):
+            _LOGGER.warning(
+                "Invalid current_temperature from thermostat %s: %s", 
+                thermostat_id, current_temp
+            )
+            return
+        
+        # Check if temperature is in Fahrenheit and convert to Celsius
+        unit = state.attributes.get("unit_of_measurement", "°C")
+        if unit in _FAHRENHEIT_UNITS:
+            temp_value = (temp_value - 32) * _F_TO_C
+            _LOGGER.debug(
+                "Converted temperature from thermostat %s: %.1f°F -> %.1f°C",
+                thermostat_id, current_temp, temp_value
+            )
+        self._thermostat_temps[thermostat_id] = temp_value
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Remove the temperature source listener."""
+        if self._unsub_temperature_listener:
+            self._unsub_temperature_listener()
+            self._unsub_temperature_listener = None
+
     async def async_update_area_temperatures(self) -> None:
-        """Update current temperatures for all areas from sensors."""
-        for area_id, area in self.area_manager.get_all_areas().items():
-            # Get temperature sensors for this area
-            temp_sensors = area.get_temperature_sensors()
-            # Also include thermostats as temperature sources
-            thermostats = area.get_thermostats()
-            
-            if not temp_sensors and not thermostats:
+        """Update current temperatures of areas whose sources reported changes."""
+        sources = self._get_temperature_sources()
+        dirty = self._dirty_temperature_areas
+        if not dirty:
+            return
+        self._dirty_temperature_areas = set()
+        
+        sensor_temps = self._sensor_temps
+        thermostat_temps = self._thermostat_temps
+        for area_id, area, temp_sensors, thermostats in sources:
+            if area_id not in dirty:
                 continue
             
-            # Calculate average temperature from all sensors
-            temps = []
-            
-            # Read from temperature sensors
-            for sensor_id in temp_sensors:
-                state = self.hass.states.get(sensor_id)
-                if state and state.state not in ("unknown", "unavailable"):
-                    try:
-                        temp_value = float(state.state)
-                        
-                        # Check if temperature is in Fahrenheit and convert to Celsius
-                        unit = state.attributes.get("unit_of_measurement", "°C")
-                        if unit in ("°F", "F"):
-                            temp_value = (temp_value - 32) * 5/9
-                            _LOGGER.debug(
-                                "Converted temperature from %s: %s°F -> %.1f°C",
-                                sensor_id, state.state, temp_value
-                            )
-                        
-                        temps.append(temp_value)
-                    except (ValueError, TypeError):
-                        _LOGGER.warning(
-                            "Invalid temperature from %s: %s", 
-                            sensor_id, state.state
-                        )
-            
-            # Read from thermostats (use current_temperature attribute)
-            for thermostat_id in thermostats:
-                state = self.hass.states.get(thermostat_id)
-                if state and state.state not in ("unknown", "unavailable"):
-                    current_temp = state.attributes.get("current_temperature")
-                    if current_temp is not None:
-                        try:
-                            temp_value = float(current_temp)
-                            
-                            # Check if temperature is in Fahrenheit and convert to Celsius
-                            unit = state.attributes.get("unit_of_measurement", "°C")
-                            if unit in ("°F", "F"):
-                                temp_value = (temp_value - 32) * 5/9
-                                _LOGGER.debug(
-                                    "Converted temperature from thermostat %s: %.1f°F -> %.1f°C",
-                                    thermostat_id, current_temp, temp_value
-                                )
-                            
-                            temps.append(temp_value)
-                        except (ValueError, TypeError):
-                            _LOGGER.warning(
-                                "Invalid current_temperature from thermostat %s: %s", 
-                                thermostat_id, current_temp
-                            )
+            # Calculate average temperature from all sensors and thermostats
+            temps = [sensor_temps[s] for s in temp_sensors if s in sensor_temps]
+            temps.extend(thermostat_temps[t] for t in thermostats if t in thermostat_temps)
             
             if temps:
                 avg_temp = sum(temps) / len(temps)
@@ -191,13 +506,14 @@ class ClimateController:
 
     async def _async_update_sensor_states(self) -> None:
         """Update window and presence sensor states for all areas."""
+        get_state = self.hass.states.get
         for area_id, area in self.area_manager.get_all_areas().items():
             # Update window sensor states
             if area.window_sensors:
                 any_window_open = False
                 for sensor in area.window_sensors:
                     sensor_id = sensor.get("entity_id") if isinstance(sensor, dict) else sensor
-                    state = self.hass.states.get(sensor_id)
+                    state = get_state(sensor_id)
                     if state:
                         # Binary sensors: on/open = window open
                         is_open = state.state in ("on", "open", "true", "True")
@@ -241,7 +557,7 @@ class ClimateController:
                 any_presence_detected = False
                 for sensor in presence_sensors:
                     sensor_id = sensor.get("entity_id") if isinstance(sensor, dict) else sensor
-                    state = self.hass.states.get(sensor_id)
+                    state = get_state(sensor_id)
                     if state:
                         # Binary sensors or motion sensors: on/home/detected = presence
                         is_present = state.state in ("on", "home", "detected", "true", "True")
@@ -273,9 +589,101 @@ class ClimateController:
 
 
     async def async_control_heating(self) -> None:
-        """Control heating for all areas based on temperature and schedules."""
-        from .const import DOMAIN
+        """Control heating for all areas based on temperature and schedules.
         
+        Cycles never overlap: callers arriving while one runs wait for it,
+        and a single follow-up cycle then serves all of them, since it reads
+        the latest state anyway.
+        """
+        self._control_requests += 1
+        request = self._control_requests
+        async with self._control_lock:
+            if self._control_completed >= request:
+                # A cycle that started after this request already covered it
+                return
+            started = self._control_requests
+            await self._async_run_control_cycle()
+            self._control_completed = started
+
+    async def async_periodic_control_heating(self) -> None:
+        """Run the periodic control cycle, stretched while all areas are steady.
+        
+        Ticks are skipped according to the steady level computed by the last
+        cycle; history cycles are never skipped so recording stays every
+        10 ticks.
+        """
+        if self._steady_skips > 0 and (self._record_counter + 1) % 10:
+            self._steady_skips -= 1
+            self._record_counter += 1
+            return
+        await self.async_control_heating()
+
+    @callback
+    def reset_steady_state(self) -> None:
+        """Return to the base control interval, e.g. after a device state change."""
+        self._steady_level = 1
+        self._steady_skips = 0
+
+    def _update_steady_level(self, current_time: datetime) -> None:
+        """Stretch or reset the periodic control interval based on thermal drift.
+        
+        The interval grows by one tick per cycle (up to STEADY_STATE_MAX_CYCLES)
+        while every enabled area is within half the hysteresis of its target
+        and drifting less than STEADY_STATE_MAX_DRIFT. Ticks are never skipped
+        past the next schedule or night boost boundary, where the target can
+        change without any state change.
+        
+        Args:
+            current_time: Time used for schedule evaluation
+        """
+        now = time.monotonic()
+        last_temps = self._last_temps
+        band = self._hysteresis / 2
+        steady = True
+        for area_id, area in self.area_manager.get_all_areas().items():
+            temp = area.current_temperature
+            if temp is None:
+                last_temps.pop(area_id, None)
+                continue
+            last = last_temps.get(area_id)
+            last_temps[area_id] = (temp, now)
+            if not area.enabled or not steady:
+                continue
+            if area.manual_override or area.boost_mode_active or last is None:
+                steady = False
+                continue
+            target = area.get_effective_target_temperature(current_time)
+            minutes = (now - last[1]) / 60
+            if (
+                target is None
+                or abs(temp - target) > band
+                or (minutes > 0 and abs(temp - last[0]) / minutes >= STEADY_STATE_MAX_DRIFT)
+            ):
+                steady = False
+        
+        if steady:
+            self._steady_level = min(self._steady_level + 1, STEADY_STATE_MAX_CYCLES)
+        else:
+            self._steady_level = 1
+        skips = self._steady_level - 1
+        if skips:
+            minutes = min(
+                (
+                    area.get_minutes_to_next_transition(current_time)
+                    for area in self.area_manager.get_all_areas().values()
+                    if area.enabled
+                ),
+                default=1440,
+            )
+            seconds = minutes * 60 - current_time.second
+            # The first tick at or after the boundary must not be skipped
+            skips = min(skips, max(0, math.ceil(seconds / _TICK_SECONDS) - 1))
+        self._steady_skips = skips
+
+    async def _async_run_control_cycle(self) -> None:
+        """Run one heating control cycle for all areas."""
+        # Read once and passed to every area; schedules and night boost are
+        # defined in local wall-clock time
         current_time = datetime.now()
         
         # First update all temperatures
@@ -284,6 +692,8 @@ class ClimateController:
         # Update window and presence sensor states
         await self._async_update_sensor_states()
         
+        self._update_steady_level(current_time)
+        
         # Check for expired boost modes
         for area in self.area_manager.get_all_areas().values():
             if area.boost_mode_active:
@@ -293,6 +703,36 @@ class ClimateController:
         self._record_counter += 1
         should_record_history = (self._record_counter % 10 == 0)
         
+        # Skip device control when nothing that drives it has changed since the
+        # last full cycle; history cycles always run, which also bounds how long
+        # a steady state goes without re-evaluating devices
+        control_inputs = self._get_control_inputs(current_time)
+        if (
+            not should_record_history
+            and control_inputs is not None
+            and control_inputs == self._last_control_inputs
+        ):
+            _LOGGER.debug("Control inputs unchanged - skipping device control")
+            return
+        
+        # Recorded before any device is commanded, so a service call that fails
+        # during this cycle can still clear it (see _async_service_call)
+        self._last_control_inputs = control_inputs
+        try:
+            await self._async_control_devices(current_time, should_record_history)
+        except Exception:
+            self._last_control_inputs = None
+            raise
+
+    async def _async_control_devices(
+        self, current_time: datetime, should_record_history: bool
+    ) -> None:
+        """Control the devices of all areas and the boiler.
+        
+        Args:
+            current_time: Time used for schedule evaluation
+            should_record_history: Whether this cycle records temperature history
+        """
         # Get history tracker if available
         history_tracker = self.hass.data.get(DOMAIN, {}).get("history")
         
@@ -300,186 +740,262 @@ class ClimateController:
         heating_areas = []
         max_target_temp = 0.0
         
-        # Then control each area
-        for area_id, area in self.area_manager.get_all_areas().items():
-            # Record history for ALL areas (even disabled ones) - every 5 minutes
-            if should_record_history and history_tracker and area.current_temperature is not None:
-                await history_tracker.async_record_temperature(
-                    area_id, 
-                    area.current_temperature, 
-                    area.target_temperature, 
-                    area.state
+        # Then control each area; areas are independent, so their service
+        # calls are dispatched concurrently
+        areas = list(self.area_manager.get_all_areas().items())
+        results = await asyncio.gather(
+            *(
+                self._async_control_area(
+                    area_id, area, current_time, should_record_history, history_tracker
                 )
+                for area_id, area in areas
+            ),
+            return_exceptions=True,
+        )
+        for (area_id, _), result in zip(areas, results):
+            if isinstance(result, Exception):
+                _LOGGER.error("Failed to control area %s: %s", area_id, result)
+                self._last_control_inputs = None
+            elif result is not None:
+                heating_areas.append(area_id)
+                max_target_temp = max(max_target_temp, result)
+        
+        # Control OpenTherm gateway (boiler) based on aggregated demand
+        await self._async_control_opentherm_gateway(len(heating_areas) > 0, max_target_temp)
+        
+        # Save history periodically (every 5 minutes); the write is deferred
+        # so disk I/O stays out of the control cycle
+        if should_record_history and history_tracker:
+            history_tracker.async_schedule_save()
+
+    def _get_control_inputs(self, current_time: datetime) -> tuple | None:
+        """Collect everything a control cycle's decisions depend on.
+        
+        Args:
+            current_time: Time used for schedule evaluation
             
-            if not area.enabled:
-                # Area disabled - don't control any devices, just skip
-                area.state = "off"  # Update area state
-                
-                # Log disabled state but still track temperature
-                if hasattr(self, 'area_logger') and self.area_logger:
-                    self.area_logger.log_event(
-                        area_id,
-                        "mode",
-                        "Area disabled - no device control, temperature tracking continues",
-                        {
-                            "mode": "disabled",
-                            "current_temperature": area.current_temperature
-                        }
-                    )
-                # Skip to next area - don't touch any devices
-                continue
+        Returns:
+            Comparable snapshot of the inputs, or None if they cannot be
+            captured (an area in manual override follows live device state)
+        """
+        area_manager = self.area_manager
+        inputs = [
+            self._hysteresis,
+            area_manager.frost_protection_enabled,
+            area_manager.frost_protection_temp,
+            area_manager.opentherm_enabled,
+            area_manager.opentherm_gateway_id,
+            area_manager.trv_heating_temp,
+            area_manager.trv_idle_temp,
+            area_manager.trv_temp_offset,
+        ]
+        for area_id, area in area_manager.get_all_areas().items():
+            if area.manual_override:
+                return None
+            inputs.append((
+                area_id,
+                area,
+                area.devices_version,
+                area.enabled,
+                area.hvac_mode,
+                area.shutdown_switches_when_idle,
+                area.current_temperature,
+                area.get_effective_target_temperature(current_time) if area.enabled else None,
+            ))
+        return tuple(inputs)
+
+    async def _async_control_area(
+        self,
+        area_id: str,
+        area: Area,
+        current_time: datetime,
+        should_record_history: bool,
+        history_tracker,
+    ) -> float | None:
+        """Control heating for a single area.
+        
+        Args:
+            area_id: Area identifier
+            area: Area instance
+            current_time: Time used for schedule evaluation
+            should_record_history: Whether to record a history sample this cycle
+            history_tracker: History tracker, if available
             
-            # Check for manual override mode
-            if hasattr(area, 'manual_override') and area.manual_override:
-                _LOGGER.info(
-                    "Area %s in MANUAL OVERRIDE mode - skipping thermostat control but managing switches",
-                    area_id
-                )
-                area.state = "manual"  # Set state to manual
-                if hasattr(self, 'area_logger') and self.area_logger:
-                    self.area_logger.log_event(
-                        area_id,
-                        "mode",
-                        "Manual override mode active - user control",
-                        {"mode": "manual_override"}
-                    )
-                
-                # Still control switches/pumps based on actual heating state
-                # Check if thermostat is actually heating
-                is_heating = False
-                for device_id, device_data in area.devices.items():
-                    if device_data.get("type") == "thermostat":
-                        state = self.hass.states.get(device_id)
-                        if state and state.attributes.get("hvac_action") == "heating":
-                            is_heating = True
-                            break
-                
-                # Control switches based on actual heating state
-                await self._async_control_switches(area, is_heating)
-                
-                # Skip rest of climate control logic
-                continue
+        Returns:
+            Target temperature if the area is heating, None otherwise
+        """
+        # Record history for ALL areas (even disabled ones) - every 5 minutes
+        if should_record_history and history_tracker and area.current_temperature is not None:
+            await history_tracker.async_record_temperature(
+                area_id, 
+                area.current_temperature, 
+                area.target_temperature, 
+                area.state
+            )
+        
+        if not area.enabled:
+            # Area disabled - don't control any devices, just skip
+            area.state = "off"  # Update area state
             
-            # Get effective target (considering schedules and night boost)
-            target_temp = area.get_effective_target_temperature(current_time)
+            # Log disabled state but still track temperature
+            if hasattr(self, 'area_logger') and self.area_logger:
+                self.area_logger.log_event(
+                    area_id,
+                    "mode",
+                    "Area disabled - no device control, temperature tracking continues",
+                    {
+                        "mode": "disabled",
+                        "current_temperature": area.current_temperature
+                    }
+                )
+            # Skip to next area - don't touch any devices
+            return None
+        
+        # Check for manual override mode
+        if hasattr(area, 'manual_override') and area.manual_override:
             _LOGGER.info(
-                "Area %s: Effective target=%.1f°C (boost_active=%s, preset=%s, base_target=%.1f°C)",
-                area_id, target_temp, area.boost_mode_active, area.preset_mode, area.target_temperature
+                "Area %s in MANUAL OVERRIDE mode - skipping thermostat control but managing switches",
+                area_id
             )
+            area.state = "manual"  # Set state to manual
             if hasattr(self, 'area_logger') and self.area_logger:
-                details = {
-                    "target_temp": target_temp,
-                    "boost_active": area.boost_mode_active,
-                    "preset_mode": area.preset_mode,
-                    "base_target": area.target_temperature
-                }
                 self.area_logger.log_event(
                     area_id,
-                    "temperature",
-                    f"Effective target temperature: {target_temp:.1f}°C",
-                    details
+                    "mode",
+                    "Manual override mode active - user control",
+                    {"mode": "manual_override"}
                 )
             
-            # Apply frost protection if enabled (global setting)
-            if self.area_manager.frost_protection_enabled:
-                frost_temp = self.area_manager.frost_protection_temp
-                if target_temp < frost_temp:
-                    _LOGGER.debug(
-                        "Area %s: Frost protection active - raising target from %.1f°C to %.1f°C",
-                        area_id, target_temp, frost_temp
-                    )
-                    target_temp = frost_temp
-            
-            # Apply HVAC mode (off/heat/cool/auto)
-            if hasattr(area, 'hvac_mode'):
-                if area.hvac_mode == "off":
-                    # HVAC mode is off - disable heating for this area
-                    await self._async_set_area_heating(area, False)
-                    area.state = "off"
-                    _LOGGER.debug("Area %s: HVAC mode is OFF - skipping", area_id)
-                    continue
+            # Still control switches/pumps based on actual heating state
+            # Check if thermostat is actually heating
+            is_heating = False
+            for device_id, device_data in area.devices.items():
+                if device_data.get("type") == "thermostat":
+                    state = self.hass.states.get(device_id)
+                    if state and state.attributes.get("hvac_action") == "heating":
+                        is_heating = True
+                        break
             
-            current_temp = area.current_temperature
+            # Control switches based on actual heating state
+            await self._async_control_switches(area, is_heating)
             
-            if current_temp is None:
-                _LOGGER.warning("No temperature data for area %s", area_id)
-                continue
-            
-            # Determine if heating is needed (with hysteresis)
-            should_heat = current_temp < (target_temp - self._hysteresis)
-            should_stop = current_temp >= target_temp
+            # Skip rest of climate control logic
+            return None
+        
+        # Get effective target (considering schedules and night boost)
+        target_temp = area.get_effective_target_temperature(current_time)
+        _LOGGER.info(
+            "Area %s: Effective target=%.1f°C (boost_active=%s, preset=%s, base_target=%.1f°C)",
+            area_id, target_temp, area.boost_mode_active, area.preset_mode, area.target_temperature
+        )
+        if hasattr(self, 'area_logger') and self.area_logger:
+            details = {
+                "target_temp": target_temp,
+                "boost_active": area.boost_mode_active,
+                "preset_mode": area.preset_mode,
+                "base_target": area.target_temperature
+            }
+            self.area_logger.log_event(
+                area_id,
+                "temperature",
+                f"Effective target temperature: {target_temp:.1f}°C",
+                details
+            )
+        
+        # Apply frost protection if enabled (global setting)
+        if self.area_manager.frost_protection_enabled:
+            frost_temp = self.area_manager.frost_protection_temp
+            if target_temp < frost_temp:
+                _LOGGER.debug(
+                    "Area %s: Frost protection active - raising target from %.1f°C to %.1f°C",
+                    area_id, target_temp, frost_temp
+                )
+                target_temp = frost_temp
+        
+        # Apply HVAC mode (off/heat/cool/auto)
+        if hasattr(area, 'hvac_mode'):
+            if area.hvac_mode == "off":
+                # HVAC mode is off - disable heating for this area
+                await self._async_set_area_heating(area, False)
+                area.state = "off"
+                _LOGGER.debug("Area %s: HVAC mode is OFF - skipping", area_id)
+                return None
+        
+        current_temp = area.current_temperature
+        
+        if current_temp is None:
+            _LOGGER.warning("No temperature data for area %s", area_id)
+            return None
+        
+        # Determine if heating is needed (with hysteresis)
+        should_heat = current_temp < (target_temp - self._hysteresis)
+        should_stop = current_temp >= target_temp
+        
+        if should_heat:
+            # Start heating event if not already active and learning engine available
+            if self.learning_engine and area_id not in self._area_heating_events:
+                outdoor_temp = await self._async_get_outdoor_temperature(area)
+                await self.learning_engine.async_start_heating_event(
+                    area_id=area_id,
+                    current_temp=current_temp,
+                )
+                _LOGGER.debug(
+                    "Started learning event for area %s (outdoor: %s°C)",
+                    area_id, outdoor_temp if outdoor_temp else "N/A"
+                )
             
-            if should_heat:
-                # Start heating event if not already active and learning engine available
-                if self.learning_engine and area_id not in self._area_heating_events:
-                    outdoor_temp = await self._async_get_outdoor_temperature(area)
-                    await self.learning_engine.async_start_heating_event(
-                        area_id=area_id,
-                        current_temp=current_temp,
-                    )
-                    _LOGGER.debug(
-                        "Started learning event for area %s (outdoor: %s°C)",
-                        area_id, outdoor_temp if outdoor_temp else "N/A"
-                    )
-                
-                await self._async_set_area_heating(area, True, target_temp)
-                area.state = "heating"  # Update area state
-                heating_areas.append(area)
-                max_target_temp = max(max_target_temp, target_temp)
-                _LOGGER.info(
-                    "Area %s: Heating ON (current: %.1f°C, target: %.1f°C)",
-                    area_id, current_temp, target_temp
+            await self._async_set_area_heating(area, True, target_temp)
+            area.state = "heating"  # Update area state
+            _LOGGER.info(
+                "Area %s: Heating ON (current: %.1f°C, target: %.1f°C)",
+                area_id, current_temp, target_temp
+            )
+            if hasattr(self, 'area_logger') and self.area_logger:
+                self.area_logger.log_event(
+                    area_id,
+                    "heating",
+                    f"Heating started - reaching {target_temp:.1f}°C",
+                    {
+                        "current_temp": current_temp,
+                        "target_temp": target_temp,
+                        "state": "heating"
+                    }
+                )
+            return target_temp
+        elif should_stop:
+            # End heating event if active and learning engine available
+            if self.learning_engine and area_id in self._area_heating_events:
+                del self._area_heating_events[area_id]
+                await self.learning_engine.async_end_heating_event(
+                    area_id=area_id,
+                    current_temp=current_temp,
+                    target_reached=True
                 )
-                if hasattr(self, 'area_logger') and self.area_logger:
-                    self.area_logger.log_event(
-                        area_id,
-                        "heating",
-                        f"Heating started - reaching {target_temp:.1f}°C",
-                        {
-                            "current_temp": current_temp,
-                            "target_temp": target_temp,
-                            "state": "heating"
-                        }
-                    )
-            elif should_stop:
-                # End heating event if active and learning engine available
-                if self.learning_engine and area_id in self._area_heating_events:
-                    del self._area_heating_events[area_id]
-                    await self.learning_engine.async_end_heating_event(
-                        area_id=area_id,
-                        current_temp=current_temp,
-                        target_reached=True
-                    )
-                    _LOGGER.debug(
-                        "Completed learning event for area %s (reached %.1f°C)",
-                        area_id, current_temp
-                    )
-                
-                # Turn off heating but update target temperature to schedule value
-                await self._async_set_area_heating(area, False, target_temp)
-                area.state = "idle"  # Update area state
                 _LOGGER.debug(
-                    "Area %s: Heating OFF (current: %.1f°C, target: %.1f°C)",
-                    area_id, current_temp, target_temp
+                    "Completed learning event for area %s (reached %.1f°C)",
+                    area_id, current_temp
+                )
+            
+            # Turn off heating but update target temperature to schedule value
+            await self._async_set_area_heating(area, False, target_temp)
+            area.state = "idle"  # Update area state
+            _LOGGER.debug(
+                "Area %s: Heating OFF (current: %.1f°C, target: %.1f°C)",
+                area_id, current_temp, target_temp
+            )
+            if hasattr(self, 'area_logger') and self.area_logger:
+                self.area_logger.log_event(
+                    area_id,
+                    "heating",
+                    f"Heating stopped - target {target_temp:.1f}°C reached",
+                    {
+                        "current_temp": current_temp,
+                        "target_temp": target_temp,
+                        "state": "idle"
+                    }
                 )
-                if hasattr(self, 'area_logger') and self.area_logger:
-                    self.area_logger.log_event(
-                        area_id,
-                        "heating",
-                        f"Heating stopped - target {target_temp:.1f}°C reached",
-                        {
-                            "current_temp": current_temp,
-                            "target_temp": target_temp,
-                            "state": "idle"
-                        }
-                    )
-        
-        # Control OpenTherm gateway (boiler) based on aggregated demand
-        await self._async_control_opentherm_gateway(len(heating_areas) > 0, max_target_temp)
         
-        # Save history periodically (every 5 minutes)
-        if should_record_history and history_tracker:
-            await history_tracker.async_save()
+        return None
 
     async def _async_set_area_heating(
         self, area: Area, heating: bool, target_temp: float | None = None
@@ -496,142 +1012,113 @@ class ClimateController:
             heating: True to turn on heating, False to turn off
             target_temp: Target temperature
         """
-        # Control thermostats
-        await self._async_control_thermostats(area, heating, target_temp)
-        
-        # Control switches (pumps, relays)
-        await self._async_control_switches(area, heating)
-        
-        # Control valves/TRVs
-        await self._async_control_valves(area, heating, target_temp)
+        # Thermostats, switches (pumps, relays) and valves/TRVs are
+        # independent, so control them concurrently
+        await asyncio.gather(
+            self._async_control_thermostats(area, heating, target_temp),
+            self._async_control_switches(area, heating),
+            self._async_control_valves(area, heating, target_temp),
+        )
 
     async def _async_control_thermostats(
         self, area: Area, heating: bool, target_temp: float | None
     ) -> None:
-        """Control thermostats in an area."""
+        """Control thermostats in an area.
+        
+        All thermostats of an area receive the same command, so the ones that
+        need it are addressed with a single service call.
+        """
         thermostats = area.get_thermostats()
+        if not thermostats:
+            return
         
-        for thermostat_id in thermostats:
-            try:
-                if heating and target_temp is not None:
-                    # Only set temperature if it has changed (to avoid API rate limiting)
-                    last_temp = self._last_set_temperatures.get(thermostat_id)
-                    if last_temp is None or abs(last_temp - target_temp) >= 0.1:
-                        # Turn on and set temperature
-                        await self.hass.services.async_call(
-                            CLIMATE_DOMAIN,
-                            SERVICE_SET_TEMPERATURE,
-                            {
-                                "entity_id": thermostat_id,
-                                ATTR_TEMPERATURE: target_temp,
-                            },
-                            blocking=False,
-                        )
-                        self._last_set_temperatures[thermostat_id] = target_temp
-                        _LOGGER.debug(
-                            "Set thermostat %s to %.1f°C", thermostat_id, target_temp
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "Skipping thermostat %s update - already at %.1f°C (avoiding API rate limit)",
-                            thermostat_id, target_temp
-                        )
-                elif target_temp is not None:
-                    # Only update target temperature if it has changed (to avoid API rate limiting)
-                    last_temp = self._last_set_temperatures.get(thermostat_id)
-                    if last_temp is None or abs(last_temp - target_temp) >= 0.1:
-                        # Update target temperature even when not heating (for schedules)
-                        await self.hass.services.async_call(
-                            CLIMATE_DOMAIN,
-                            SERVICE_SET_TEMPERATURE,
-                            {
-                                "entity_id": thermostat_id,
-                                ATTR_TEMPERATURE: target_temp,
-                            },
-                            blocking=False,
-                        )
-                        self._last_set_temperatures[thermostat_id] = target_temp
-                        _LOGGER.debug(
-                            "Updated thermostat %s target to %.1f°C (idle)", thermostat_id, target_temp
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "Skipping thermostat %s update - already at %.1f°C (avoiding API rate limit)",
-                            thermostat_id, target_temp
-                        )
+        try:
+            if target_temp is not None:
+                # Heating and idle both push the (schedule) target; only send it
+                # to thermostats where it has changed (to avoid API rate limiting)
+                last_set = self._last_set_temperatures
+                due = [
+                    thermostat_id for thermostat_id in thermostats
+                    if thermostat_id not in last_set
+                    or abs(last_set[thermostat_id] - target_temp) >= 0.1
+                ]
+                if due:
+                    call_data = self._get_call_data(CLIMATE_DOMAIN, SERVICE_SET_TEMPERATURE, due)
+                    call_data[ATTR_TEMPERATURE] = target_temp
+                    for thermostat_id in due:
+                        last_set[thermostat_id] = target_temp
+                        # Any cached turn_off no longer reflects the device
+                        self._last_commands.pop(thermostat_id, None)
+                    self._fire_service_call(CLIMATE_DOMAIN, SERVICE_SET_TEMPERATURE, call_data, due)
+                    _LOGGER.debug(
+                        "Set thermostats %s to %.1f°C (%s)",
+                        due, target_temp, "heating" if heating else "idle"
+                    )
                 else:
-                    # Turn off heating completely (no target specified)
-                    # Some devices (MQTT climate) don't support turn_off, so set to minimum temp instead
-                    # Clear cached temperature when turning off
-                    if thermostat_id in self._last_set_temperatures:
-                        del self._last_set_temperatures[thermostat_id]
+                    _LOGGER.debug(
+                        "Skipping thermostats %s update - already at %.1f°C (avoiding API rate limit)",
+                        thermostats, target_temp
+                    )
+            else:
+                # Turn off heating completely (no target specified)
+                # Some devices (MQTT climate) don't support turn_off, so set to minimum temp instead
+                # Clear cached temperature when turning off
+                for thermostat_id in thermostats:
+                    self._last_set_temperatures.pop(thermostat_id, None)
+                
+                # Try to turn off, but fall back to setting low temperature if not supported;
+                # repeated identical commands are skipped while the thermostats stay off
+                try:
+                    sent = await self._async_call_if_changed(
+                        thermostats, CLIMATE_DOMAIN, SERVICE_TURN_OFF, wait=True
+                    )
+                    if sent:
+                        _LOGGER.debug("Turned off thermostats %s", sent)
+                except Exception:
+                    # If turn_off not supported, set to frost protection or minimum temperature
+                    min_temp = 5.0  # Frost protection minimum
+                    if self.area_manager.frost_protection_enabled:
+                        min_temp = self.area_manager.frost_protection_temp
                     
-                    # Try to turn off, but fall back to setting low temperature if not supported
-                    try:
-                        await self.hass.services.async_call(
-                            CLIMATE_DOMAIN,
-                            SERVICE_TURN_OFF,
-                            {"entity_id": thermostat_id},
-                            blocking=False,
-                        )
-                        _LOGGER.debug("Turned off thermostat %s", thermostat_id)
-                    except Exception as turn_off_err:
-                        # If turn_off not supported, set to frost protection or minimum temperature
-                        min_temp = 5.0  # Frost protection minimum
-                        if self.area_manager.frost_protection_enabled:
-                            min_temp = self.area_manager.frost_protection_temp
-                        
-                        await self.hass.services.async_call(
-                            CLIMATE_DOMAIN,
-                            SERVICE_SET_TEMPERATURE,
-                            {
-                                "entity_id": thermostat_id,
-                                ATTR_TEMPERATURE: min_temp,
-                            },
-                            blocking=False,
-                        )
+                    sent = await self._async_call_if_changed(
+                        thermostats, CLIMATE_DOMAIN, SERVICE_SET_TEMPERATURE, {ATTR_TEMPERATURE: min_temp}
+                    )
+                    if sent:
                         _LOGGER.debug(
-                            "Thermostat %s doesn't support turn_off, set to %.1f°C instead",
-                            thermostat_id, min_temp
+                            "Thermostats %s don't support turn_off, set to %.1f°C instead",
+                            sent, min_temp
                         )
-            except Exception as err:
-                _LOGGER.error(
-                    "Failed to control thermostat %s: %s", 
-                    thermostat_id, err
-                )
+        except Exception as err:
+            _LOGGER.error(
+                "Failed to control thermostats %s: %s", 
+                thermostats, err
+            )
 
     async def _async_control_switches(self, area: Area, heating: bool) -> None:
-        """Control switches (pumps, relays) in an area."""
+        """Control switches (pumps, relays) in an area with a single service call."""
         switches = area.get_switches()
+        if not switches:
+            return
         
-        for switch_id in switches:
-            try:
-                if heating:
-                    # Turn on switch (pump, relay)
-                    await self.hass.services.async_call(
-                        "switch",
-                        SERVICE_TURN_ON,
-                        {"entity_id": switch_id},
-                        blocking=False,
-                    )
-                    _LOGGER.debug("Turned on switch %s", switch_id)
+        try:
+            if heating:
+                # Turn on switches (pumps, relays)
+                sent = await self._async_call_if_changed(switches, "switch", SERVICE_TURN_ON)
+                if sent:
+                    _LOGGER.debug("Turned on switches %s", sent)
+            else:
+                # Turn off switches only if area setting allows it
+                if area.shutdown_switches_when_idle:
+                    sent = await self._async_call_if_changed(switches, "switch", SERVICE_TURN_OFF)
+                    if sent:
+                        _LOGGER.debug("Turned off switches %s (shutdown_switches_when_idle=True)", sent)
                 else:
-                    # Turn off switch only if area setting allows it
-                    if area.shutdown_switches_when_idle:
-                        await self.hass.services.async_call(
-                            "switch",
-                            SERVICE_TURN_OFF,
-                            {"entity_id": switch_id},
-                            blocking=False,
-                        )
-                        _LOGGER.debug("Turned off switch %s (shutdown_switches_when_idle=True)", switch_id)
-                    else:
-                        _LOGGER.debug("Keeping switch %s on (shutdown_switches_when_idle=False)", switch_id)
-            except Exception as err:
-                _LOGGER.error(
-                    "Failed to control switch %s: %s",
-                    switch_id, err
-                )
+                    _LOGGER.debug("Keeping switches %s on (shutdown_switches_when_idle=False)", switches)
+        except Exception as err:
+            _LOGGER.error(
+                "Failed to control switches %s: %s",
+                switches, err
+            )
 
     async def _async_control_valves(
         self, area: Area, heating: bool, target_temp: float | None
@@ -642,133 +1129,124 @@ class ClimateController:
         - Position control: Direct 0-100% control via number.* entities or position attribute
         - Temperature control: High/low temp method for TRVs without position control
         
+        Valves that need the same command are addressed with one service call.
+        
         Args:
             area: Area instance
             heating: True if area needs heating
             target_temp: Target temperature for the area
         """
-        valves = area.get_valves()
-        
-        for valve_id in valves:
-            try:
-                # Query device capabilities dynamically
-                capabilities = self._get_valve_capability(valve_id)
-                
-                # Prefer position control if available
-                if capabilities['supports_position']:
-                    domain = capabilities['entity_domain']
-                    
-                    if domain == 'number':
-                        # Direct position control via number entity
-                        if heating:
-                            # Open valve to max
-                            await self.hass.services.async_call(
-                                "number",
-                                "set_value",
-                                {
-                                    "entity_id": valve_id,
-                                    "value": capabilities['position_max'],
-                                },
-                                blocking=False,
-                            )
-                            _LOGGER.debug(
-                                "Opened valve %s to %.0f%% (position control)",
-                                valve_id, capabilities['position_max']
-                            )
-                        else:
-                            # Close valve to min
-                            await self.hass.services.async_call(
-                                "number",
-                                "set_value",
-                                {
-                                    "entity_id": valve_id,
-                                    "value": capabilities['position_min'],
-                                },
-                                blocking=False,
-                            )
-                            _LOGGER.debug(
-                                "Closed valve %s to %.0f%% (position control)",
-                                valve_id, capabilities['position_min']
-                            )
-                    
-                    elif domain == 'climate' and 'position' in self.hass.states.get(valve_id).attributes:
-                        # Climate entity with position attribute
-                        # Try to set position via service
-                        position = capabilities['position_max'] if heating else capabilities['position_min']
-                        try:
-                            await self.hass.services.async_call(
-                                CLIMATE_DOMAIN,
-                                "set_position",
-                                {
-                                    "entity_id": valve_id,
-                                    "position": position,
-                                },
-                                blocking=False,
-                            )
-                            _LOGGER.debug(
-                                "Set valve %s position to %.0f%%",
-                                valve_id, position
-                            )
-                        except Exception:
-                            # Fall back to temperature control if position service doesn't exist
-                            _LOGGER.debug(
-                                "Valve %s doesn't support set_position service, using temperature control",
-                                valve_id
-                            )
-                            capabilities['supports_position'] = False
-                            capabilities['supports_temperature'] = True
-                
-                # Fall back to temperature control if position not supported
-                if not capabilities['supports_position'] and capabilities['supports_temperature']:
-                    # TRV with temperature control only
-                    # Use high/low temperature method
-                    if heating and target_temp is not None:
-                        # Set to heating temperature using configured offset
-                        # Use actual target + offset to ensure valve opens
-                        offset = self.area_manager.trv_temp_offset
-                        heating_temp = max(target_temp + offset, self.area_manager.trv_heating_temp)
-                        await self.hass.services.async_call(
-                            CLIMATE_DOMAIN,
-                            SERVICE_SET_TEMPERATURE,
-                            {
-                                "entity_id": valve_id,
-                                ATTR_TEMPERATURE: heating_temp,
-                            },
-                            blocking=False,
-                        )
-                        _LOGGER.debug(
-                            "Set TRV %s to heating temp %.1f°C (target %.1f°C + %.1f°C offset)", 
-                            valve_id, heating_temp, target_temp, offset
-                        )
-                    else:
-                        # Set to idle temperature (default 10°C or configured)
-                        idle_temp = self.area_manager.trv_idle_temp
-                        await self.hass.services.async_call(
-                            CLIMATE_DOMAIN,
-                            SERVICE_SET_TEMPERATURE,
-                            {
-                                "entity_id": valve_id,
-                                ATTR_TEMPERATURE: idle_temp,
-                            },
-                            blocking=False,
-                        )
-                        _LOGGER.debug(
-                            "Set TRV %s to idle temp %.1f°C (temperature control)", 
-                            valve_id, idle_temp
-                        )
-                
-                # If neither method is supported, log warning
-                if not capabilities['supports_position'] and not capabilities['supports_temperature']:
-                    _LOGGER.warning(
-                        "Valve %s doesn't support position or temperature control",
-                        valve_id
-                    )
-                        
-            except Exception as err:
-                _LOGGER.error(
-                    "Failed to control valve %s: %s",
-                    valve_id, err
+        groups: dict[tuple[str, str, str, float], list[str]] = {}
+        position_valves = []
+        for valve_id in area.get_valves():
+            # Query device capabilities dynamically
+            capabilities = self._get_valve_capability(valve_id)
+            control = capabilities['control']
+            if control is ValveControl.CLIMATE_POSITION:
+                position_valves.append(valve_id)
+            elif control is ValveControl.UNSUPPORTED:
+                _LOGGER.warning(
+                    "Valve %s doesn't support position or temperature control",
+                    valve_id
                 )
+            else:
+                command = self._get_valve_command(capabilities, heating, target_temp)
+                groups.setdefault(command, []).append(valve_id)
+        
+        await asyncio.gather(
+            *(
+                self._async_send_valve_command(valve_ids, command)
+                for command, valve_ids in groups.items()
+            ),
+            *(
+                self._async_control_position_valve(valve_id, heating, target_temp)
+                for valve_id in position_valves
+            ),
+        )
+
+    def _get_valve_command(
+        self, capabilities: dict[str, Any], heating: bool, target_temp: float | None
+    ) -> tuple[str, str, str, float]:
+        """Get the service call that drives a valve.
+        
+        Args:
+            capabilities: Valve capabilities (number position or temperature control)
+            heating: True if area needs heating
+            target_temp: Target temperature for the area
+            
+        Returns:
+            (domain, service, data attribute, value)
+        """
+        if capabilities['control'] is ValveControl.NUMBER_POSITION:
+            # Direct position control via number entity: open to max or close to min
+            position = capabilities['position_max'] if heating else capabilities['position_min']
+            return ("number", "set_value", "value", position)
+        
+        # TRV with temperature control only
+        # Use high/low temperature method
+        area_manager = self.area_manager
+        if heating and target_temp is not None:
+            # Set to heating temperature using configured offset
+            # Use actual target + offset to ensure valve opens
+            heating_temp = max(target_temp + area_manager.trv_temp_offset, area_manager.trv_heating_temp)
+            return (CLIMATE_DOMAIN, SERVICE_SET_TEMPERATURE, ATTR_TEMPERATURE, heating_temp)
+        # Set to idle temperature (default 10°C or configured)
+        return (CLIMATE_DOMAIN, SERVICE_SET_TEMPERATURE, ATTR_TEMPERATURE, area_manager.trv_idle_temp)
+
+    async def _async_send_valve_command(
+        self, valve_ids: list[str], command: tuple[str, str, str, float]
+    ) -> None:
+        """Send one command to a group of valves.
+        
+        Args:
+            valve_ids: Valve entity IDs
+            command: (domain, service, data attribute, value)
+        """
+        domain, service, attribute, value = command
+        try:
+            sent = await self._async_call_if_changed(valve_ids, domain, service, {attribute: value})
+            if sent:
+                _LOGGER.debug("Set valves %s: %s.%s %s=%.1f", sent, domain, service, attribute, value)
+        except Exception as err:
+            _LOGGER.error(
+                "Failed to control valves %s: %s",
+                valve_ids, err
+            )
+
+    async def _async_control_position_valve(
+        self, valve_id: str, heating: bool, target_temp: float | None
+    ) -> None:
+        """Control a climate valve through its position attribute.
+        
+        Falls back to temperature control if the entity has no set_position
+        service.
+        """
+        capabilities = self._get_valve_capability(valve_id)
+        position = capabilities['position_max'] if heating else capabilities['position_min']
+        try:
+            call_data = self._get_call_data(CLIMATE_DOMAIN, "set_position", [valve_id])
+            call_data["position"] = position
+            await self.hass.services.async_call(
+                CLIMATE_DOMAIN, "set_position", call_data, blocking=False
+            )
+            _LOGGER.debug(
+                "Set valve %s position to %.0f%%",
+                valve_id, position
+            )
+            return
+        except Exception:
+            # Fall back to temperature control if position service doesn't exist
+            _LOGGER.debug(
+                "Valve %s doesn't support set_position service, using temperature control",
+                valve_id
+            )
+            capabilities['supports_position'] = False
+            capabilities['supports_temperature'] = True
+            capabilities['control'] = ValveControl.TEMPERATURE
+        
+        await self._async_send_valve_command(
+            [valve_id], self._get_valve_command(capabilities, heating, target_temp)
+        )
 
     async def _async_get_outdoor_temperature(self, area: Area) -> float | None:
         """Get outdoor temperature for learning.
@@ -783,15 +1261,15 @@ class ClimateController:
             return None
         
         state = self.hass.states.get(area.weather_entity_id)
-        if not state or state.state in ("unknown", "unavailable"):
+        if not state or state.state in _INVALID_STATES:
             return None
         
         try:
             temp = float(state.state)
             # Check for Fahrenheit and convert
             unit = state.attributes.get("unit_of_measurement", "°C")
-            if unit in ("°F", "F"):
-                temp = (temp - 32) * 5/9
+            if unit in _FAHRENHEIT_UNITS:
+                temp = (temp - 32) * _F_TO_C
             return temp
         except (ValueError, TypeError):
             return None
@@ -805,41 +1283,34 @@ class ClimateController:
             any_heating: True if any area needs heating
             max_target_temp: Highest requested temperature across all heating areas
         """
-        if not self.area_manager.opentherm_enabled:
+        area_manager = self.area_manager
+        if not area_manager.opentherm_enabled:
             return
         
-        gateway_id = self.area_manager.opentherm_gateway_id
+        gateway_id = area_manager.opentherm_gateway_id
         if not gateway_id:
             return
         
         try:
             if any_heating:
                 # At least one area needs heating - turn on boiler
-                # Set to highest requested temperature plus overhead
-                boiler_setpoint = max_target_temp + 20  # Add 20°C for distribution losses
-                
-                await self.hass.services.async_call(
-                    CLIMATE_DOMAIN,
-                    SERVICE_SET_TEMPERATURE,
-                    {
-                        "entity_id": gateway_id,
-                        ATTR_TEMPERATURE: boiler_setpoint,
-                    },
-                    blocking=False,
-                )
-                _LOGGER.info(
-                    "OpenTherm gateway: Boiler ON, setpoint=%.1f°C (max area target=%.1f°C)",
-                    boiler_setpoint, max_target_temp
+                # Set to highest requested temperature plus overhead for
+                # distribution losses, capped at the maximum flow temperature
+                boiler_setpoint = min(
+                    max_target_temp + OPENTHERM_SETPOINT_OVERHEAD, OPENTHERM_MAX_SETPOINT
                 )
+                
+                if await self._async_call_if_changed(
+                    gateway_id, CLIMATE_DOMAIN, SERVICE_SET_TEMPERATURE, {ATTR_TEMPERATURE: boiler_setpoint}
+                ):
+                    _LOGGER.info(
+                        "OpenTherm gateway: Boiler ON, setpoint=%.1f°C (max area target=%.1f°C)",
+                        boiler_setpoint, max_target_temp
+                    )
             else:
                 # No areas need heating - turn off boiler
-                await self.hass.services.async_call(
-                    CLIMATE_DOMAIN,
-                    SERVICE_TURN_OFF,
-                    {"entity_id": gateway_id},
-                    blocking=False,
-                )
-                _LOGGER.info("OpenTherm gateway: Boiler OFF (no heating demand)")
+                if await self._async_call_if_changed(gateway_id, CLIMATE_DOMAIN, SERVICE_TURN_OFF):
+                    _LOGGER.info("OpenTherm gateway: Boiler OFF (no heating demand)")
                 
         except Exception as err:
             _LOGGER.error(
@@ -1,6 +1,6 @@
 """Config flow for Smart Heating integration."""
 import logging
-from typing import Any
+from typing import Any, Final
 
 import voluptuous as vol
 
@@ -12,6 +12,9 @@ from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# The user step takes no input, so its (empty) schema is built once
+_EMPTY_SCHEMA: Final = vol.Schema({})
+
 
 class SmartHeatingConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Smart Heating."""
@@ -60,7 +63,7 @@ class SmartHeatingConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         _LOGGER.debug("Showing config form")
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema({}),
+            data_schema=_EMPTY_SCHEMA,
         )
 
     @staticmethod
@@ -124,28 +127,27 @@ class SmartHeatingOptionsFlowHandler(config_entries.OptionsFlow):
         # Get all climate entities for the dropdown, filtering for OpenTherm-compatible devices
         climate_entities = []
         
-        for entity_id in self.hass.states.async_entity_ids("climate"):
-            state = self.hass.states.get(entity_id)
-            if state:
-                # Filter for OpenTherm gateways
-                # Check if entity_id or friendly name contains "opentherm" or "otgw"
-                entity_lower = entity_id.lower()
-                friendly_name = state.attributes.get("friendly_name", entity_id)
-                friendly_lower = friendly_name.lower()
-                
-                # Also check for known OpenTherm integration patterns
-                is_opentherm = (
-                    "opentherm" in entity_lower or
-                    "opentherm" in friendly_lower or
-                    "otgw" in entity_lower or
-                    "otgw" in friendly_lower or
-                    # Check for OpenTherm-specific attributes
-                    "control_setpoint" in state.attributes or
-                    "ch_water_temp" in state.attributes
-                )
-                
-                if is_opentherm:
-                    climate_entities.append((entity_id, f"{friendly_name} ({entity_id})"))
+        for state in self.hass.states.async_all("climate"):
+            entity_id = state.entity_id
+            # Filter for OpenTherm gateways
+            # Check if entity_id or friendly name contains "opentherm" or "otgw"
+            entity_lower = entity_id.lower()
+            friendly_name = state.attributes.get("friendly_name", entity_id)
+            friendly_lower = friendly_name.lower()
+            
+            # Also check for known OpenTherm integration patterns
+            is_opentherm = (
+                "opentherm" in entity_lower or
+                "opentherm" in friendly_lower or
+                "otgw" in entity_lower or
+                "otgw" in friendly_lower or
+                # Check for OpenTherm-specific attributes
+                "control_setpoint" in state.attributes or
+                "ch_water_temp" in state.attributes
+            )
+            
+            if is_opentherm:
+                climate_entities.append((entity_id, f"{friendly_name} ({entity_id})"))
         
         # Sort by friendly name
         climate_entities.sort(key=lambda x: x[1])
@@ -1,5 +1,6 @@
 """Constants for the Smart Heating integration."""
 from datetime import timedelta
+from enum import IntEnum
 from typing import Final
 
 # Integration domain
@@ -17,6 +18,9 @@ DEFAULT_MQTT_BASE_TOPIC: Final = "zigbee2mqtt"
 # Update interval
 UPDATE_INTERVAL: Final = timedelta(seconds=DEFAULT_UPDATE_INTERVAL)
 
+# Update interval for climate control (30 seconds)
+CLIMATE_UPDATE_INTERVAL: Final = timedelta(seconds=30)
+
 # Services
 SERVICE_REFRESH: Final = "refresh"
 SERVICE_ADD_DEVICE_TO_AREA: Final = "add_device_to_area"
@@ -83,6 +87,19 @@ HVAC_MODE_AUTO: Final = "auto"
 DEFAULT_HISTORY_RETENTION_DAYS: Final = 30  # Keep 30 days by default
 HISTORY_RECORD_INTERVAL_SECONDS: Final = 300  # Record every 5 minutes
 
+# Device control settings
+DEVICE_COMMAND_REFRESH_SECONDS: Final = 300  # Resend unchanged device commands every 5 minutes
+
+# Steady state: while every area holds its target with negligible drift, the
+# periodic control cycle is stretched to run only every Nth climate update
+STEADY_STATE_MAX_CYCLES: Final = 4  # At most every 4 x 30 s = 2 minutes
+STEADY_STATE_MAX_DRIFT: Final = 0.01  # °C per minute
+
+# OpenTherm boiler setpoint: highest area target plus distribution overhead,
+# capped so a misconfigured target can't request an unsafe flow temperature
+OPENTHERM_SETPOINT_OVERHEAD: Final = 20.0  # °C
+OPENTHERM_MAX_SETPOINT: Final = 85.0  # °C
+
 HVAC_MODES: Final = [
     HVAC_MODE_OFF,
     HVAC_MODE_HEAT,
@@ -99,6 +116,15 @@ DEVICE_TYPE_SWITCH: Final = "switch"
 DEVICE_TYPE_WINDOW_SENSOR: Final = "window_sensor"
 DEVICE_TYPE_PRESENCE_SENSOR: Final = "presence_sensor"
 
+
+class ValveControl(IntEnum):
+    """How a valve is driven, resolved once from its entity capabilities."""
+
+    NUMBER_POSITION = 0  # number.* entity, position via set_value
+    CLIMATE_POSITION = 1  # climate.* entity with a position attribute
+    TEMPERATURE = 2  # TRV driven by high/low setpoints
+    UNSUPPORTED = 3
+
 # Platforms
 PLATFORMS: Final = ["sensor", "climate", "switch"]
 
@@ -1,7 +1,7 @@
 """DataUpdateCoordinator for the Smart Heating integration."""
 import asyncio
 import logging
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.core import HomeAssistant, Event, callback
@@ -33,10 +33,14 @@ class SmartHeatingCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             update_interval=UPDATE_INTERVAL,
+            # Only notify entities when the snapshot actually changed
+            always_update=False,
         )
         self.area_manager = area_manager
         self._unsub_state_listener = None
         self._debounce_tasks = {}  # Track debounce tasks per entity
+        self._area_data_cache = {}  # area_id -> (fingerprint, area data) of the last update
+        self._last_data = None  # Last snapshot returned to the coordinator
         _LOGGER.debug("Smart Heating coordinator initialized")
 
     async def async_setup(self) -> None:
@@ -118,18 +122,20 @@ class SmartHeatingCoordinator(DataUpdateCoordinator):
                         new_temp
                     )
                     
-                    # Update area target temperature AND set manual override flag
-                    for area in self.area_manager.get_all_areas().values():
-                        if entity_id in area.devices:
-                            _LOGGER.warning(
-                                "Area %s entering MANUAL OVERRIDE mode - app will not control temperature until re-enabled",
-                                area.name
-                            )
-                            area.target_temperature = new_temp
-                            area.manual_override = True  # Enter manual override mode
-                            # Save to storage so it persists across restarts
-                            await self.area_manager.async_save()
-                            break
+                    # Update area target temperature AND set manual override flag;
+                    # the device -> areas index avoids scanning every area
+                    area_ids = self.area_manager.get_device_areas(entity_id)
+                    area = self.area_manager.get_area(area_ids[0]) if area_ids else None
+                    if area is not None:
+                        _LOGGER.warning(
+                            "Area %s entering MANUAL OVERRIDE mode - app will not control temperature until re-enabled",
+                            area.name
+                        )
+                        area.target_temperature = new_temp
+                        area.manual_override = True  # Enter manual override mode
+                        area.mark_changed()
+                        # Save to storage so it persists across restarts
+                        self.area_manager.async_schedule_save()
                     
                     # Force immediate coordinator refresh after debounce (not rate-limited)
                     _LOGGER.debug("Forcing coordinator refresh after debounce")
@@ -171,6 +177,11 @@ class SmartHeatingCoordinator(DataUpdateCoordinator):
             )
         
         if should_update:
+            # Device activity ends any stretched steady-state control interval
+            climate_controller = self.hass.data.get(DOMAIN, {}).get("climate_controller")
+            if climate_controller is not None:
+                climate_controller.reset_steady_state()
+            
             # Trigger immediate coordinator update
             _LOGGER.debug("Triggering coordinator refresh for %s", entity_id)
             self.hass.async_create_task(self.async_request_refresh())
@@ -199,120 +210,55 @@ class SmartHeatingCoordinator(DataUpdateCoordinator):
             
             # Get all areas
             areas = self.area_manager.get_all_areas()
+            now = datetime.now()
             _LOGGER.debug("Processing %d areas for coordinator update", len(areas))
             
-            # Build data structure
+            # Build data structure; areas whose inputs are unchanged reuse
+            # their previous entry
+            get_state = self.hass.states.get
+            area_data_cache = self._area_data_cache
+            areas_data = {}
+            for area_id, area in areas.items():
+                device_states = tuple(get_state(device_id) for device_id in area.devices)
+                effective_target = area.get_effective_target_temperature(now)
+                # Settings and schedule dicts are cached by the area and replaced
+                # on change, and HA state objects are immutable, so identity
+                # checks make this comparison cheap
+                fingerprint = (
+                    area.to_api_dict(),
+                    area.devices_version,
+                    device_states,
+                    tuple(schedule.to_dict() for schedule in area.schedules.values()),
+                    area.shutdown_switches_when_idle,
+                    area.state,
+                    area.current_temperature,
+                    effective_target,
+                )
+                cached = area_data_cache.get(area_id)
+                if cached is not None and cached[0] == fingerprint:
+                    areas_data[area_id] = cached[1]
+                    continue
+                
+                area_data = self._build_area_data(area_id, area, device_states, effective_target)
+                area_data_cache[area_id] = (fingerprint, area_data)
+                areas_data[area_id] = area_data
+            
+            # Forget removed areas
+            if len(area_data_cache) > len(areas_data):
+                for area_id in area_data_cache.keys() - areas_data.keys():
+                    del area_data_cache[area_id]
+            
             data = {
                 "status": STATE_INITIALIZED,
                 "area_count": len(areas),
-                "areas": {},
+                "areas": areas_data,
             }
             
-            # Add area information with device states
-            for area_id, area in areas.items():
-                # Get device states
-                devices_data = []
-                for device_id, device_info in area.devices.items():
-                    state = self.hass.states.get(device_id)
-                    device_data = {
-                        "id": device_id,
-                        "type": device_info["type"],
-                        "state": state.state if state else "unavailable",
-                        "name": state.attributes.get("friendly_name", device_id) if state else device_id,
-                    }
-                    
-                    # Add device-specific attributes
-                    if state:
-                        if device_info["type"] == "thermostat":
-                            device_data["current_temperature"] = state.attributes.get("current_temperature")
-                            device_data["target_temperature"] = state.attributes.get("temperature")
-                            device_data["hvac_action"] = state.attributes.get("hvac_action")
-                        elif device_info["type"] == "temperature_sensor":
-                            # For temperature sensors, the state IS the temperature
-                            try:
-                                temp_value = float(state.state) if state.state not in ("unknown", "unavailable") else None
-                                if temp_value is not None:
-                                    # Check if temperature is in Fahrenheit and convert to Celsius
-                                    unit = state.attributes.get("unit_of_measurement", "°C")
-                                    if unit in ("°F", "F"):
-                                        temp_value = (temp_value - 32) * 5/9
-                                        _LOGGER.debug(
-                                            "Converted temperature sensor %s: %s°F -> %.1f°C",
-                                            device_id, state.state, temp_value
-                                        )
-                                    device_data["temperature"] = temp_value
-                                else:
-                                    device_data["temperature"] = None
-                            except (ValueError, TypeError):
-                                device_data["temperature"] = None
-                        elif device_info["type"] == "valve":
-                            # For valves (number entities), the position is in the state
-                            try:
-                                device_data["position"] = float(state.state) if state.state not in ("unknown", "unavailable") else None
-                            except (ValueError, TypeError):
-                                device_data["position"] = None
-                    
-                    devices_data.append(device_data)
-                
-                _LOGGER.debug(
-                    "Building data for area %s: manual_override=%s, target_temp=%s",
-                    area_id, getattr(area, 'manual_override', False), area.target_temperature
-                )
-                
-                data["areas"][area_id] = {
-                    "id": area_id,  # Include area ID so frontend can identify and navigate
-                    "name": area.name,
-                    "enabled": area.enabled,
-                    "state": area.state,
-                    "target_temperature": area.target_temperature,
-                    "effective_target_temperature": area.get_effective_target_temperature(),
-                    "current_temperature": area.current_temperature,
-                    "device_count": len(area.devices),
-                    "devices": devices_data,
-                    # Schedules
-                    "schedules": [s.to_dict() for s in area.schedules.values()],
-                    # Preset mode settings
-                    "preset_mode": area.preset_mode,
-                    "away_temp": area.away_temp,
-                    "eco_temp": area.eco_temp,
-                    "comfort_temp": area.comfort_temp,
-                    "home_temp": area.home_temp,
-                    "sleep_temp": area.sleep_temp,
-                    "activity_temp": area.activity_temp,
-                    # Global preset flags
-                    "use_global_away": area.use_global_away,
-                    "use_global_eco": area.use_global_eco,
-                    "use_global_comfort": area.use_global_comfort,
-                    "use_global_home": area.use_global_home,
-                    "use_global_sleep": area.use_global_sleep,
-                    "use_global_activity": area.use_global_activity,
-                    # Global presence flag
-                    "use_global_presence": area.use_global_presence,
-                    # Boost mode
-                    "boost_mode_active": area.boost_mode_active,
-                    "boost_temp": area.boost_temp,
-                    "boost_duration": area.boost_duration,
-                    # HVAC mode
-                    "hvac_mode": area.hvac_mode,
-                    # Manual override
-                    "manual_override": getattr(area, 'manual_override', False),
-                    # Hidden state (frontend-only, but persisted in backend)
-                    "hidden": getattr(area, 'hidden', False),
-                    # Switch/pump control
-                    "shutdown_switches_when_idle": getattr(area, 'shutdown_switches_when_idle', True),
-                    # Sensors
-                    "window_sensors": area.window_sensors,
-                    "presence_sensors": area.presence_sensors,
-                    # Night boost
-                    "night_boost_enabled": area.night_boost_enabled,
-                    "night_boost_offset": area.night_boost_offset,
-                    "night_boost_start_time": area.night_boost_start_time,
-                    "night_boost_end_time": area.night_boost_end_time,
-                    # Smart night boost
-                    "smart_night_boost_enabled": area.smart_night_boost_enabled,
-                    "smart_night_boost_target_time": area.smart_night_boost_target_time,
-                    "weather_entity_id": area.weather_entity_id,
-                }
+            # Hand back the previous snapshot when nothing changed
+            if data == self._last_data:
+                _LOGGER.debug("Smart Heating data unchanged: %d areas", len(areas))
+                return self._last_data
+            self._last_data = data
             
             _LOGGER.debug("Smart Heating data updated successfully: %d areas", len(areas))
             return data
@@ -320,3 +266,120 @@ class SmartHeatingCoordinator(DataUpdateCoordinator):
         except Exception as err:
             _LOGGER.error("Error updating Smart Heating data: %s", err)
             raise UpdateFailed(f"Error communicating with API: {err}") from err
+
+    def _build_area_data(
+        self, area_id: str, area, device_states: tuple, effective_target: float | None
+    ) -> dict[str, Any]:
+        """Build the coordinator data of a single area.
+        
+        Args:
+            area_id: Area identifier
+            area: Area instance
+            device_states: Current states of the area's devices, in device order
+            effective_target: Effective target temperature of the area
+        
+        Returns:
+            Area data including device states
+        """
+        # Get device states
+        devices_data = []
+        for (device_id, device_info), state in zip(area.devices.items(), device_states):
+            device_data = {
+                "id": device_id,
+                "type": device_info["type"],
+                "state": state.state if state else "unavailable",
+                "name": state.attributes.get("friendly_name", device_id) if state else device_id,
+            }
+            
+            # Add device-specific attributes
+            if state:
+                if device_info["type"] == "thermostat":
+                    device_data["current_temperature"] = state.attributes.get("current_temperature")
+                    device_data["target_temperature"] = state.attributes.get("temperature")
+                    device_data["hvac_action"] = state.attributes.get("hvac_action")
+                elif device_info["type"] == "temperature_sensor":
+                    # For temperature sensors, the state IS the temperature
+                    try:
+                        temp_value = float(state.state) if state.state not in ("unknown", "unavailable") else None
+                        if temp_value is not None:
+                            # Check if temperature is in Fahrenheit and convert to Celsius
+                            unit = state.attributes.get("unit_of_measurement", "°C")
+                            if unit in ("°F", "F"):
+                                temp_value = (temp_value - 32) * 5/9
+                                _LOGGER.debug(
+                                    "Converted temperature sensor %s: %s°F -> %.1f°C",
+                                    device_id, state.state, temp_value
+                                )
+                            device_data["temperature"] = temp_value
+                        else:
+                            device_data["temperature"] = None
+                    except (ValueError, TypeError):
+                        device_data["temperature"] = None
+                elif device_info["type"] == "valve":
+                    # For valves (number entities), the position is in the state
+                    try:
+                        device_data["position"] = float(state.state) if state.state not in ("unknown", "unavailable") else None
+                    except (ValueError, TypeError):
+                        device_data["position"] = None
+            
+            devices_data.append(device_data)
+        
+        _LOGGER.debug(
+            "Building data for area %s: manual_override=%s, target_temp=%s",
+            area_id, getattr(area, 'manual_override', False), area.target_temperature
+        )
+        
+        return {
+            "id": area_id,  # Include area ID so frontend can identify and navigate
+            "name": area.name,
+            "enabled": area.enabled,
+            "state": area.state,
+            "target_temperature": area.target_temperature,
+            "effective_target_temperature": effective_target,
+            "current_temperature": area.current_temperature,
+            "device_count": len(area.devices),
+            "devices": devices_data,
+            # Schedules
+            "schedules": [s.to_dict() for s in area.schedules.values()],
+            # Preset mode settings
+            "preset_mode": area.preset_mode,
+            "away_temp": area.away_temp,
+            "eco_temp": area.eco_temp,
+            "comfort_temp": area.comfort_temp,
+            "home_temp": area.home_temp,
+            "sleep_temp": area.sleep_temp,
+            "activity_temp": area.activity_temp,
+            # Global preset flags
+            "use_global_away": area.use_global_away,
+            "use_global_eco": area.use_global_eco,
+            "use_global_comfort": area.use_global_comfort,
+            "use_global_home": area.use_global_home,
+            "use_global_sleep": area.use_global_sleep,
+            "use_global_activity": area.use_global_activity,
+            # Global presence flag
+            "use_global_presence": area.use_global_presence,
+            # Boost mode
+            "boost_mode_active": area.boost_mode_active,
+            "boost_temp": area.boost_temp,
+            "boost_duration": area.boost_duration,
+            # HVAC mode
+            "hvac_mode": area.hvac_mode,
+            # Manual override
+            "manual_override": getattr(area, 'manual_override', False),
+            # Hidden state (frontend-only, but persisted in backend)
+            "hidden": getattr(area, 'hidden', False),
+            # Switch/pump control
+            "shutdown_switches_when_idle": getattr(area, 'shutdown_switches_when_idle', True),
+            # Sensors
+            "window_sensors": list(area.window_sensors),
+            "presence_sensors": list(area.presence_sensors),
+            # Night boost
+            "night_boost_enabled": area.night_boost_enabled,
+            "night_boost_offset": area.night_boost_offset,
+            "night_boost_start_time": area.night_boost_start_time,
+            "night_boost_end_time": area.night_boost_end_time,
+            # Smart night boost
+            "smart_night_boost_enabled": area.smart_night_boost_enabled,
+            "smart_night_boost_target_time": area.smart_night_boost_target_time,
+            "weather_entity_id": area.weather_entity_id,
+        }
@@ -1,9 +1,11 @@
 """History tracking for Smart Heating."""
 import logging
+import time
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.event import async_track_time_interval
 
@@ -14,6 +16,19 @@ _LOGGER = logging.getLogger(__name__)
 STORAGE_VERSION = 1
 STORAGE_KEY = "smart_heating_history"
 CLEANUP_INTERVAL = timedelta(hours=1)  # Run cleanup every hour
+SAVE_DELAY = 60  # Seconds to buffer recorded entries before writing them
+
+
+def _is_sorted(timestamps: list[float]) -> bool:
+    """Check whether timestamps are in ascending order.
+    
+    Args:
+        timestamps: Epoch timestamps
+        
+    Returns:
+        True if every timestamp is at least the previous one
+    """
+    return all(a <= b for a, b in zip(timestamps, timestamps[1:]))
 
 
 class HistoryTracker:
@@ -28,6 +43,13 @@ class HistoryTracker:
         self.hass = hass
         self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
         self._history: dict[str, list[dict[str, Any]]] = {}
+        # Epoch seconds of each area's entries, kept parallel to self._history.
+        # Unlike the local timestamp strings these don't go backwards at a DST
+        # change, so range lookups can bisect them.
+        self._timestamps: dict[str, list[float]] = {}
+        # Areas whose entries are out of order because the clock was stepped
+        # back; these are filtered linearly instead of bisected
+        self._unordered: set[str] = set()
         self._retention_days: int = DEFAULT_HISTORY_RETENTION_DAYS
         self._cleanup_unsub = None
 
@@ -39,6 +61,17 @@ class HistoryTracker:
         if data is not None:
             if "history" in data:
                 self._history = data["history"]
+                self._timestamps = {
+                    area_id: [
+                        datetime.fromisoformat(entry["timestamp"]).timestamp()
+                        for entry in entries
+                    ]
+                    for area_id, entries in self._history.items()
+                }
+                self._unordered = {
+                    area_id for area_id, timestamps in self._timestamps.items()
+                    if not _is_sorted(timestamps)
+                }
             if "retention_days" in data:
                 self._retention_days = data["retention_days"]
             
@@ -61,11 +94,28 @@ class HistoryTracker:
     async def async_save(self) -> None:
         """Save history to storage."""
         _LOGGER.debug("Saving history to storage")
-        data = {
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule a delayed save, coalescing recordings into one write.
+        
+        Entries stay buffered in memory until the write; Home Assistant
+        flushes a pending write on shutdown.
+        """
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Build the data to persist.
+        
+        Returns:
+            Serializable history and retention setting
+        """
+        return {
             "history": self._history,
             "retention_days": self._retention_days
         }
-        await self._store.async_save(data)
     
     async def async_unload(self) -> None:
         """Unload and cleanup."""
@@ -76,17 +126,24 @@ class HistoryTracker:
 
     async def _async_cleanup_old_entries(self) -> None:
         """Remove entries older than retention period."""
-        cutoff = datetime.now() - timedelta(days=self._retention_days)
-        cutoff_iso = cutoff.isoformat()
+        cutoff = time.time() - self._retention_days * 86400
         
         total_removed = 0
-        for area_id in list(self._history.keys()):
-            original_count = len(self._history[area_id])
-            self._history[area_id] = [
-                entry for entry in self._history[area_id]
-                if entry["timestamp"] > cutoff_iso
-            ]
-            removed = original_count - len(self._history[area_id])
+        for area_id, timestamps in self._timestamps.items():
+            entries = self._history[area_id]
+            if area_id in self._unordered:
+                keep = [i for i, timestamp in enumerate(timestamps) if timestamp > cutoff]
+                removed = len(timestamps) - len(keep)
+                if removed > 0:
+                    entries[:] = [entries[i] for i in keep]
+                    timestamps[:] = [timestamps[i] for i in keep]
+                if _is_sorted(timestamps):
+                    self._unordered.discard(area_id)
+            else:
+                removed = bisect_right(timestamps, cutoff)
+                if removed > 0:
+                    del entries[:removed]
+                    del timestamps[:removed]
             total_removed += removed
             if removed > 0:
                 _LOGGER.debug(
@@ -123,19 +180,30 @@ class HistoryTracker:
         """
         if area_id not in self._history:
             self._history[area_id] = []
+            self._timestamps[area_id] = []
         
+        now = time.time()
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.fromtimestamp(now).isoformat(),
             "current_temperature": current_temp,
             "target_temperature": target_temp,
             "state": state,
         }
         
-        self._history[area_id].append(entry)
+        entries = self._history[area_id]
+        timestamps = self._timestamps[area_id]
+        if timestamps and now < timestamps[-1]:
+            _LOGGER.debug("Clock went backwards, history of %s is no longer ordered", area_id)
+            self._unordered.add(area_id)
+        entries.append(entry)
+        timestamps.append(now)
         
         # Limit to last 1000 entries per area
-        if len(self._history[area_id]) > 1000:
-            self._history[area_id] = self._history[area_id][-1000:]
+        if len(entries) > 1000:
+            del entries[:-1000]
+            del timestamps[:-1000]
+            if area_id in self._unordered and _is_sorted(timestamps):
+                self._unordered.discard(area_id)
         
         _LOGGER.debug(
             "Recorded temperature for %s: %.1f°C (target: %.1f°C, state: %s)",
@@ -163,23 +231,31 @@ class HistoryTracker:
         if area_id not in self._history:
             return []
         
+        entries = self._history[area_id]
+        timestamps = self._timestamps[area_id]
+        
         # Determine time range
         if start_time and end_time:
             # Custom time range
-            start_iso = start_time.isoformat()
-            end_iso = end_time.isoformat()
-            return [
-                entry for entry in self._history[area_id]
-                if start_iso <= entry["timestamp"] <= end_iso
-            ]
+            start_ts = start_time.timestamp()
+            end_ts = end_time.timestamp()
+            if area_id in self._unordered:
+                return [
+                    entry for entry, timestamp in zip(entries, timestamps)
+                    if start_ts <= timestamp <= end_ts
+                ]
+            start = bisect_left(timestamps, start_ts)
+            end = bisect_right(timestamps, end_ts)
+            return entries[start:end]
         elif hours:
             # Hours-based query
-            cutoff = datetime.now() - timedelta(hours=hours)
-            cutoff_iso = cutoff.isoformat()
-            return [
-                entry for entry in self._history[area_id]
-                if entry["timestamp"] > cutoff_iso
-            ]
+            cutoff = time.time() - hours * 3600
+            if area_id in self._unordered:
+                return [
+                    entry for entry, timestamp in zip(entries, timestamps)
+                    if timestamp > cutoff
+                ]
+            return entries[bisect_right(timestamps, cutoff):]
         else:
             # Return all available history (within retention period)
             return self._history[area_id]
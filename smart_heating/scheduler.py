@@ -1,10 +1,13 @@
 """Schedule executor for Zone Heater Manager."""
+import asyncio
 import logging
+from collections.abc import Awaitable, Callable
 from datetime import datetime, time
 from typing import Optional
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import dt as dt_util
 from datetime import timedelta
 
 from .area_manager import AreaManager
@@ -13,15 +16,31 @@ _LOGGER = logging.getLogger(__name__)
 
 SCHEDULE_CHECK_INTERVAL = timedelta(minutes=1)  # Check schedules every minute
 
-DAYS_OF_WEEK = {
-    0: "Monday",
-    1: "Tuesday", 
-    2: "Wednesday",
-    3: "Thursday",
-    4: "Friday",
-    5: "Saturday",
-    6: "Sunday",
-}
+# Longest time schedule checks are skipped while no schedule boundary is due
+SCHEDULE_CHECK_MAX_INTERVAL = timedelta(hours=1)
+
+# Base tick of the executor's single timer. Schedule checks and registered
+# periodic jobs run on multiples of this tick.
+EXECUTOR_TICK_INTERVAL = timedelta(seconds=30)
+
+# Name of the HassJob HA builds once for the executor tick
+_EXECUTOR_JOB_NAME = "smart_heating_executor_tick"
+
+# Day names indexed by datetime.weekday()
+DAYS_OF_WEEK = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_DAY_INDEX = {day: index for index, day in enumerate(DAYS_OF_WEEK)}
+
+
+def _log_periodic_job_error(task: asyncio.Task) -> None:
+    """Log the exception of a finished periodic job, if any.
+    
+    Args:
+        task: Completed periodic job task
+    """
+    if task.cancelled():
+        return
+    if (err := task.exception()) is not None:
+        _LOGGER.error("Error in periodic job: %s", err, exc_info=err)
 
 
 class ScheduleExecutor:
@@ -40,8 +59,28 @@ class ScheduleExecutor:
         self.learning_engine = learning_engine
         self._unsub_interval = None
         self._last_applied_schedule = {}  # Track last applied schedule per area
+        self._periodic_jobs = []  # (action, every_n_ticks) driven by the executor timer
+        self._tick_count = 0
+        self._next_schedule_check = None  # Next schedule boundary (or safety recheck)
+        self._schedule_check_key = None  # Schedule inputs the next check was computed from
+        self._schedule_index = {}  # area_id -> (area, schedules_version, index), see _get_schedule_index
         _LOGGER.info("Schedule executor initialized")
 
+    def add_periodic(
+        self, action: Callable[[], Awaitable[None]], interval: timedelta
+    ) -> None:
+        """Run an additional job from the executor's timer.
+        
+        Sharing the executor timer avoids a second periodic handle on the
+        event loop. The interval is rounded to whole executor ticks.
+        
+        Args:
+            action: Coroutine function to call periodically
+            interval: How often to call it
+        """
+        ticks = max(1, round(interval / EXECUTOR_TICK_INTERVAL))
+        self._periodic_jobs.append((action, ticks))
+
     async def async_start(self) -> None:
         """Start the schedule executor."""
         _LOGGER.info("Starting schedule executor")
@@ -49,11 +88,13 @@ class ScheduleExecutor:
         # Run immediately on start
         await self._async_check_schedules()
         
-        # Set up recurring check
+        # Set up recurring tick for schedule checks and periodic jobs
         self._unsub_interval = async_track_time_interval(
             self.hass,
-            self._async_check_schedules,
-            SCHEDULE_CHECK_INTERVAL,
+            self._async_tick,
+            EXECUTOR_TICK_INTERVAL,
+            name=_EXECUTOR_JOB_NAME,
+            cancel_on_shutdown=True,
         )
         _LOGGER.info("Schedule executor started, checking every %s", SCHEDULE_CHECK_INTERVAL)
 
@@ -64,19 +105,121 @@ class ScheduleExecutor:
             self._unsub_interval = None
         _LOGGER.info("Schedule executor stopped")
 
+    async def _async_tick(self, now: datetime) -> None:
+        """Run due schedule checks and periodic jobs.
+        
+        Args:
+            now: Current datetime supplied by the timer
+        """
+        self._tick_count += 1
+        
+        # Dispatched first so a failing schedule check can't hold up climate control
+        for action, ticks in self._periodic_jobs:
+            if self._tick_count % ticks == 0:
+                task = self.hass.async_create_task(action())
+                task.add_done_callback(_log_periodic_job_error)
+        
+        if (
+            self._tick_count % round(SCHEDULE_CHECK_INTERVAL / EXECUTOR_TICK_INTERVAL) == 0
+            and self._schedule_check_due(now)
+        ):
+            try:
+                await self._async_check_schedules(now)
+            except Exception:
+                _LOGGER.exception("Error checking schedules")
+
+    def _get_schedule_check_key(self) -> tuple:
+        """Get a snapshot of everything that decides which schedules are active.
+        
+        Returns:
+            Comparable key of areas, their enabled flag and schedule versions
+        """
+        return tuple(
+            (area_id, area, area.enabled, area.schedules_version)
+            for area_id, area in self.area_manager.get_all_areas().items()
+        )
+
+    def _schedule_check_due(self, now: datetime) -> bool:
+        """Check whether the schedules need to be evaluated at this tick.
+        
+        The active schedule can only change at a schedule boundary, so checks
+        are skipped until the next one unless schedules or areas changed.
+        Smart night boost predictions depend on the current temperature and
+        are still evaluated every minute.
+        
+        Args:
+            now: Current datetime
+            
+        Returns:
+            True if _async_check_schedules should run
+        """
+        if self.learning_engine and any(
+            area.enabled and area.smart_night_boost_enabled
+            for area in self.area_manager.get_all_areas().values()
+        ):
+            return True
+        if self._next_schedule_check is None or now >= self._next_schedule_check:
+            return True
+        return self._get_schedule_check_key() != self._schedule_check_key
+
+    def _compute_next_transition(self, now: datetime) -> datetime:
+        """Compute when the next schedule starts or ends.
+        
+        Args:
+            now: Current datetime
+            
+        Returns:
+            Time of the nearest future schedule boundary, at most
+            SCHEDULE_CHECK_MAX_INTERVAL away
+        """
+        week_minutes = 7 * 1440
+        now_minute = now.weekday() * 1440 + now.hour * 60 + now.minute
+        nearest = None
+        for area in self.area_manager.get_all_areas().values():
+            if not area.enabled:
+                continue
+            for schedule in area.schedules.values():
+                try:
+                    day_start = _DAY_INDEX[schedule.day] * 1440
+                    start_time = time.fromisoformat(schedule.start_time)
+                    end_time = time.fromisoformat(schedule.end_time)
+                except (KeyError, TypeError, ValueError):
+                    continue
+                start = day_start + start_time.hour * 60 + start_time.minute
+                end = day_start + end_time.hour * 60 + end_time.minute
+                if end_time < start_time:
+                    # Crosses midnight, ends the next day
+                    end += 1440
+                for boundary in (start, end):
+                    # Minutes until the boundary's next occurrence (a weekly cycle)
+                    delta = (boundary - now_minute) % week_minutes or week_minutes
+                    if nearest is None or delta < nearest:
+                        nearest = delta
+        
+        max_check = now + SCHEDULE_CHECK_MAX_INTERVAL
+        if nearest is None:
+            return max_check
+        boundary_time = now.replace(second=0, microsecond=0) + timedelta(minutes=nearest)
+        return min(boundary_time, max_check)
+
     async def _async_check_schedules(self, now: Optional[datetime] = None) -> None:
         """Check all area schedules and apply temperatures if needed.
         
         Also handles smart night boost by predicting heating start times.
         
         Args:
-            now: Current datetime (for testing, otherwise uses current time)
+            now: Current datetime, supplied by the executor timer; only the
+                initial check on start leaves it out
         """
         if now is None:
-            now = datetime.now()
+            now = dt_util.now()
+        else:
+            # The timer passes UTC, schedules are defined in local time
+            now = dt_util.as_local(now)
             
         current_time = now.time()
-        current_day = DAYS_OF_WEEK[now.weekday()]
+        weekday = now.weekday()
+        current_day = DAYS_OF_WEEK[weekday]
         
         _LOGGER.debug(
             "Checking schedules for %s at %s",
@@ -85,6 +228,7 @@ class ScheduleExecutor:
         )
         
         areas = self.area_manager.get_all_areas()
+        pending = []  # (area_id, area, schedule, schedule_key) to apply
         
         for area_id, area in areas.items():
             if not area.enabled:
@@ -100,8 +244,8 @@ class ScheduleExecutor:
                 
             # Find active schedule for current day/time
             active_schedule = self._find_active_schedule(
-                area.schedules,
-                current_day,
+                self._get_schedule_index(area_id, area),
+                weekday,
                 current_time,
             )
             
@@ -111,8 +255,7 @@ class ScheduleExecutor:
                 # Only apply if this schedule hasn't been applied yet
                 # (to avoid setting temperature every minute)
                 if self._last_applied_schedule.get(area_id) != schedule_key:
-                    await self._apply_schedule(area, active_schedule)
-                    self._last_applied_schedule[area_id] = schedule_key
+                    pending.append((area_id, area, active_schedule, schedule_key))
                     
             else:
                 # No active schedule, clear the tracking
@@ -124,60 +267,114 @@ class ScheduleExecutor:
                         current_day,
                         current_time.strftime("%H:%M"),
                     )
+        
+        # Areas transitioning at the same boundary are applied concurrently
+        if pending:
+            results = await asyncio.gather(
+                *(self._apply_schedule(area, schedule) for _, area, schedule, _ in pending),
+                return_exceptions=True,
+            )
+            for (area_id, _, _, schedule_key), result in zip(pending, results):
+                if isinstance(result, Exception):
+                    _LOGGER.error("Failed to apply schedule for area %s: %s", area_id, result)
+                else:
+                    self._last_applied_schedule[area_id] = schedule_key
+            
+            # One save for all applied schedules
+            await self.area_manager.async_save()
+        
+        self._schedule_check_key = self._get_schedule_check_key()
+        self._next_schedule_check = self._compute_next_transition(now)
+        _LOGGER.debug("Next schedule check at %s", self._next_schedule_check)
+
+    def _get_schedule_index(
+        self, area_id: str, area
+    ) -> list[tuple[list[tuple[int, int, object]], list[tuple[int, object]]]]:
+        """Get the parsed schedules of an area grouped by weekday.
+        
+        The index is rebuilt only when the area's schedules change.
+        
+        Args:
+            area_id: Area identifier
+            area: Area instance
+            
+        Returns:
+            Per weekday (Monday = 0): (schedules starting that day as
+            (start, end, schedule) sorted by start time, schedules crossing
+            into the next day as (end, schedule)); times are minutes of the day
+        """
+        cached = self._schedule_index.get(area_id)
+        if cached is not None and cached[0] is area and cached[1] == area.schedules_version:
+            return cached[2]
+        
+        index = [([], []) for _ in DAYS_OF_WEEK]
+        for schedule in area.schedules.values():
+            weekday = _DAY_INDEX.get(schedule.day)
+            if weekday is None:
+                continue
+            try:
+                start_time = time.fromisoformat(schedule.start_time)
+                end_time = time.fromisoformat(schedule.end_time)
+            except (TypeError, ValueError):
+                _LOGGER.warning(
+                    "Skipping schedule %s in area %s: invalid time %s-%s",
+                    schedule.schedule_id, area_id, schedule.start_time, schedule.end_time
+                )
+                continue
+            start = start_time.hour * 60 + start_time.minute
+            end = end_time.hour * 60 + end_time.minute
+            starting, overnight = index[weekday]
+            starting.append((start, end, schedule))
+            if start > end:
+                overnight.append((end, schedule))
+        for starting, _overnight in index:
+            starting.sort(key=lambda entry: entry[0])
+        
+        self._schedule_index[area_id] = (area, area.schedules_version, index)
+        return index
 
     def _find_active_schedule(
         self,
-        schedules: list[dict],
-        current_day: str,
+        schedule_index: list[tuple[list[tuple[int, int, object]], list[tuple[int, object]]]],
+        weekday: int,
         current_time: time,
-    ) -> Optional[dict]:
+    ) -> Optional[object]:
         """Find the active schedule for the given day and time.
         
         Handles schedules that cross midnight (e.g., Saturday 22:00 - Sunday 07:00).
         
         Args:
-            schedules: List of schedule entries
-            current_day: Current day name (e.g., "Monday")
+            schedule_index: Parsed schedules from _get_schedule_index
+            weekday: Current weekday (Monday = 0)
             current_time: Current time
             
         Returns:
             Active schedule entry or None
         """
-        # Get previous day name for cross-midnight check
-        day_order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-        current_day_idx = day_order.index(current_day)
-        previous_day = day_order[(current_day_idx - 1) % 7]
+        current_minute = current_time.hour * 60 + current_time.minute
         
         # Check schedules for current day
-        for schedule in schedules.values():
-            if schedule.day == current_day:
-                # Parse schedule times
-                start_time = time.fromisoformat(schedule.start_time)
-                end_time = time.fromisoformat(schedule.end_time)
-                
-                # Check if current time is within schedule window
-                # Handle schedules that cross midnight
-                if start_time <= end_time:
-                    # Normal case: 08:00 - 22:00
-                    if start_time <= current_time < end_time:
-                        return schedule
-                else:
-                    # Crosses midnight: 22:00 - 06:00
-                    # Only match if we're in the late period (>= start_time)
-                    if current_time >= start_time:
-                        return schedule
+        for start, end, schedule in schedule_index[weekday][0]:
+            if start > current_minute:
+                # Sorted by start time, so no later entry has started yet
+                break
+            
+            # Check if current time is within schedule window
+            # Handle schedules that cross midnight
+            if start <= end:
+                # Normal case: 08:00 - 22:00
+                if current_minute < end:
+                    return schedule
+            else:
+                # Crosses midnight: 22:00 - 06:00
+                # Only match if we're in the late period (>= start_time)
+                return schedule
         
         # Check if a schedule from the previous day extends into today
-        for schedule in schedules.values():
-            if schedule.day == previous_day:
-                start_time = time.fromisoformat(schedule.start_time)
-                end_time = time.fromisoformat(schedule.end_time)
-                
-                # Only check if schedule crosses midnight
-                if start_time > end_time:
-                    # Check if we're in the early period (< end_time)
-                    if current_time < end_time:
-                        return schedule
+        for end, schedule in schedule_index[weekday - 1][1]:
+            # Check if we're in the early period (< end_time)
+            if current_minute < end:
+                return schedule
                     
         return None
 
@@ -395,6 +592,8 @@ class ScheduleExecutor:
     async def _apply_schedule(self, area, schedule) -> None:
         """Apply a schedule's temperature or preset mode to an area.
         
+        The caller saves the area manager once after applying all due schedules.
+        
         Args:
             area: Zone object
             schedule: Schedule object
@@ -427,7 +626,7 @@ class ScheduleExecutor:
             
             # Set preset mode
             area.preset_mode = schedule.preset_mode
-            await self.area_manager.async_save()
+            area.mark_changed()
             
             _LOGGER.debug(
                 "Set preset mode for area %s to %s",
@@ -460,10 +659,12 @@ class ScheduleExecutor:
             
             # Update area target temperature
             area.target_temperature = target_temp
-            await self.area_manager.async_save()
+            area.mark_changed()
             
             # Update the climate entity if it exists
-            # Call the climate service to set temperature
+            # Call the climate service to set temperature; not waiting for it
+            # keeps bulk schedule transitions within one tick (a missing
+            # service is still reported immediately)
             try:
                 await self.hass.services.async_call(
                     "climate",
@@ -472,7 +673,7 @@ class ScheduleExecutor:
                         "entity_id": climate_entity_id,
                         "temperature": target_temp,
                     },
-                    blocking=True,
+                    blocking=False,
                 )
                 _LOGGER.debug(
                     "Set temperature for %s to %s°C via climate service",
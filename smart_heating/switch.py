@@ -92,8 +92,8 @@ class AreaSwitch(CoordinatorEntity, SwitchEntity):
         
         self.coordinator.area_manager.enable_area(self._area.area_id)
         
-        # Save to storage
-        await self.coordinator.area_manager.async_save()
+        # Save to storage (delayed, so bursts of changes share one write)
+        self.coordinator.area_manager.async_schedule_save()
         
         # Request coordinator refresh
         await self.coordinator.async_request_refresh()
@@ -108,8 +108,8 @@ class AreaSwitch(CoordinatorEntity, SwitchEntity):
         
         self.coordinator.area_manager.disable_area(self._area.area_id)
         
-        # Save to storage
-        await self.coordinator.area_manager.async_save()
+        # Save to storage (delayed, so bursts of changes share one write)
+        self.coordinator.area_manager.async_schedule_save()
         
         # Request coordinator refresh
         await self.coordinator.async_request_refresh()